@@ -0,0 +1,39 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+
+from magnopy import solve_via_colpa
+
+
+class SolveViaColpa:
+    params = [2, 16, 128]
+    param_names = ["M"]
+
+    def setup(self, M):
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(2 * M, 2 * M)) + 1j * rng.normal(size=(2 * M, 2 * M))
+        # Positive definite grand dynamical matrix
+        self.D = X @ X.conj().T + 2 * M * np.eye(2 * M)
+
+    def time_solve_via_colpa(self, M):
+        solve_via_colpa(self.D)
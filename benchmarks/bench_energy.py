@@ -0,0 +1,64 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+
+from magnopy import Energy, make_supercell
+from magnopy.examples import cubic_ferro_nn, full_ham
+
+
+class EnergyMethods:
+    params = ([1, 64, 1000], [(0, 0, 1)])
+    param_names = ["M", "h"]
+
+    def setup(self, M, h):
+        n = round(M ** (1 / 3))
+        spinham = make_supercell(cubic_ferro_nn(S=1.5), supercell=(n, n, n))
+        self.energy = Energy(spinham=spinham)
+        self.spin_directions = np.random.default_rng(0).normal(size=(spinham.M, 3))
+
+    def time_E_0(self, M, h):
+        self.energy.E_0(self.spin_directions, h=h)
+
+    def time_gradient(self, M, h):
+        self.energy.gradient(self.spin_directions, h=h)
+
+    def time_torque(self, M, h):
+        self.energy.torque(self.spin_directions, h=h)
+
+
+class EnergyFullHamiltonian:
+    # Hamiltonian with all terms up to four spins
+    params = [1, 8, 27]
+    param_names = ["supercell_size"]
+
+    def setup(self, supercell_size):
+        n = round(supercell_size ** (1 / 3))
+        spinham = make_supercell(full_ham(), supercell=(n, n, n))
+        self.energy = Energy(spinham=spinham)
+        self.spin_directions = np.random.default_rng(0).normal(size=(spinham.M, 3))
+
+    def time_E_0(self, supercell_size):
+        self.energy.E_0(self.spin_directions)
+
+    def time_gradient(self, supercell_size):
+        self.energy.gradient(self.spin_directions)
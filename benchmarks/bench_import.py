@@ -0,0 +1,71 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+# Benchmarks of the start up time. Each one is executed in a fresh interpreter, see
+# "timeraw" benchmarks in the documentation of asv.
+
+import subprocess
+import sys
+
+# Modules, that should not be loaded by "import magnopy"
+HEAVY_MODULES = [
+    "magnopy.io",
+    "magnopy.scenarios",
+    "magnopy.examples",
+    "magnopy._plotly_engine",
+    "matplotlib",
+    "plotly",
+    "scipy",
+]
+
+
+def timeraw_import_magnopy():
+    return "import magnopy"
+
+
+def timeraw_import_magnopy_io():
+    return "import magnopy.io"
+
+
+def timeraw_import_magnopy_scenarios():
+    return "import magnopy.scenarios"
+
+
+def timeraw_cli_version():
+    return """
+    import sys
+    from magnopy.__main__ import main
+
+    sys.argv = ["magnopy", "--version"]
+    main()
+    """
+
+
+def track_heavy_modules_on_import():
+    code = (
+        "import sys, magnopy; "
+        f"print(sum(name in sys.modules for name in {HEAVY_MODULES!r}))"
+    )
+    return int(subprocess.check_output([sys.executable, "-c", code]))
+
+
+track_heavy_modules_on_import.unit = "modules"
@@ -0,0 +1,115 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import os
+import tempfile
+
+import numpy as np
+
+from magnopy.io import load_tb2j
+
+MINOR_SEP = "-" * 88
+MAJOR_SEP = "=" * 90
+
+
+def _write_tb2j(filename, n_bonds):
+    # Synthetic output of TB2J with two magnetic atoms in the cubic cell
+    rng = np.random.default_rng(0)
+    cell = 3 * np.eye(3)
+    names = ["Fe1", "Fe2"]
+    positions = np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]])
+
+    lines = [
+        MAJOR_SEP,
+        "TB2J version: 0.0.0",
+        MAJOR_SEP,
+        "Cell (Angstrom):",
+        *[f"  {a[0]:10.6f} {a[1]:10.6f} {a[2]:10.6f}" for a in cell],
+        "",
+        MAJOR_SEP,
+        "Atoms:",
+        "(Note: charge and magmoms only count the wannier functions.)",
+        "  Atom_number     x     y     z     w_charge     M(x)     M(y)     M(z)",
+    ]
+    for name, position in zip(names, positions @ cell):
+        lines.append(
+            f"  {name:<6} {position[0]:10.6f} {position[1]:10.6f} {position[2]:10.6f}"
+            "   1.0000   0.0000   0.0000   3.0000"
+        )
+    lines.extend(["Total  0.0  0.0  0.0  1.0  0.0  0.0  1.0", "", MAJOR_SEP])
+    lines.extend(
+        [
+            "Exchange:",
+            "    i      j          R        J_iso(meV)          vector          distance(A)",
+        ]
+    )
+
+    # Unique bonds: all pairs of atoms for the unit cells within the cube
+    size = int(np.ceil((n_bonds / 4) ** (1 / 3) / 2)) + 1
+    cells = np.array(
+        [
+            (i, j, k)
+            for i in range(-size, size + 1)
+            for j in range(-size, size + 1)
+            for k in range(-size, size + 1)
+            if (i, j, k) != (0, 0, 0)
+        ]
+    )
+    bonds = [
+        (alpha, beta, nu) for nu in cells for alpha in range(2) for beta in range(2)
+    ][:n_bonds]
+
+    for alpha, beta, nu in bonds:
+        vector = (positions[beta] - positions[alpha] + nu) @ cell
+        iso, dmi, aniso = rng.normal(), rng.normal(size=3), rng.normal(size=(3, 3))
+        lines.extend(
+            [
+                MINOR_SEP,
+                f"   {names[alpha]}   {names[beta]}   ({nu[0]:3d}, {nu[1]:3d}, {nu[2]:3d}) "
+                f"({vector[0]:8.3f}, {vector[1]:8.3f}, {vector[2]:8.3f}) "
+                f"{np.linalg.norm(vector):8.3f}",
+                f"J_iso: {iso:10.4f}",
+                f"[Testing!] DMI: ({dmi[0]:.4f} {dmi[1]:.4f} {dmi[2]:.4f})",
+                "[Testing!]J_ani:",
+                *[f"[{a[0]:10.4f} {a[1]:10.4f} {a[2]:10.4f}]" for a in aniso],
+                "",
+            ]
+        )
+
+    with open(filename, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+class LoadTB2J:
+    params = [100, 1000, 10000]
+    param_names = ["bonds"]
+
+    def setup(self, bonds):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "exchange.out")
+        _write_tb2j(self.filename, n_bonds=bonds)
+
+    def teardown(self, bonds):
+        self.tmp_dir.cleanup()
+
+    def time_load_tb2j(self, bonds):
+        load_tb2j(self.filename, spin_values=[1.5, 1.5])
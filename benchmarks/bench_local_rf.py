@@ -0,0 +1,54 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+from timeit import timeit
+
+import numpy as np
+
+from magnopy import span_local_rf, span_local_rfs
+
+
+class SpanLocalRFs:
+    params = ([10, 1000, 100000], [False, True])
+    param_names = ["M", "hybridize"]
+
+    def setup(self, M, hybridize):
+        rng = np.random.default_rng(0)
+        self.directions = rng.normal(size=(M, 3))
+        # Special cases
+        self.directions[::10] = [0, 0, 1]
+        self.directions[5::10] = [0, 0, -1]
+
+    def time_span_local_rfs(self, M, hybridize):
+        span_local_rfs(self.directions, hybridize=hybridize)
+
+
+def track_speedup_over_loop():
+    directions = np.random.default_rng(0).normal(size=(1000, 3))
+
+    loop = timeit(lambda: [span_local_rf(d) for d in directions], number=1)
+    vectorized = timeit(lambda: span_local_rfs(directions), number=10) / 10
+
+    return loop / vectorized
+
+
+track_speedup_over_loop.unit = "times"
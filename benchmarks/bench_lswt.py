@@ -0,0 +1,81 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+
+from magnopy import LSWT, make_supercell
+from magnopy.examples import cubic_ferro_nn, ivuzjo
+
+
+def _ferromagnet(M):
+    # Supercell of the cubic ferromagnet with M = n^3 spins
+    n = round(M ** (1 / 3))
+    return make_supercell(cubic_ferro_nn(S=1.5), supercell=(n, n, n))
+
+
+def _z_directions(spinham):
+    return np.tile([0.0, 0.0, 1.0], (spinham.M, 1))
+
+
+class LSWTInit:
+    params = [1, 64, 512]
+    param_names = ["M"]
+
+    def setup(self, M):
+        self.spinham = _ferromagnet(M)
+        self.spin_directions = _z_directions(self.spinham)
+
+    def time_init(self, M):
+        LSWT(spinham=self.spinham, spin_directions=self.spin_directions)
+
+
+class LSWTDiagonalize:
+    params = ([1, 8, 64], [1, 20])
+    param_names = ["M", "N"]
+
+    def setup(self, M, N):
+        spinham = _ferromagnet(M)
+        self.lswt = LSWT(spinham=spinham, spin_directions=_z_directions(spinham))
+        self.kpoints = np.random.default_rng(0).uniform(size=(N, 3))
+
+    def time_diagonalize(self, M, N):
+        for k in self.kpoints:
+            self.lswt.diagonalize(k, relative=True)
+
+
+class Examples:
+    # full_ham is used in bench_energy, its on-site parameters are not supported by LSWT
+    params = ["cubic_ferro_nn", "ivuzjo"]
+    param_names = ["model"]
+
+    def setup(self, model):
+        self.spinham = dict(cubic_ferro_nn=cubic_ferro_nn, ivuzjo=ivuzjo)[model]()
+        self.spin_directions = _z_directions(self.spinham)
+        self.kpoints = np.random.default_rng(0).uniform(size=(100, 3))
+
+    def time_init(self, model):
+        LSWT(spinham=self.spinham, spin_directions=self.spin_directions)
+
+    def time_diagonalize(self, model):
+        lswt = LSWT(spinham=self.spinham, spin_directions=self.spin_directions)
+        for k in self.kpoints:
+            lswt.diagonalize(k, relative=True)
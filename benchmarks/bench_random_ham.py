@@ -0,0 +1,99 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import os
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+from magnopy import Energy, make_supercell
+from magnopy.examples import random_ham
+from magnopy.io import load_spinham, save_spinham
+
+ALL_TERMS = ["1", "21", "22", "31", "32", "33", "41", "421", "422", "43", "44"]
+
+
+class RandomHamiltonian:
+    # About 10^3, 10^4, 10^5 and 10^6 bonds
+    params = [10, 30, 100, 550]
+    param_names = ["n_sublattices"]
+
+    def time_random_ham(self, n_sublattices):
+        random_ham(n_sublattices=n_sublattices, seed=0)
+
+    def track_bonds(self, n_sublattices):
+        return len(random_ham(n_sublattices=n_sublattices, seed=0)._22)
+
+    track_bonds.unit = "bonds"
+
+    def track_peak_memory(self, n_sublattices):
+        tracemalloc.start()
+        try:
+            random_ham(n_sublattices=n_sublattices, seed=0)
+            return tracemalloc.get_traced_memory()[1] / 1024**2
+        finally:
+            tracemalloc.stop()
+
+    track_peak_memory.unit = "MB"
+
+
+class RandomHamiltonianAllTerms:
+    params = [4, 16, 64]
+    param_names = ["n_sublattices"]
+
+    def setup(self, n_sublattices):
+        self.spinham = random_ham(n_sublattices=n_sublattices, terms=ALL_TERMS, seed=0)
+        self.energy = Energy(spinham=self.spinham)
+        self.spin_directions = np.random.default_rng(0).normal(size=(self.spinham.M, 3))
+
+    def time_random_ham(self, n_sublattices):
+        random_ham(n_sublattices=n_sublattices, terms=ALL_TERMS, seed=0)
+
+    def time_E_0(self, n_sublattices):
+        self.energy.E_0(self.spin_directions)
+
+    def time_gradient(self, n_sublattices):
+        self.energy.gradient(self.spin_directions)
+
+    def time_make_supercell(self, n_sublattices):
+        make_supercell(self.spinham, supercell=(2, 2, 2))
+
+
+class BinaryFile:
+    params = [30, 100, 550]
+    param_names = ["n_sublattices"]
+
+    def setup(self, n_sublattices):
+        self.spinham = random_ham(n_sublattices=n_sublattices, seed=0)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "spinham.npz")
+        save_spinham(self.spinham, self.filename)
+
+    def teardown(self, n_sublattices):
+        self.tmpdir.cleanup()
+
+    def time_save_spinham(self, n_sublattices):
+        save_spinham(self.spinham, self.filename)
+
+    def time_load_spinham(self, n_sublattices):
+        load_spinham(self.filename)
@@ -0,0 +1,53 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+from magnopy import make_supercell
+from magnopy.examples import cubic_ferro_nn, full_ham
+
+
+class MakeSupercell:
+    params = (["cubic_ferro_nn", "full_ham"], [2, 5, 10])
+    param_names = ["model", "n"]
+
+    def setup(self, model, n):
+        self.spinham = dict(cubic_ferro_nn=cubic_ferro_nn, full_ham=full_ham)[model]()
+
+    def time_make_supercell(self, model, n):
+        make_supercell(self.spinham, supercell=(n, n, n))
+
+
+class AddDipoleDipole:
+    params = [2, 4, 8]
+    param_names = ["R_cut"]
+
+    def setup(self, R_cut):
+        self.spinham = cubic_ferro_nn(S=1.5)
+
+    def time_add_dipole_dipole(self, R_cut):
+        self.spinham.copy().add_dipole_dipole(R_cut=R_cut)
+
+    def track_bonds(self, R_cut):
+        spinham = self.spinham.copy()
+        spinham.add_dipole_dipole(R_cut=R_cut)
+        return len(spinham._22)
+
+    track_bonds.unit = "bonds"
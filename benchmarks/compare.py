@@ -0,0 +1,128 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+R"""
+Compares two runs of the benchmarks, saved by run.py.
+
+Usage:
+
+    python benchmarks/compare.py [OLD.json NEW.json] [--factor 1.1]
+
+If the files are not given, then two latest runs from the ".benchmarks" folder are
+compared. Exit code is 1 if some benchmark became slower by more than the factor.
+"""
+
+import json
+import os
+import sys
+from argparse import ArgumentParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def compare(old, new, factor):
+    r"""
+    Returns the lines of the comparison table and the number of regressions.
+
+    Only the benchmarks, that are measured in seconds, are checked for the
+    regressions. Other ones (track_*) are reported as they are.
+    """
+
+    lines = [f"{'':2} {'Benchmark':<80} {'Old':>12} {'New':>12} {'Ratio':>8}"]
+    regressions = 0
+
+    for name in sorted(set(old) | set(new)):
+        if name not in old or name not in new:
+            value = new.get(name, old.get(name))["value"]
+            mark = "+" if name in new else "-"
+            lines.append(f"{mark:2} {name:<80} {value:>12.4g}")
+            continue
+
+        old_value, new_value = old[name]["value"], new[name]["value"]
+        ratio = new_value / old_value if old_value != 0 else float("inf")
+
+        mark = ""
+        if new[name]["unit"] == "seconds":
+            if ratio > factor:
+                mark = "!"
+                regressions += 1
+            elif ratio < 1 / factor:
+                mark = "*"
+
+        lines.append(
+            f"{mark:2} {name:<80} {old_value:>12.4g} {new_value:>12.4g} {ratio:>8.2f}"
+        )
+
+    return lines, regressions
+
+
+def main():
+    parser = ArgumentParser(description="Compares two runs of the benchmarks.")
+    parser.add_argument("files", nargs="*", help="Old and new results.")
+    parser.add_argument(
+        "-f",
+        "--factor",
+        type=float,
+        default=1.1,
+        help="Benchmark is reported as a regression if it is slower by more than "
+        "this factor.",
+    )
+    parser.add_argument(
+        "-rd",
+        "--results-dir",
+        type=str,
+        default=os.path.join(ROOT, ".benchmarks"),
+        help="Folder with the results, used if the files are not given.",
+    )
+    args = parser.parse_args()
+
+    if len(args.files) == 0:
+        files = sorted(
+            os.path.join(args.results_dir, filename)
+            for filename in os.listdir(args.results_dir)
+            if filename.endswith(".json")
+        )[-2:]
+    else:
+        files = args.files
+
+    if len(files) != 2:
+        parser.error("Expected two files with the results.")
+
+    data = []
+    for filename in files:
+        with open(filename) as f:
+            data.append(json.load(f))
+
+    print(f"Old: {data[0]['metadata']['commit']} ({data[0]['metadata']['date']})")
+    print(f"New: {data[1]['metadata']['commit']} ({data[1]['metadata']['date']})")
+    print("! - slower, * - faster, + - new benchmark, - - removed benchmark\n")
+
+    lines, regressions = compare(data[0]["results"], data[1]["results"], args.factor)
+    print("\n".join(lines))
+
+    if regressions > 0:
+        print(f"\n{regressions} benchmark(s) became slower by more than {args.factor}.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
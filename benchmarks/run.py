@@ -0,0 +1,229 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+R"""
+Runs the benchmarks of magnopy without asv and saves the results for the later
+comparison with compare.py.
+
+Benchmarks follow the conventions of asv: functions and methods with the names
+"time_*", "track_*" and "timeraw_*" in the modules "bench_*.py", ``params`` and
+``param_names`` of the classes, ``setup()`` and ``teardown()`` methods.
+
+Usage:
+
+    python benchmarks/run.py [--filter REGEX] [--repeat N] [--quick]
+"""
+
+import importlib
+import inspect
+import itertools
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import textwrap
+import timeit
+from argparse import ArgumentParser
+from datetime import datetime
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PREFIXES = ("time_", "track_", "timeraw_")
+
+
+def get_benchmarks():
+    r"""
+    Yields name, function, instance and parameters of every benchmark.
+    """
+
+    sys.path.insert(0, ROOT)
+
+    for filename in sorted(os.listdir(os.path.join(ROOT, "benchmarks"))):
+        if not (filename.startswith("bench_") and filename.endswith(".py")):
+            continue
+
+        module = importlib.import_module(f"benchmarks.{filename[:-3]}")
+
+        for name, item in inspect.getmembers(module):
+            if inspect.isfunction(item) and name.startswith(PREFIXES):
+                if item.__module__ == module.__name__:
+                    yield f"{module.__name__[11:]}.{name}", item, None, {}
+
+            elif inspect.isclass(item) and item.__module__ == module.__name__:
+                params = getattr(item, "params", [])
+                # Single parameter can be given as a plain list
+                if len(params) > 0 and not isinstance(params[0], (list, tuple)):
+                    params = [params]
+                param_names = getattr(
+                    item, "param_names", [f"param{i + 1}" for i in range(len(params))]
+                )
+
+                for method_name, method in inspect.getmembers(item):
+                    if not method_name.startswith(PREFIXES):
+                        continue
+
+                    for values in itertools.product(*params):
+                        parameters = dict(zip(param_names, values))
+                        yield (
+                            f"{module.__name__[11:]}.{name}.{method_name}",
+                            method,
+                            item,
+                            parameters,
+                        )
+
+
+def run_benchmark(function, cls, parameters, repeat, quick):
+    r"""
+    Returns the result of the benchmark and its unit.
+    """
+
+    args = list(parameters.values())
+    name = function.__name__
+
+    if name.startswith("timeraw_"):
+        code = textwrap.dedent(function(*args))
+        times = []
+        for _ in range(1 if quick else repeat):
+            start = perf_counter()
+            subprocess.run([sys.executable, "-c", code], check=True, cwd=ROOT)
+            times.append(perf_counter() - start)
+        return min(times), "seconds"
+
+    instance = None
+    if cls is not None:
+        instance = cls()
+        if hasattr(instance, "setup"):
+            instance.setup(*args)
+
+    try:
+        if instance is not None:
+            function = getattr(instance, name)
+
+        if name.startswith("track_"):
+            return function(*args), getattr(function, "unit", "unit")
+
+        timer = timeit.Timer(lambda: function(*args))
+        if quick:
+            number, repeat = 1, 1
+        else:
+            number, _ = timer.autorange()
+        return min(timer.repeat(repeat=repeat, number=number)) / number, "seconds"
+    finally:
+        if instance is not None and hasattr(instance, "teardown"):
+            instance.teardown(*args)
+
+
+def get_metadata():
+    r"""
+    Returns the description of the code and of the machine.
+    """
+
+    import numpy
+
+    import magnopy
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+
+    return dict(
+        commit=commit,
+        date=datetime.now().isoformat(timespec="seconds"),
+        machine=platform.node(),
+        processor=platform.processor(),
+        python=platform.python_version(),
+        numpy=numpy.__version__,
+        magnopy=magnopy.__version__,
+    )
+
+
+def main():
+    parser = ArgumentParser(description="Runs the benchmarks of magnopy.")
+    parser.add_argument(
+        "-f",
+        "--filter",
+        type=str,
+        default=None,
+        help="Run only the benchmarks with the names that match the regular expression.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of repetitions, the best one is reported.",
+    )
+    parser.add_argument(
+        "-q",
+        "--quick",
+        action="store_true",
+        default=False,
+        help="Run each benchmark only once. Useful to check that benchmarks work.",
+    )
+    parser.add_argument(
+        "-od",
+        "--output-dir",
+        type=str,
+        default=os.path.join(ROOT, ".benchmarks"),
+        help="Folder for the results. One .json file is written per run.",
+    )
+    args = parser.parse_args()
+
+    results = {}
+
+    for name, function, cls, parameters in get_benchmarks():
+        if parameters:
+            name += "(" + ", ".join(f"{k}={v!r}" for k, v in parameters.items()) + ")"
+
+        if args.filter is not None and re.search(args.filter, name) is None:
+            continue
+
+        value, unit = run_benchmark(
+            function, cls, parameters, repeat=args.repeat, quick=args.quick
+        )
+        results[name] = dict(value=value, unit=unit)
+        print(f"{name:<80} {value:>12.4g} {unit}", flush=True)
+
+    metadata = get_metadata()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    filename = os.path.join(
+        args.output_dir,
+        f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{metadata['commit'][:8]}.json",
+    )
+    with open(filename, "w") as f:
+        json.dump(dict(metadata=metadata, results=results), f, indent=4)
+
+    print(f"\nResults are saved in file\n  {filename}")
+
+
+if __name__ == "__main__":
+    main()
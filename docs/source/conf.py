@@ -223,6 +223,7 @@ custom_links = {
     ),
     "numpydoc": ("numpydoc", "https://numpydoc.readthedocs.io/en/latest/format.html"),
     "pytest": ("pytest", "https://docs.pytest.org/en/7.3.x/"),
+    "asv": ("asv", "https://asv.readthedocs.io/en/latest/"),
     "hypothesis": ("hypothesis", "https://hypothesis.readthedocs.io/en/latest/"),
     "reStructuredText": (
         "reStructuredText",
@@ -247,6 +248,7 @@ custom_links = {
         "multiprocessing",
         "https://docs.python.org/3/library/multiprocessing.html",
     ),
+    "cProfile": ("cProfile", "https://docs.python.org/3/library/profile.html"),
     "plotly": ("Plotly", "https://plotly.com/python/"),
     "spglib": ("spglib", "https://spglib.readthedocs.io/en/stable/index.html"),
     "plotly-update-layout": (
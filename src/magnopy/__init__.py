@@ -24,14 +24,55 @@ __version__ = "0.2.1"
 __doclink__ = "magnopy.org"
 __release_date__ = "10 September 2025"
 
-from . import _constants, examples, io, scenarios, experimental
+from importlib import import_module as _import_module
+
+from . import _constants
 from ._diagonalization import *
 from ._energy import *
 from ._exceptions import *
+from ._interpolation import *
+from ._kgrid import *
+from ._kpath import *
 from ._local_rf import *
 from ._lswt import *
 from ._package_info import *
 from ._parallelization import *
 from ._parameters import *
 from ._spinham import *
-from ._plotly_engine import *
+
+# Submodules and objects, that are imported on the first access (PEP 562). They pull
+# in the input-output and plotting code, that is not needed for the calculations.
+_LAZY_SUBMODULES = [
+    "examples",
+    "experimental",
+    "io",
+    "profiling",
+    "scenarios",
+    "thermodynamics",
+]
+_LAZY_OBJECTS = {"PlotlyEngine": "_plotly_engine"}
+
+# Star-import gives the same names as before the lazy import, i.e. it imports the lazy
+# submodules and objects as well
+__all__ = sorted(
+    {name for name in globals() if not name.startswith("_")}
+    | set(_LAZY_SUBMODULES)
+    | set(_LAZY_OBJECTS)
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        value = _import_module(f".{name}", __name__)
+    elif name in _LAZY_OBJECTS:
+        value = getattr(_import_module(f".{_LAZY_OBJECTS[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache in the namespace of the package, __getattr__ is not called again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -39,7 +39,9 @@ def main():
         "commands",
         default=None,
         help="command/commands on what to do. Use to display some information about package.",
-        choices=["logo", "warranty"],
+        # Validated below: argparse of python < 3.12 rejects the empty list if
+        # choices are given, i.e. "magnopy --version" fails
+        metavar="{logo,warranty}",
         nargs="*",
     )
     parser.add_argument(
@@ -51,6 +53,14 @@ def main():
 
     args = parser.parse_args()
 
+    # Same message and exit code as of argparse itself
+    for command in args.commands:
+        if command not in ["logo", "warranty"]:
+            parser.error(
+                f"argument commands: invalid choice: {command!r} "
+                "(choose from 'logo', 'warranty')"
+            )
+
     if args.version:
         print(f"magnopy v{__version__}")
 
@@ -63,8 +73,6 @@ def main():
             print(logo())
         elif command == "warranty":
             print("\n" + _warranty() + "\n")
-        else:
-            raise ValueError(f"Sub-command {args.command} is not recognized.")
 
 
 if __name__ == "__main__":
@@ -26,6 +26,7 @@ from argparse import ArgumentParser, RawDescriptionHelpFormatter
 import warnings
 
 from magnopy._package_info import logo
+from magnopy.profiling import Profiler
 from magnopy.io._grogu import load_grogu
 from magnopy.io._tb2j import load_tb2j
 from magnopy.scenarios._optimize_sd import optimize_sd
@@ -51,6 +52,8 @@ def manager():
         args.spin_values = [float(tmp) for tmp in args.spin_values]
 
     # Load spin Hamiltonian
+    profiler = Profiler(use_cprofile=args.profile)
+    profiler.start("Loading of the spin Hamiltonian")
     if args.spinham_source.lower() == "tb2j":
         spinham = load_tb2j(
             filename=args.spinham_filename, spin_values=args.spin_values
@@ -62,6 +65,7 @@ def manager():
             'Supported sources of spin Hamiltonian are "GROGU" and "TB2J", '
             f'got "{args.spinham_source}".'
         )
+    profiler.stop()
 
     if args.hide_personal_data:
         spinham_filename = args.spinham_filename
@@ -83,6 +87,7 @@ def manager():
         comment=comment,
         no_html=args.no_html,
         hide_personal_data=args.hide_personal_data,
+        profiler=profiler,
     )
 
 
@@ -184,6 +189,14 @@ def get_parser():
         help="Whether to strip the parts of the paths as to hide the file structure of "
         "you personal computer.",
     )
+    parser.add_argument(
+        "-prof",
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Run each stage of the calculation under cProfile and save the profiles "
+        "to the .prof files in the output folder.",
+    )
 
     # Deprecated in the version v0.2.0
     # Will be removed in March 2026
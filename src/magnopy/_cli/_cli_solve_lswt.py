@@ -28,6 +28,7 @@ from argparse import ArgumentParser, RawDescriptionHelpFormatter
 import numpy as np
 
 from magnopy._package_info import logo
+from magnopy.profiling import Profiler
 from magnopy.io._grogu import load_grogu
 from magnopy.io._spin_directions import read_spin_directions
 from magnopy.io._tb2j import load_tb2j
@@ -88,6 +89,8 @@ def manager():
         args.kpoints = kpoints
 
     # Load spin Hamiltonian
+    profiler = Profiler(use_cprofile=args.profile)
+    profiler.start("Loading of the spin Hamiltonian")
     if args.spinham_source.lower() == "tb2j":
         spinham = load_tb2j(
             filename=args.spinham_filename, spin_values=args.spin_values
@@ -99,6 +102,7 @@ def manager():
             'Supported sources of spin Hamiltonian are "GROGU" and "TB2J", '
             f'got "{args.spinham_source}".'
         )
+    profiler.stop()
     if args.hide_personal_data:
         spinham_filename = args.spinham_filename
     else:
@@ -122,6 +126,12 @@ def manager():
         no_html=args.no_html,
         hide_personal_data=args.hide_personal_data,
         spglib_symprec=args.spglib_symprec,
+        cache_dir=args.cache_dir,
+        cache_max_size=args.cache_max_size,
+        output_format=args.output_format,
+        no_plots=args.no_plots,
+        profiler=profiler,
+        adaptive_tolerance=args.adaptive_tolerance,
     )
 
 
@@ -239,6 +249,22 @@ def get_parser():
         help="html files are generally heavy (~> 5 Mb). This option allows to disable "
         "their production to save disk space.",
     )
+    parser.add_argument(
+        "-no-plots",
+        "--no-plots",
+        action="store_true",
+        default=False,
+        help="Skip all plots (.png and .html files) and compute only the numerical "
+        "results. Implies --no-html.",
+    )
+    parser.add_argument(
+        "-prof",
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Run each stage of the calculation under cProfile and save the profiles "
+        "to the .prof files in the output folder.",
+    )
     parser.add_argument(
         "-hpd",
         "--hide-personal-data",
@@ -254,6 +280,43 @@ def get_parser():
         default=1e-5,
         help="Tolerance parameter for the space group symmetry search by spglib.",
     )
+    parser.add_argument(
+        "-cd",
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory for the cache of the results. If given, then the optimized spin "
+        "directions and the results of the calculations over k-points are reused when "
+        "magnopy is called again with the same Hamiltonian, spin directions, magnetic "
+        "field and k-points. Nothing is cached by default.",
+    )
+    parser.add_argument(
+        "-cms",
+        "--cache-max-size",
+        type=int,
+        default=2**30,
+        help="Maximum size of the cache in bytes. When it is exceeded, the least "
+        "recently used results are removed.",
+    )
+    parser.add_argument(
+        "-ofmt",
+        "--output-format",
+        type=str,
+        choices=["txt", "npz"],
+        default="txt",
+        help='Format of the files with the k-resolved data. "txt" writes k-points, '
+        'omegas and deltas to separate text files. "npz" writes k-points, omegas, '
+        "deltas and transformation matrices to one compressed binary file.",
+    )
+    parser.add_argument(
+        "-at",
+        "--adaptive-tolerance",
+        type=float,
+        default=None,
+        help="Sample the k-path adaptively: more k-points where the magnon energies "
+        "change rapidly or the modes cross. The tolerance is relative to the range of "
+        "the magnon energies, 1e-3 is a good start. Ignored if --kpoints are given.",
+    )
 
     # Deprecated arguments
     parser.add_argument(
@@ -56,6 +56,13 @@ MAGNETIC_FIELD_NAME = "Tesla"
 TEMPERATURE_NAME = "Kelvin"
 
 
+################################################################################
+#                           Constants in these units                           #
+################################################################################
+BOHR_MAGNETON = si.BOHR_MAGNETON / ENERGY * MAGNETIC_FIELD  # meV / Tesla
+K_BOLTZMANN = si.K_BOLTZMANN / ENERGY * TEMPERATURE  # meV / Kelvin
+
+
 # Populate __all__ with objects defined in this file
 __all__ = list(set(dir()) - old_dir)
 # Remove all semi-private objects
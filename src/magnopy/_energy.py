@@ -24,6 +24,10 @@ from math import log10
 
 import numpy as np
 
+from magnopy._constants._internal_units import BOHR_MAGNETON
+from magnopy._spinham._ewald import _Ewald_dipole_dipole
+from magnopy._spinham._supercell import SupercellView
+
 # Save local scope at this moment
 old_dir = set(dir())
 old_dir.add("old_dir")
@@ -31,6 +35,21 @@ old_dir.add("old_dir")
 _C1 = 1e-4
 _C2 = 0.9
 
+# Name of the term, number of sites and the site of each spin vector of the term
+_TERMS = [
+    ("1", 1, (0,)),
+    ("21", 1, (0, 0)),
+    ("22", 2, (0, 1)),
+    ("31", 1, (0, 0, 0)),
+    ("32", 2, (0, 0, 1)),
+    ("33", 3, (0, 1, 2)),
+    ("41", 1, (0, 0, 0, 0)),
+    ("421", 2, (0, 0, 0, 1)),
+    ("422", 2, (0, 0, 1, 1)),
+    ("43", 3, (0, 0, 1, 2)),
+    ("44", 4, (0, 1, 2, 3)),
+]
+
 
 def _cubic_interpolation(alpha_l, alpha_h, phi_l, phi_h, der_l, der_h):
     r"""
@@ -130,8 +149,15 @@ class Energy:
 
     Parameters
     ----------
-    spinham : :py:class:`.SpinHamiltonian`
-        Spin Hamiltonian for the calculation of energy.
+    spinham : :py:class:`.SpinHamiltonian` or :py:class:`.SupercellView`
+        Spin Hamiltonian for the calculation of energy. For the
+        :py:class:`.SupercellView` the energy of the supercell is computed directly
+        from the parameters of the original Hamiltonian. Long-range dipole dipole
+        interaction (see :py:meth:`.SpinHamiltonian.add_dipole_dipole_ewald`) is
+        evaluated in the reciprocal space of the supercell, i.e. the memory and time
+        cost grow linearly with the number of unit cells.
+
+        .. versionchanged:: 0.3.0 Accepts :py:class:`.SupercellView`.
 
     Examples
     --------
@@ -184,17 +210,33 @@ class Energy:
     """
 
     def __init__(self, spinham):
-        initial_convention = spinham.convention
+        # Crystal, on which the spins are arranged
+        crystal = spinham
 
-        magnopy_convention = initial_convention.get_modified(
-            spin_normalized=False, multiple_counting=True
-        )
+        if isinstance(spinham, SupercellView):
+            self._supercell = spinham.supercell
+            spinham = spinham.spinham
+        else:
+            self._supercell = None
 
-        spinham.convention = magnopy_convention
+        spinham = spinham.view(
+            convention=spinham.convention.get_modified(
+                spin_normalized=False, multiple_counting=True
+            )
+        )
 
         self.spins = np.array(spinham.magnetic_atoms.spins, dtype=float)
         self.M = spinham.M
 
+        # For the Zeeman term, that is given at the time of the computation
+        if "g_factors" in crystal.magnetic_atoms:
+            self._g_factors = np.array(crystal.magnetic_atoms.g_factors, dtype=float)
+        else:
+            self._g_factors = None
+
+        if self._supercell is not None:
+            self._set_periodic_parameters(spinham=spinham)
+
         ########################################################################
         #                               One spin                               #
         ########################################################################
@@ -324,12 +366,287 @@ class Energy:
                 spinham.convention.c44 * parameter
             )
 
-        spinham.convention = initial_convention
+        ########################################################################
+        #                  Long-range dipole dipole interaction                #
+        ########################################################################
+
+        self.J_dd = None
+        self._J_dd_q = None
+
+        if spinham._dipole_dipole_ewald is not None:
+            ewald = _Ewald_dipole_dipole(
+                cell=spinham.cell,
+                positions=spinham.magnetic_atoms.positions,
+                g_factors=spinham.magnetic_atoms.get("g_factors"),
+                **spinham._dipole_dipole_ewald,
+            )
+
+            if self._supercell is None:
+                # Spins are the same in all unit cells, therefore k = 0
+                self.J_dd = ewald(k=[0, 0, 0]).real
+            else:
+                # Lattice sums at the k-points, that are commensurate with the
+                # supercell. The first three axes are ordered as the unit cells of
+                # the supercell.
+                n1, n2, n3 = self._supercell
+                self._J_dd_q = np.array(
+                    [
+                        ewald(k=(i / n1, j / n2, k / n3), relative=True)
+                        for k in range(n3)
+                        for j in range(n2)
+                        for i in range(n1)
+                    ]
+                ).reshape((n3, n2, n1, spinham.M, spinham.M, 3, 3))
+
+    def _set_periodic_parameters(self, spinham):
+        r"""
+        Prepares the parameters of the original Hamiltonian for the computation on the
+        supercell.
+
+        Parameters
+        ----------
+        spinham : :py:class:`.SpinHamiltonian`
+            Original spin Hamiltonian in the convention with
+            ``spin_normalized=False`` and ``multiple_counting=True``.
+        """
+
+        # All unit cells of the supercell share the same spins
+        self._spins_uc = self.spins
+        self.spins = np.tile(
+            self._spins_uc,
+            self._supercell[0] * self._supercell[1] * self._supercell[2],
+        )
+        self.M = len(self.spins)
+
+        # Each term is described by the number of sites and by the sites, that
+        # each of the spin vectors belongs to
+        self._periodic_parameters = []
+        for name, n_sites, sites in _TERMS:
+            entries = getattr(spinham, f"p{name}")
+
+            # Factors of the absent terms may be undefined
+            if len(entries) == 0:
+                continue
+
+            parameters = []
+            c = getattr(spinham.convention, f"c{name}")
+            for entry in entries:
+                alphas = tuple(
+                    spinham.map_to_magnetic[atom] for atom in entry[:n_sites]
+                )
+                nus = ((0, 0, 0),) + tuple(entry[n_sites : 2 * n_sites - 1])
+                spin_product = np.prod([self._spins_uc[alphas[site]] for site in sites])
+                # Parameters of lower rank are broadcasted, as in the dense path
+                parameter = np.broadcast_to(c * entry[-1], (3,) * len(sites))
+                parameters.append((alphas, nus, parameter, spin_product))
+
+            self._periodic_parameters.append((sites, parameters))
+
+    def _get_periodic_spins(self, vectors, alphas, nus):
+        r"""
+        Returns vectors of the given atoms for all unit cells of the supercell.
+
+        Parameters
+        ----------
+        vectors : (s3, s2, s1, M, 3) :numpy:`ndarray`
+            Vectors of all spins of the supercell. ``s1, s2, s3 = supercell``.
+        alphas : tuple of int
+            Indices of the magnetic atoms.
+        nus : tuple of tuple of 3 int
+            Unit cells of the atoms, relative to the unit cell of the first one.
+
+        Returns
+        -------
+        vectors : list of (s3, s2, s1, 3) :numpy:`ndarray`
+            Vectors of the atoms, for the first atom located in every unit cell of the
+            supercell.
+        """
+
+        result = []
+        for alpha, (i, j, k) in zip(alphas, nus):
+            if (i, j, k) == (0, 0, 0):
+                result.append(vectors[:, :, :, alpha])
+            else:
+                result.append(
+                    np.roll(vectors[:, :, :, alpha], shift=(-k, -j, -i), axis=(0, 1, 2))
+                )
 
-    def __call__(self, spin_directions, _normalize=True) -> float:
-        return self.E_0(spin_directions=spin_directions, _normalize=_normalize)
+        return result
 
-    def E_0(self, spin_directions, _normalize=True) -> float:
+    def _E_0_periodic(self, spins):
+        r"""
+        Computes classical energy of the supercell from the parameters of the original
+        Hamiltonian.
+
+        Parameters
+        ----------
+        spins : (M, 3) :numpy:`ndarray`
+            Spin vectors of the supercell.
+
+        Returns
+        -------
+        E_0 : float
+        """
+
+        energy = 0
+
+        spins = spins.reshape((*self._supercell[::-1], len(self._spins_uc), 3))
+
+        if self._J_dd_q is not None:
+            energy += np.sum(spins * self._dipole_dipole_field_periodic(spins=spins))
+
+        for sites, parameters in self._periodic_parameters:
+            indices = "ijuv"[: len(sites)]
+            subscripts = f"{indices}," + ",".join(f"abc{index}" for index in indices)
+
+            for alphas, nus, parameter, _ in parameters:
+                vectors = self._get_periodic_spins(
+                    vectors=spins, alphas=alphas, nus=nus
+                )
+
+                energy += np.einsum(
+                    f"{subscripts}->", parameter, *[vectors[site] for site in sites]
+                )
+
+        return float(energy)
+
+    def _gradient_periodic(self, spin_directions):
+        r"""
+        Computes gradient of energy of the supercell from the parameters of the
+        original Hamiltonian.
+
+        Parameters
+        ----------
+        spin_directions : (M, 3) :numpy:`ndarray`
+            Normalized directions of spin vectors of the supercell.
+
+        Returns
+        -------
+        gradient : (M, 3) :numpy:`ndarray`
+        """
+
+        spin_directions = spin_directions.reshape(
+            (*self._supercell[::-1], len(self._spins_uc), 3)
+        )
+
+        gradient = np.zeros(spin_directions.shape, dtype=float)
+
+        for sites, parameters in self._periodic_parameters:
+            indices = "tjuv"[: len(sites)]
+            subscripts = (
+                f"{indices},"
+                + ",".join(f"abc{index}" for index in indices[1:])
+                + "->abct"
+            )
+
+            for alphas, nus, parameter, spin_product in parameters:
+                if len(sites) == 1:
+                    gradient[:, :, :, alphas[0]] += parameter * spin_product
+                    continue
+
+                vectors = self._get_periodic_spins(
+                    vectors=spin_directions, alphas=alphas, nus=nus
+                )
+
+                gradient[:, :, :, alphas[0]] += (
+                    len(sites)
+                    * np.einsum(
+                        subscripts, parameter, *[vectors[site] for site in sites[1:]]
+                    )
+                    * spin_product
+                )
+
+        if self._J_dd_q is not None:
+            spins = spin_directions * self._spins_uc[:, np.newaxis]
+            gradient += (
+                2
+                * self._dipole_dipole_field_periodic(spins=spins)
+                * self._spins_uc[:, np.newaxis]
+            )
+
+        return gradient.reshape((self.M, 3))
+
+    def _dipole_dipole_field_periodic(self, spins):
+        r"""
+        Computes the field of the long-range dipole dipole interaction on the
+        supercell.
+
+        The interaction is diagonal in the k-points, that are commensurate with the
+        supercell, therefore the field is computed by the fast Fourier transform.
+        Memory is linear in the number of unit cells of the supercell.
+
+        Parameters
+        ----------
+        spins : (n3, n2, n1, M, 3) :numpy:`ndarray`
+            Spin vectors of the supercell, ``M`` spins of each unit cell.
+
+        Returns
+        -------
+        field : (n3, n2, n1, M, 3) :numpy:`ndarray`
+            :math:`\sum_{\beta, \nu} J_{dd}(\alpha, \beta, \nu) \boldsymbol{S}_{\beta}`
+            for each spin.
+        """
+
+        spins_q = np.fft.fftn(spins, axes=(0, 1, 2))
+
+        field_q = np.einsum("xyzabij,xyzbj->xyzai", self._J_dd_q, spins_q)
+
+        return np.fft.ifftn(field_q, axes=(0, 1, 2)).real
+
+    def _gradient_dipole_dipole(self, spin_directions):
+        r"""
+        Computes gradient of energy of the long-range dipole dipole interaction.
+
+        Parameters
+        ----------
+        spin_directions : (M, 3) :numpy:`ndarray`
+            Normalized directions of spin vectors.
+
+        Returns
+        -------
+        gradient : (M, 3) :numpy:`ndarray`
+        """
+
+        return 2 * np.einsum(
+            "abtj,bj,a,b->at",
+            self.J_dd,
+            spin_directions.reshape((self.M, 3)),
+            self.spins,
+            self.spins,
+        )
+
+    def _get_zeeman(self, h):
+        r"""
+        Computes the effective field of the external magnetic field in the energy units.
+
+        Parameters
+        ----------
+        h : (3, ) |array-like|_
+            Vector of magnetic field given in the units of Tesla.
+
+        Returns
+        -------
+        zeeman : (M, 3) :numpy:`ndarray`
+            :math:`\mu_B g_{\alpha} \boldsymbol{h}` for each spin.
+
+        Raises
+        ------
+        ValueError
+            If g-factors of the magnetic atoms are not defined.
+        """
+
+        if self._g_factors is None:
+            raise ValueError(
+                "Magnetic field requires g-factors of the magnetic atoms, but atoms "
+                "of the spin Hamiltonian have none."
+            )
+
+        return BOHR_MAGNETON * np.outer(self._g_factors, np.array(h, dtype=float))
+
+    def __call__(self, spin_directions, h=None, _normalize=True) -> float:
+        return self.E_0(spin_directions=spin_directions, h=h, _normalize=_normalize)
+
+    def E_0(self, spin_directions, h=None, _normalize=True) -> float:
         r"""
         Computes classical energy of the spin Hamiltonian.
 
@@ -340,6 +657,12 @@ class Energy:
             modulus is ignored. ``M`` is the amount of magnetic atoms in the
             Hamiltonian. The order of spin directions is the same as the order
             of magnetic atoms in ``spinham.magnetic_atoms.spins``.
+        h : (3, ) |array-like|_, optional
+            External magnetic field, given in the units of Tesla. It is added to the
+            Hamiltonian as in :py:meth:`.SpinHamiltonian.add_magnetic_field` for all
+            magnetic atoms.
+
+            .. versionadded:: 0.3.0
         _normalize : bool, default True
             Whether to normalize the spin_directions or use the provided vectors as is.
             This parameter is technical and we do not recommend to use it at all.
@@ -413,6 +736,12 @@ class Energy:
 
         energy = 0
 
+        if h is not None:
+            energy += np.sum(self._get_zeeman(h=h) * spins)
+
+        if self._supercell is not None:
+            return float(energy) + self._E_0_periodic(spins=spins)
+
         energy += np.diag(self.J_1 @ spins.T).sum()
 
         energy += np.einsum("mij,mi,mj->m", self.J_21, spins, spins).sum()
@@ -426,6 +755,9 @@ class Energy:
         for alpha, beta in self.J_22:
             energy += spins[alpha] @ self.J_22[(alpha, beta)] @ spins[beta]
 
+        if self.J_dd is not None:
+            energy += np.einsum("abij,ai,bj", self.J_dd, spins, spins)
+
         for alpha, beta in self.J_32:
             energy += np.einsum(
                 "iju,i,j,u",
@@ -486,7 +818,7 @@ class Energy:
 
         return float(energy)
 
-    def gradient(self, spin_directions, _normalize=True):
+    def gradient(self, spin_directions, h=None, _normalize=True):
         r"""
         Computes first derivatives of energy (:math:`E^{(0)}`) with respect to the
         components of the spin directional vectors.
@@ -498,6 +830,12 @@ class Energy:
             modulus is ignored. ``M`` is the amount of magnetic atoms in the
             Hamiltonian. The order of spin directions is the same as the order
             of magnetic atoms in ``spinham.magnetic_atoms.spins``.
+        h : (3, ) |array-like|_, optional
+            External magnetic field, given in the units of Tesla. It is added to the
+            Hamiltonian as in :py:meth:`.SpinHamiltonian.add_magnetic_field` for all
+            magnetic atoms.
+
+            .. versionadded:: 0.3.0
         _normalize : bool, default True
             Whether to normalize the spin_directions or use the provided vectors as is.
             This parameter is technical and we do not recommend to use it at all.
@@ -523,6 +861,30 @@ class Energy:
                 spin_directions / np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
             )
 
+        if self._supercell is not None:
+            gradient = self._gradient_periodic(spin_directions=spin_directions)
+        else:
+            gradient = self._gradient(spin_directions=spin_directions)
+
+        if h is not None:
+            gradient = gradient + self._get_zeeman(h=h) * self.spins[:, np.newaxis]
+
+        return gradient
+
+    def _gradient(self, spin_directions):
+        r"""
+        Computes gradient of energy of the unit cell.
+
+        Parameters
+        ----------
+        spin_directions : (M, 3) :numpy:`ndarray`
+            Normalized directions of spin vectors.
+
+        Returns
+        -------
+        gradient : (M, 3) :numpy:`ndarray`
+        """
+
         gradient = np.zeros((self.M, 3), dtype=float)
 
         gradient += self.J_1 * self.spins[:, np.newaxis]
@@ -556,6 +918,9 @@ class Energy:
                 * self.spins[beta]
             )
 
+        if self.J_dd is not None:
+            gradient += self._gradient_dipole_dipole(spin_directions=spin_directions)
+
         for alpha, beta in self.J_32:
             gradient[alpha] += 3 * (
                 np.einsum(
@@ -638,7 +1003,7 @@ class Energy:
 
         return gradient
 
-    def torque(self, spin_directions, _normalize=True):
+    def torque(self, spin_directions, h=None, _normalize=True):
         r"""
         Computes torque on each spin.
 
@@ -649,6 +1014,12 @@ class Energy:
             modulus is ignored. ``M`` is the amount of magnetic atoms in the
             Hamiltonian. The order of spin directions is the same as the order
             of magnetic atoms in ``spinham.magnetic_atoms.spins``.
+        h : (3, ) |array-like|_, optional
+            External magnetic field, given in the units of Tesla. It is added to the
+            Hamiltonian as in :py:meth:`.SpinHamiltonian.add_magnetic_field` for all
+            magnetic atoms.
+
+            .. versionadded:: 0.3.0
         _normalize : bool, default True
             Whether to normalize the spin_directions or use the provided vectors as is.
             This parameter is technical and we do not recommend to use it at all.
@@ -663,7 +1034,7 @@ class Energy:
         """
         return np.cross(
             spin_directions,
-            self.gradient(spin_directions=spin_directions, _normalize=_normalize),
+            self.gradient(spin_directions=spin_directions, h=h, _normalize=_normalize),
         )
 
     def _zoom(
@@ -676,6 +1047,7 @@ class Energy:
         alpha_hi,
         c1=_C1,
         c2=_C2,
+        h=None,
     ):
         sd_lo = _rotate_sd(
             reference_sd=reference_sd, rotation=alpha_lo * search_direction
@@ -684,11 +1056,11 @@ class Energy:
             reference_sd=reference_sd, rotation=alpha_hi * search_direction
         )
 
-        phi_lo = self.E_0(spin_directions=sd_lo)
-        phi_hi = self.E_0(spin_directions=sd_hi)
+        phi_lo = self.E_0(spin_directions=sd_lo, h=h)
+        phi_hi = self.E_0(spin_directions=sd_hi, h=h)
 
-        der_lo = self.torque(spin_directions=sd_lo).flatten() @ search_direction
-        der_hi = self.torque(spin_directions=sd_hi).flatten() @ search_direction
+        der_lo = self.torque(spin_directions=sd_lo, h=h).flatten() @ search_direction
+        der_hi = self.torque(spin_directions=sd_hi, h=h).flatten() @ search_direction
 
         trial_steps = 0
         phi_min = None
@@ -706,7 +1078,7 @@ class Energy:
             sd_j = _rotate_sd(
                 reference_sd=reference_sd, rotation=alpha_j * search_direction
             )
-            phi_j = self.E_0(spin_directions=sd_j)
+            phi_j = self.E_0(spin_directions=sd_j, h=h)
 
             # Safeguard
             if phi_min is None:
@@ -720,7 +1092,7 @@ class Energy:
                 return alpha_j
 
             # Evaluate \phi^{\prime}(\alpha_i)
-            der_j = self.torque(spin_directions=sd_j).flatten() @ search_direction
+            der_j = self.torque(spin_directions=sd_j, h=h).flatten() @ search_direction
 
             if phi_j > phi_0 + c1 * alpha_j * der_0 or phi_j >= phi_lo:
                 alpha_hi = alpha_j
@@ -747,11 +1119,12 @@ class Energy:
         c2=_C2,
         alpha_max=2.0,
         max_iterations=10000,
+        h=None,
     ):
         # First check if step alpha=1 is good to go:
         sd_1 = _rotate_sd(reference_sd=reference_sd, rotation=search_direction)
-        phi_1 = self.E_0(spin_directions=sd_1)
-        der_1 = self.torque(spin_directions=sd_1).flatten() @ search_direction
+        phi_1 = self.E_0(spin_directions=sd_1, h=h)
+        der_1 = self.torque(spin_directions=sd_1, h=h).flatten() @ search_direction
 
         if phi_1 <= phi_0 + c1 * der_0 and abs(der_1) <= c2 * abs(der_0):
             return 1.0
@@ -765,8 +1138,8 @@ class Energy:
         sd_max = _rotate_sd(
             reference_sd=reference_sd, rotation=alpha_max * search_direction
         )
-        phi_max = self.E_0(spin_directions=sd_max)
-        der_max = self.torque(spin_directions=sd_max).flatten() @ search_direction
+        phi_max = self.E_0(spin_directions=sd_max, h=h)
+        der_max = self.torque(spin_directions=sd_max, h=h).flatten() @ search_direction
 
         alpha_i = _cubic_interpolation(
             alpha_l=alpha_prev,
@@ -782,7 +1155,7 @@ class Energy:
             sd_i = _rotate_sd(
                 reference_sd=reference_sd, rotation=alpha_i * search_direction
             )
-            phi_i = self.E_0(spin_directions=sd_i)
+            phi_i = self.E_0(spin_directions=sd_i, h=h)
 
             if phi_i > phi_0 + c1 * alpha_i * der_0 or (i > 1 and phi_i >= phi_prev):
                 return self._zoom(
@@ -792,10 +1165,11 @@ class Energy:
                     der_0=der_0,
                     alpha_lo=alpha_prev,
                     alpha_hi=alpha_i,
+                    h=h,
                 )
 
             # Evaluate \phi^{\prime}(\alpha_i)
-            der_i = self.torque(spin_directions=sd_i).flatten() @ search_direction
+            der_i = self.torque(spin_directions=sd_i, h=h).flatten() @ search_direction
 
             if abs(der_i) <= -c2 * der_0:
                 return alpha_i
@@ -808,6 +1182,7 @@ class Energy:
                     der_0=der_0,
                     alpha_lo=alpha_i,
                     alpha_hi=alpha_prev,
+                    h=h,
                 )
 
             # Choose alpha_{i+1}
@@ -837,6 +1212,7 @@ class Energy:
         energy_tolerance=1e-5,
         torque_tolerance=1e-5,
         quiet=False,
+        h=None,
     ):
         r"""
         Optimize classical energy by varying the directions of spins in the unit cell.
@@ -851,6 +1227,12 @@ class Energy:
             Torque tolerance for the two consecutive steps of the optimization.
         quiet : bool, default False
             Whether to suppress the output of the progress.
+        h : (3, ) |array-like|_, optional
+            External magnetic field, given in the units of Tesla. It is added to the
+            Hamiltonian as in :py:meth:`.SpinHamiltonian.add_magnetic_field` for all
+            magnetic atoms.
+
+            .. versionadded:: 0.3.0
 
         Returns
         -------
@@ -901,8 +1283,8 @@ class Energy:
 
         hessinv_k = np.eye(3 * self.M, dtype=float)
 
-        energy_k = self.E_0(spin_directions=sd_k)
-        gradient_k = self.torque(spin_directions=sd_k).flatten()
+        energy_k = self.E_0(spin_directions=sd_k, h=h)
+        gradient_k = self.torque(spin_directions=sd_k, h=h).flatten()
 
         first_iteration = True
         step_counter = 1
@@ -915,6 +1297,7 @@ class Energy:
                 search_direction=search_direction,
                 phi_0=energy_k,
                 der_0=gradient_k @ search_direction,
+                h=h,
             )
 
             # alpha_k = max(alpha_k, 1e-3)
@@ -925,8 +1308,8 @@ class Energy:
 
             sd_next = _rotate_sd(reference_sd=sd_k, rotation=s_k)
             # print(f"sd_next = {sd_next}")
-            energy_next = self.E_0(spin_directions=sd_next)
-            gradient_next = self.torque(spin_directions=sd_next).flatten()
+            energy_next = self.E_0(spin_directions=sd_next, h=h)
+            gradient_next = self.torque(spin_directions=sd_next, h=h).flatten()
 
             delta = np.array(
                 [
@@ -982,6 +1365,7 @@ class Energy:
         initial_guess=None,
         energy_tolerance=1e-5,
         torque_tolerance=1e-5,
+        h=None,
     ):
         r"""
         Optimize classical energy by varying the directions of spins in the unit cell.
@@ -996,6 +1380,12 @@ class Energy:
             Energy tolerance for the two consecutive steps of the optimization.
         torque_tolerance : float, default 1e-5
             Torque tolerance for the two consecutive steps of the optimization.
+        h : (3, ) |array-like|_, optional
+            External magnetic field, given in the units of Tesla. It is added to the
+            Hamiltonian as in :py:meth:`.SpinHamiltonian.add_magnetic_field` for all
+            magnetic atoms.
+
+            .. versionadded:: 0.3.0
 
         Yields
         ------
@@ -1022,8 +1412,8 @@ class Energy:
 
         hessinv_k = np.eye(3 * self.M, dtype=float)
 
-        energy_k = self.E_0(spin_directions=sd_k)
-        gradient_k = self.torque(spin_directions=sd_k).flatten()
+        energy_k = self.E_0(spin_directions=sd_k, h=h)
+        gradient_k = self.torque(spin_directions=sd_k, h=h).flatten()
 
         first_iteration = True
         step_counter = 1
@@ -1038,14 +1428,15 @@ class Energy:
                 search_direction=search_direction,
                 phi_0=energy_k,
                 der_0=gradient_k @ search_direction,
+                h=h,
             )
 
             s_k = alpha_k * search_direction
 
             sd_next = _rotate_sd(reference_sd=sd_k, rotation=s_k)
 
-            energy_next = self.E_0(spin_directions=sd_next)
-            gradient_next = self.torque(spin_directions=sd_next).flatten()
+            energy_next = self.E_0(spin_directions=sd_next, h=h)
+            gradient_next = self.torque(spin_directions=sd_next, h=h).flatten()
 
             yield (energy_next, gradient_next, sd_next)
 
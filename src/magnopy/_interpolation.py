@@ -0,0 +1,445 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+
+from magnopy._parallelization import multiprocess_over_k
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+# Maximum number of elements in the intermediate (points, r, r) arrays
+_MAX_ELEMENTS = 10_000_000
+
+# Singular values of the trial vectors below this fraction of the largest one are
+# dropped as linearly dependent
+_RANK_TOLERANCE = 1e-8
+
+
+class BandInterpolator:
+    r"""
+    Interpolation of the lowest magnon bands from a coarse grid of k-points.
+
+    The Hamiltonian is diagonalized once at the points of the coarse grid. At any other
+    k-point the exact grand dynamical matrix, assembled from the real-space tables
+    ``LSWT.A2`` and ``LSWT.B2``, is projected on the eigenvectors of the
+    ``n_bands`` lowest modes at the corners of the cell of the coarse grid, that
+    contains the point. The small projected problem gives the energies of the lowest
+    bands.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    lswt : :py:class:`.LSWT`
+        Linear spin wave theory.
+    kgrid : :py:class:`.KGrid`
+        Coarse grid of k-points. Its cell has to be the cell of the spin Hamiltonian.
+        All points of the full grid are diagonalized, the symmetry reduction is not
+        used.
+    n_bands : int, optional
+        Number of the lowest bands to interpolate. By default all :math:`M` bands are
+        interpolated.
+    number_processors : int, optional
+        Number of processes for the diagonalization on the coarse grid and for
+        :py:meth:`.BandInterpolator.estimate_error`. By default magnopy uses all
+        available processes. Use ``number_processors=1`` to run in serial mode.
+
+    Attributes
+    ----------
+    lswt : :py:class:`.LSWT`
+        Linear spin wave theory.
+    kgrid : :py:class:`.KGrid`
+        Coarse grid of k-points.
+    n_bands : int
+        Number of the interpolated bands.
+
+    Raises
+    ------
+    ValueError
+        If ``n_bands`` is not between 1 and :math:`M` or if ``lswt`` includes the
+        long-range dipole-dipole interaction, which is not given by the real-space
+        tables.
+
+    Notes
+    -----
+    The magnon energies :math:`\omega_n(\boldsymbol{k})` are :math:`2/\mu_n`, where
+    :math:`\mu_n` are the positive eigenvalues of the Hermitian-definite problem
+
+    .. math::
+
+        \boldsymbol{g}\boldsymbol{x}
+        =
+        \mu\boldsymbol{D}(\boldsymbol{k})\boldsymbol{x},
+        \qquad
+        \boldsymbol{g}
+        =
+        \begin{pmatrix}
+            \boldsymbol{I} & 0 \\
+            0 & -\boldsymbol{I}
+        \end{pmatrix}
+
+    with the grand dynamical matrix :math:`\boldsymbol{D}(\boldsymbol{k})` (see
+    :py:meth:`.LSWT.GDM`). The lowest bands correspond to the largest :math:`\mu_n`.
+    By the Courant-Fischer theorem the projection on any subspace underestimates the
+    largest :math:`\mu_n`, therefore the interpolated energies are upper bounds of the
+    exact ones. At the points of the coarse grid the subspace contains the exact
+    eigenvectors and the interpolated energies are exact.
+
+    Unlike the interpolation of the energies themselves, the projection is a
+    diagonalization of a matrix and the degenerate and crossing bands need no special
+    treatment. However, the subspace is spanned by the ``n_bands`` lowest modes only.
+    If a higher band crosses the interpolated ones within the cell, the accuracy drops
+    until ``n_bands`` includes it.
+
+    The projected matrices are computed once per cell of the coarse grid. For each
+    k-point the cost does not depend on :math:`M` and scales as
+    :math:`N_{\nu}r^2 + r^3`, where :math:`N_{\nu}` is the number of the lattice
+    vectors in the tables and :math:`r \le \min(8 n_{bands}, 2M)` is the dimension of
+    the subspace. Choose ``n_bands`` smaller than :math:`M` to benefit for large
+    :math:`M`, for example to compute the low-temperature thermodynamics.
+
+    Points of the coarse grid, where the diagonalization fails (for example the
+    Goldstone mode at :math:`\Gamma`), do not contribute to the subspace. Energies are
+    ``NaN`` at the k-points, where the projected matrix is not positive definite.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import numpy as np
+        >>> import magnopy
+        >>> spinham = magnopy.examples.cubic_ferro_nn()
+        >>> lswt = magnopy.LSWT(
+        ...     spinham=spinham, spin_directions=[[0, 0, 1]], h=[0, 0, 1]
+        ... )
+        >>> kgrid = magnopy.KGrid(cell=spinham.cell, mesh=(4, 4, 4))
+        >>> interpolator = magnopy.BandInterpolator(
+        ...     lswt=lswt, kgrid=kgrid, number_processors=1
+        ... )
+        >>> omegas = interpolator.omega(kpoints=[[0.1, 0.2, 0.3]], relative=True)
+        >>> bool(np.allclose(omegas[0], lswt.omega(k=[0.1, 0.2, 0.3], relative=True)))
+        True
+    """
+
+    def __init__(self, lswt, kgrid, n_bands=None, number_processors=None) -> None:
+        if lswt._J_dd is not None:
+            raise ValueError(
+                "Long-range dipole-dipole interaction is not supported by the "
+                "interpolation."
+            )
+
+        if n_bands is None:
+            n_bands = lswt.M
+        n_bands = int(n_bands)
+
+        if not 1 <= n_bands <= lswt.M:
+            raise ValueError(f"Expected n_bands between 1 and {lswt.M}, got {n_bands}.")
+
+        self.lswt = lswt
+        self.kgrid = kgrid
+        self.n_bands = n_bands
+        self._number_processors = number_processors
+
+        self._build_tables()
+
+        # Trial vectors from the coarse grid, (N, 2M, n_bands)
+        results = multiprocess_over_k(
+            kpoints=kgrid.points(relative=False),
+            function=lswt.diagonalize,
+            relative=False,
+            number_processors=number_processors,
+        )
+        G = np.array([result[2] for result in results], dtype=complex)[:, :n_bands]
+
+        self._trial_vectors = np.einsum("i,nbi->nib", self._metric, np.conjugate(G))
+        self._failed = np.any(np.isnan(self._trial_vectors), axis=(1, 2))
+
+    def _build_tables(self):
+        r"""
+        Real-space tables of the grand dynamical matrix.
+
+        .. math::
+
+            \boldsymbol{D}(\boldsymbol{k})
+            =
+            \sum_{\nu}
+            \boldsymbol{D}_{\nu}
+            e^{2\pi i\boldsymbol{k}\boldsymbol{\nu}}
+
+        with :math:`\boldsymbol{k}` given relative to the reciprocal cell.
+        """
+
+        M = self.lswt.M
+        zero = np.zeros((M, M), dtype=complex)
+
+        nus = set(self.lswt.A2) | set(self.lswt.B2)
+        nus |= set(tuple(-i for i in nu) for nu in nus)
+        nus.add((0, 0, 0))
+        nus = sorted(nus)
+
+        tables = np.zeros((len(nus), 2 * M, 2 * M), dtype=complex)
+        for i, nu in enumerate(nus):
+            minus_nu = tuple(-j for j in nu)
+
+            A = self.lswt.A2.get(nu, zero)
+            B = self.lswt.B2.get(nu, zero)
+            B_minus = self.lswt.B2.get(minus_nu, zero)
+
+            tables[i, :M, :M] = A
+            tables[i, :M, M:] = B
+            tables[i, M:, :M] = np.conjugate(B_minus).T
+            tables[i, M:, M:] = np.conjugate(A)
+
+        # On-site term
+        tables[nus.index((0, 0, 0))] -= np.diag(np.concatenate((self.lswt.A1,) * 2))
+
+        self._nus = np.array(nus, dtype=float)
+        self._tables = tables
+        self._metric = np.concatenate((np.ones(M), -np.ones(M)))
+
+    def _get_cells(self, kpoints):
+        r"""
+        Cells of the coarse grid, that contain the points.
+
+        Parameters
+        ----------
+        kpoints : (N, 3) :numpy:`ndarray`
+            Relative coordinates of the points.
+
+        Returns
+        -------
+        cells : (N, ) :numpy:`ndarray`
+            Flat index of the lower corner of the cell, that contains each point.
+        """
+
+        mesh = np.array(self.kgrid.mesh)
+        corners = np.floor(kpoints * mesh - self.kgrid.shift).astype(int) % mesh
+
+        return (corners[:, 0] * mesh[1] + corners[:, 1]) * mesh[2] + corners[:, 2]
+
+    def _get_subspace(self, cell):
+        r"""
+        Orthonormal basis of the trial vectors at the corners of the cell.
+
+        Parameters
+        ----------
+        cell : int
+            Flat index of the lower corner of the cell.
+
+        Returns
+        -------
+        basis : (2M, r) :numpy:`ndarray`
+        """
+
+        mesh = np.array(self.kgrid.mesh)
+        lower = np.array(np.unravel_index(cell, mesh))
+
+        corners = (lower + np.array(list(np.ndindex(2, 2, 2)))) % mesh
+        corners = np.unique(
+            (corners[:, 0] * mesh[1] + corners[:, 1]) * mesh[2] + corners[:, 2]
+        )
+        corners = corners[~self._failed[corners]]
+
+        if len(corners) == 0:
+            return np.zeros((2 * self.lswt.M, 0), dtype=complex)
+
+        vectors = np.concatenate(self._trial_vectors[corners], axis=1)
+
+        U, s, _ = np.linalg.svd(vectors, full_matrices=False)
+
+        return U[:, s > _RANK_TOLERANCE * s[0]]
+
+    def omega(self, kpoints, relative=False):
+        r"""
+        Interpolated energies of the lowest magnon bands.
+
+        Parameters
+        ----------
+        kpoints : (N, 3) |array-like|_
+            K-points.
+        relative : bool, default False
+            If ``relative=True``, then ``kpoints`` are interpreted as given relative to
+            the reciprocal unit cell. Otherwise they are interpreted as given in
+            absolute coordinates.
+
+        Returns
+        -------
+        omegas : (N, n_bands) :numpy:`ndarray`
+            Energies of the lowest ``n_bands`` bands, sorted at each point. ``NaN``
+            where the projected matrix is not positive definite.
+
+        See Also
+        --------
+        LSWT.omega
+        """
+
+        kpoints = np.array(kpoints, dtype=float).reshape(-1, 3)
+
+        if not relative:
+            kpoints = kpoints @ np.linalg.inv(self.kgrid.rcell)
+
+        omegas = np.full((len(kpoints), self.n_bands), np.nan, dtype=float)
+
+        cells = self._get_cells(kpoints)
+        unique_cells, inverse = np.unique(cells, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique_cells) + 1))
+
+        for i, cell in enumerate(unique_cells):
+            basis = self._get_subspace(cell)
+            r = basis.shape[1]
+
+            if r < self.n_bands:
+                continue
+
+            projected = np.einsum(
+                "ai,nab,bj->nij", np.conjugate(basis), self._tables, basis
+            )
+            metric = np.einsum("ai,a,aj->ij", np.conjugate(basis), self._metric, basis)
+
+            indices = order[bounds[i] : bounds[i + 1]]
+            chunk_size = max(1, _MAX_ELEMENTS // (r * r + len(self._nus)))
+
+            for start in range(0, len(indices), chunk_size):
+                chunk = indices[start : start + chunk_size]
+                omegas[chunk] = self._solve(
+                    kpoints=kpoints[chunk], projected=projected, metric=metric
+                )
+
+        return omegas
+
+    def _solve(self, kpoints, projected, metric):
+        r"""
+        Solves the projected problem for the points of one cell.
+
+        Parameters
+        ----------
+        kpoints : (N, 3) :numpy:`ndarray`
+            Relative coordinates of the points.
+        projected : (N_nu, r, r) :numpy:`ndarray`
+            Projected real-space tables.
+        metric : (r, r) :numpy:`ndarray`
+            Projected metric.
+
+        Returns
+        -------
+        omegas : (N, n_bands) :numpy:`ndarray`
+        """
+
+        phases = np.exp(2j * np.pi * kpoints @ self._nus.T)
+        D = np.tensordot(phases, projected, axes=1)
+        D = 0.5 * (D + np.conjugate(np.swapaxes(D, 1, 2)))
+
+        omegas = np.full((len(kpoints), self.n_bands), np.nan, dtype=float)
+
+        try:
+            L = np.linalg.cholesky(D)
+            positive = np.ones(len(kpoints), dtype=bool)
+        except np.linalg.LinAlgError:
+            # Find the points, where the projected matrix is positive definite
+            positive = np.array(
+                [np.all(np.linalg.eigvalsh(matrix) > 0) for matrix in D], dtype=bool
+            )
+            if not np.any(positive):
+                return omegas
+            L = np.linalg.cholesky(D[positive])
+
+        L_inv = np.linalg.inv(L)
+        mus = np.linalg.eigvalsh(
+            L_inv @ metric @ np.conjugate(np.swapaxes(L_inv, 1, 2))
+        )
+        mus = mus[:, ::-1][:, : self.n_bands]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            omegas[positive] = np.where(mus > 0, 2 / mus, np.nan)
+
+        return omegas
+
+    def estimate_error(self, kpoints=None, relative=False, n_samples=100, seed=None):
+        r"""
+        Errors of the interpolation with respect to the exact diagonalization.
+
+        Parameters
+        ----------
+        kpoints : (N, 3) |array-like|_, optional
+            K-points, where the errors are computed. By default ``n_samples`` random
+            points in the first Brillouin zone are used.
+        relative : bool, default False
+            If ``relative=True``, then ``kpoints`` are interpreted as given relative to
+            the reciprocal unit cell. Otherwise they are interpreted as given in
+            absolute coordinates.
+        n_samples : int, default 100
+            Number of the random points. Ignored if ``kpoints`` are given.
+        seed : int, optional
+            Seed for the random points. Ignored if ``kpoints`` are given.
+
+        Returns
+        -------
+        errors : (N, n_bands) :numpy:`ndarray`
+            Interpolated minus exact energies, given by :py:meth:`.LSWT.omega`. As the
+            interpolated energies are upper bounds of the exact ones, the errors are
+            non-negative up to the numerical precision.
+
+        Examples
+        --------
+
+        .. doctest::
+
+            >>> import magnopy
+            >>> spinham = magnopy.examples.cubic_ferro_nn()
+            >>> lswt = magnopy.LSWT(
+            ...     spinham=spinham, spin_directions=[[0, 0, 1]], h=[0, 0, 1]
+            ... )
+            >>> kgrid = magnopy.KGrid(cell=spinham.cell, mesh=(4, 4, 4))
+            >>> interpolator = magnopy.BandInterpolator(
+            ...     lswt=lswt, kgrid=kgrid, number_processors=1
+            ... )
+            >>> errors = interpolator.estimate_error(n_samples=10, seed=0)
+            >>> errors.shape
+            (10, 1)
+        """
+
+        if kpoints is None:
+            kpoints = np.random.default_rng(seed).random((n_samples, 3))
+            relative = True
+
+        kpoints = np.array(kpoints, dtype=float).reshape(-1, 3)
+
+        exact = multiprocess_over_k(
+            kpoints=kpoints,
+            function=self.lswt.omega,
+            relative=relative,
+            number_processors=self._number_processors,
+        )
+        exact = np.array(exact, dtype=complex).real[:, : self.n_bands]
+
+        return self.omega(kpoints=kpoints, relative=relative) - exact
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
@@ -0,0 +1,436 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import wulfric
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+# Tolerance for the check that the rotated k-point is a point of the grid. In the units
+# of the grid step.
+_GRID_TOLERANCE = 1e-5
+
+
+class KGrid:
+    r"""
+    Uniform grid of k-points in the first Brillouin zone.
+
+    The grid is reduced to the irreducible points with the given symmetry operations.
+    Sums over the full grid are computed as the weighted sums over the irreducible
+    points.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Unit cell. Rows are vectors, columns are cartesian components.
+    mesh : (3, ) tuple or list of int
+        Number of points along each reciprocal lattice vector.
+    shift : (3, ) |array-like|_, default (0, 0, 0)
+        Shift of the grid along each reciprocal lattice vector, given in the units of
+        the grid step. With ``shift=(0, 0, 0)`` the grid is :math:`\Gamma`-centered.
+        Original Monkhorst-Pack grid is given by ``shift=0.5`` along the directions
+        with an even number of points.
+    rotations : (K, 3, 3) |array-like|_, optional
+        Rotational parts of the symmetry operations, given in the basis of the
+        ``cell`` (as returned by |spglib|_). By default only the identity is used and
+        the grid is not reduced.
+    time_reversals : (K, ) |array-like|_ of bool, optional
+        Whether each symmetry operation is combined with the time reversal. By default
+        no operation is combined with it.
+
+    Attributes
+    ----------
+    cell : (3, 3) :numpy:`ndarray`
+        Unit cell. Rows are vectors, columns are cartesian components.
+    rcell : (3, 3) :numpy:`ndarray`
+        Reciprocal cell. Rows are vectors, columns are cartesian components.
+    mesh : (3, ) tuple of int
+        Number of points along each reciprocal lattice vector.
+    shift : (3, ) :numpy:`ndarray`
+        Shift of the grid, given in the units of the grid step.
+
+    Raises
+    ------
+    ValueError
+        If ``mesh`` contains non-positive numbers or if the numbers of ``rotations``
+        and ``time_reversals`` differ.
+
+    Notes
+    -----
+    The points of the grid are
+
+    .. math::
+
+        \boldsymbol{k}_{ijl}
+        =
+        \dfrac{i + s_1}{n_1}\boldsymbol{b}_1
+        +
+        \dfrac{j + s_2}{n_2}\boldsymbol{b}_2
+        +
+        \dfrac{l + s_3}{n_3}\boldsymbol{b}_3
+
+    where :math:`0 \le i < n_1`, :math:`0 \le j < n_2`, :math:`0 \le l < n_3`. The
+    points are ordered with :math:`l` changing the fastest.
+
+    A symmetry operation with the rotational part :math:`W` (in the basis of the
+    ``cell``) maps a point with the relative coordinates :math:`\boldsymbol{k}` (a row)
+    to :math:`\boldsymbol{k}W`, and to :math:`-\boldsymbol{k}W` if it is combined with
+    the time reversal. Operations, that do not map the grid onto itself, are ignored.
+    The irreducible point of each star is the one with the smallest index in the full
+    grid.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import numpy as np
+        >>> import magnopy
+        >>> kgrid = magnopy.KGrid(cell=np.eye(3), mesh=(4, 4, 4))
+        >>> kgrid.N
+        64
+        >>> len(kgrid.irreducible_points())
+        64
+        >>> # Inversion
+        >>> kgrid = magnopy.KGrid(
+        ...     cell=np.eye(3), mesh=(4, 4, 4), rotations=[np.eye(3), -np.eye(3)]
+        ... )
+        >>> len(kgrid.irreducible_points())
+        36
+        >>> float(kgrid.weights.sum())
+        1.0
+    """
+
+    def __init__(
+        self, cell, mesh, shift=(0, 0, 0), rotations=None, time_reversals=None
+    ) -> None:
+        self.cell = np.array(cell, dtype=float)
+        self.rcell = wulfric.cell.get_reciprocal(cell=self.cell)
+
+        self.mesh = tuple(int(n) for n in mesh)
+        if len(self.mesh) != 3 or min(self.mesh) < 1:
+            raise ValueError(f"Expected three positive integers, got {mesh}.")
+
+        self.shift = np.array(shift, dtype=float) * np.ones(3, dtype=float)
+
+        if rotations is None:
+            rotations = [np.eye(3, dtype=int)]
+        rotations = np.array(rotations, dtype=float).reshape(-1, 3, 3)
+
+        if time_reversals is None:
+            time_reversals = [False for _ in rotations]
+        time_reversals = np.array(time_reversals, dtype=bool).reshape(-1)
+
+        if len(rotations) != len(time_reversals):
+            raise ValueError(
+                f"Got {len(rotations)} rotations and {len(time_reversals)} time "
+                "reversals, expected the same number."
+            )
+
+        self._rotations = rotations
+        self._time_reversals = time_reversals
+
+        self._mapping = None
+        self._irreducible = None
+        self._weights = None
+
+    @classmethod
+    def from_spinham(
+        cls,
+        spinham,
+        mesh,
+        spin_directions,
+        shift=(0, 0, 0),
+        spglib_symprec=1e-5,
+    ):
+        r"""
+        Creates the grid, that is reduced with the magnetic symmetry of the spin
+        Hamiltonian and spin directions.
+
+        The symmetry operations are found by |spglib|_ from the atoms of the spin
+        Hamiltonian and the spin vectors of its magnetic atoms.
+
+        Parameters
+        ----------
+        spinham : :py:class:`.SpinHamiltonian`
+            Spin Hamiltonian.
+        mesh : (3, ) tuple or list of int
+            Number of points along each reciprocal lattice vector.
+        spin_directions : (M, 3) |array-like|_
+            Directions of spin vectors. Only directions of vectors are used, modulus
+            is ignored. The order is the same as the order of magnetic atoms in
+            ``spinham.magnetic_atoms``.
+        shift : (3, ) |array-like|_, default (0, 0, 0)
+            Shift of the grid along each reciprocal lattice vector, given in the units
+            of the grid step.
+        spglib_symprec : float, default 1e-5
+            Tolerance parameter for the symmetry search by |spglib|_.
+
+        Returns
+        -------
+        kgrid : :py:class:`.KGrid`
+            Reduced grid of k-points.
+
+        Notes
+        -----
+        The symmetry is deduced from the crystal structure and the spin vectors only.
+        It is assumed, that the parameters of the Hamiltonian have the same symmetry.
+        If it is not the case (for example, for the parameters that are not
+        symmetrized), then create the grid without symmetry operations.
+
+        Examples
+        --------
+
+        .. doctest::
+
+            >>> import magnopy
+            >>> spinham = magnopy.examples.cubic_ferro_nn()
+            >>> kgrid = magnopy.KGrid.from_spinham(
+            ...     spinham=spinham, mesh=(8, 8, 8), spin_directions=[[0, 0, 1]]
+            ... )
+            >>> kgrid.N
+            512
+            >>> len(kgrid.irreducible_points())
+            75
+        """
+
+        # spglib is a dependency of wulfric, imported on demand as it is not needed
+        # for the rest of the calculations
+        import spglib
+
+        spin_directions = np.array(spin_directions, dtype=float)
+        spin_directions /= np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
+
+        # Spin vectors for all atoms, zero for non-magnetic ones
+        magmoms = np.zeros((len(spinham.atoms.names), 3), dtype=float)
+        magmoms[spinham.map_to_all] = (
+            np.array(spinham.magnetic_atoms.spins, dtype=float)[:, np.newaxis]
+            * spin_directions
+        )
+
+        symmetry = spglib.get_magnetic_symmetry(
+            (
+                np.array(spinham.cell, dtype=float),
+                np.array(spinham.atoms.positions, dtype=float),
+                wulfric.get_spglib_types(atoms=spinham.atoms),
+                magmoms,
+            ),
+            symprec=spglib_symprec,
+        )
+
+        if symmetry is None:
+            rotations = None
+            time_reversals = None
+        else:
+            rotations = symmetry["rotations"]
+            time_reversals = symmetry["time_reversals"]
+
+        return cls(
+            cell=spinham.cell,
+            mesh=mesh,
+            shift=shift,
+            rotations=rotations,
+            time_reversals=time_reversals,
+        )
+
+    @property
+    def N(self) -> int:
+        r"""
+        Number of points in the full grid.
+
+        Returns
+        -------
+        N : int
+        """
+
+        return self.mesh[0] * self.mesh[1] * self.mesh[2]
+
+    def _indices(self):
+        r"""
+        Integer coordinates of the points of the full grid.
+
+        Returns
+        -------
+        indices : (N, 3) :numpy:`ndarray`
+        """
+
+        return np.stack(
+            np.meshgrid(*[np.arange(n) for n in self.mesh], indexing="ij"), axis=-1
+        ).reshape(-1, 3)
+
+    def _reduce(self):
+        r"""
+        Finds the irreducible points and the map from the full grid to them.
+        """
+
+        mesh = np.array(self.mesh)
+        k = (self._indices() + self.shift) / mesh
+
+        # Smallest index over the star of each point, one operation at a time to keep
+        # the memory linear in the number of points
+        mapping = np.arange(self.N)
+        for rotation, time_reversal in zip(self._rotations, self._time_reversals):
+            image = k @ rotation
+            if time_reversal:
+                image = -image
+
+            image = image * mesh - self.shift
+            rounded = np.rint(image)
+
+            # Operation does not map the grid onto itself
+            if np.any(np.abs(image - rounded) > _GRID_TOLERANCE):
+                continue
+
+            rounded = rounded.astype(int) % mesh
+            image = (rounded[:, 0] * mesh[1] + rounded[:, 1]) * mesh[2] + rounded[:, 2]
+            np.minimum(mapping, image, out=mapping)
+
+        self._irreducible, self._mapping, counts = np.unique(
+            mapping, return_inverse=True, return_counts=True
+        )
+        self._weights = counts / self.N
+
+    def points(self, relative=False):
+        r"""
+        Points of the full grid.
+
+        Parameters
+        ----------
+        relative : bool, default False
+            If ``relative=True``, then the points are returned relative to the
+            reciprocal unit cell. Otherwise they are returned in absolute coordinates.
+
+        Returns
+        -------
+        points : (N, 3) :numpy:`ndarray`
+            Points of the full grid.
+        """
+
+        points = (self._indices() + self.shift) / np.array(self.mesh)
+
+        if relative:
+            return points
+
+        return points @ self.rcell
+
+    def irreducible_points(self, relative=False):
+        r"""
+        Irreducible points of the grid.
+
+        Parameters
+        ----------
+        relative : bool, default False
+            If ``relative=True``, then the points are returned relative to the
+            reciprocal unit cell. Otherwise they are returned in absolute coordinates.
+
+        Returns
+        -------
+        points : (L, 3) :numpy:`ndarray`
+            Irreducible points, ordered as in the full grid.
+        """
+
+        if self._irreducible is None:
+            self._reduce()
+
+        points = (self._indices()[self._irreducible] + self.shift) / np.array(self.mesh)
+
+        if relative:
+            return points
+
+        return points @ self.rcell
+
+    @property
+    def weights(self):
+        r"""
+        Weights of the irreducible points.
+
+        Returns
+        -------
+        weights : (L, ) :numpy:`ndarray`
+            Fraction of the points of the full grid, that are equivalent to each
+            irreducible point. Sum of the weights is one.
+        """
+
+        if self._weights is None:
+            self._reduce()
+
+        return self._weights
+
+    @property
+    def mapping(self):
+        r"""
+        Map from the full grid to the irreducible points.
+
+        Returns
+        -------
+        mapping : (N, ) :numpy:`ndarray`
+            Index of the irreducible point for each point of the full grid.
+        """
+
+        if self._mapping is None:
+            self._reduce()
+
+        return self._mapping
+
+    def expand(self, values):
+        r"""
+        Expands the values from the irreducible points to the full grid.
+
+        Parameters
+        ----------
+        values : (L, ...) |array-like|_
+            Values at the irreducible points.
+
+        Returns
+        -------
+        values : (N, ...) :numpy:`ndarray`
+            Values at the points of the full grid.
+
+        Examples
+        --------
+
+        .. doctest::
+
+            >>> import numpy as np
+            >>> import magnopy
+            >>> spinham = magnopy.examples.cubic_ferro_nn()
+            >>> lswt = magnopy.LSWT(spinham=spinham, spin_directions=[[0, 0, 1]])
+            >>> kgrid = magnopy.KGrid.from_spinham(
+            ...     spinham=spinham, mesh=(4, 4, 4), spin_directions=[[0, 0, 1]]
+            ... )
+            >>> omegas = [lswt.omega(k=k) for k in kgrid.irreducible_points()]
+            >>> kgrid.expand(omegas).shape
+            (64, 1)
+        """
+
+        return np.asarray(values)[self.mapping]
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
@@ -0,0 +1,317 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+
+from magnopy._parallelization import multiprocess_over_k
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+
+def _flag_curvature(t, omegas, scale):
+    r"""
+    Flags the intervals around the points, where the energies deviate from the linear
+    interpolation between the neighboring points.
+
+    Parameters
+    ----------
+    t : (n, ) :numpy:`ndarray`
+        Positions of the points along the segment, sorted.
+    omegas : (n, M) :numpy:`ndarray`
+        Real parts of the magnon energies.
+    scale : float
+        Maximum allowed deviation.
+
+    Returns
+    -------
+    flags : (n - 1, ) :numpy:`ndarray` of bool
+        Whether to bisect each interval.
+    """
+
+    flags = np.zeros(len(t) - 1, dtype=bool)
+
+    if len(t) < 3:
+        return flags
+
+    fraction = ((t[1:-1] - t[:-2]) / (t[2:] - t[:-2]))[:, np.newaxis]
+    linear = omegas[:-2] + (omegas[2:] - omegas[:-2]) * fraction
+
+    error = np.abs(omegas[1:-1] - linear)
+    curved = np.any(np.nan_to_num(error, nan=0.0) > scale, axis=1)
+
+    flags[:-1] |= curved
+    flags[1:] |= curved
+
+    return flags
+
+
+def _flag_mode_order(omegas, G, scale):
+    r"""
+    Flags the intervals, over which the order of the non-degenerate modes changes.
+
+    Modes at the ends of the interval are matched by the overlap of their
+    transformation matrices.
+
+    Parameters
+    ----------
+    omegas : (n, M) :numpy:`ndarray`
+        Real parts of the magnon energies, sorted at each point.
+    G : (n, M, 2M) :numpy:`ndarray`
+        Transformation matrices.
+    scale : float
+        Modes closer than ``scale`` to any other mode are considered degenerate.
+
+    Returns
+    -------
+    flags : (n - 1, ) :numpy:`ndarray` of bool
+        Whether to bisect each interval.
+    """
+
+    M = omegas.shape[1]
+
+    if M < 2:
+        return np.zeros(len(omegas) - 1, dtype=bool)
+
+    # Paraunitary metric of the Colpa transformation
+    sigma = np.concatenate((np.ones(M), -np.ones(M)))
+
+    # (n - 1, M, M)
+    overlaps = np.abs(np.einsum("nij,j,nkj->nik", G[:-1], sigma, np.conjugate(G[1:])))
+    with np.errstate(invalid="ignore"):
+        swapped = np.nan_to_num(overlaps, nan=0.0).argmax(axis=2) != np.arange(M)
+
+    # Distance from each mode to the closest other one
+    gaps = np.diff(omegas, axis=1)
+    gaps = np.minimum(
+        np.concatenate((np.full((len(omegas), 1), np.inf), gaps), axis=1),
+        np.concatenate((gaps, np.full((len(omegas), 1), np.inf)), axis=1),
+    )
+    with np.errstate(invalid="ignore"):
+        separated = gaps > scale
+
+    return np.any(swapped & separated[:-1] & separated[1:], axis=1)
+
+
+def refine_kpath(
+    lswt,
+    kp,
+    n_initial=8,
+    tolerance=1e-3,
+    max_depth=6,
+    number_processors=None,
+):
+    r"""
+    Samples the k-path adaptively, with more points where the magnon energies change
+    rapidly.
+
+    Each segment of the path starts with ``n_initial`` points between the
+    high-symmetry points. Then the intervals are bisected recursively, where the
+    magnon energies deviate from the linear interpolation or where the order of the
+    modes changes. Each k-point is diagonalized only once, new points of each
+    iteration are diagonalized together.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    lswt : :py:class:`.LSWT`
+        Linear spin wave theory.
+    kp : :py:class:`wulfric.Kpoints`
+        K-path. Its ``kp.n`` is ignored.
+    n_initial : int, default 8
+        Number of points between each pair of the high-symmetry points before the
+        refinement.
+    tolerance : float, default 1e-3
+        Tolerance for the refinement, relative to the range of the magnon energies
+        along the path. An interval is bisected if any magnon energy at its ends
+        deviates by more than ``tolerance`` times the range from the linear
+        interpolation between the neighboring points.
+    max_depth : int, default 6
+        Maximum number of bisections of each initial interval. The finest spacing is
+        :math:`2^{\text{max_depth}}` times smaller than the initial one.
+    number_processors : int, optional
+        By default magnopy uses all available processes. Use ``number_processors=1``
+        to run in serial mode.
+
+    Returns
+    -------
+    kpoints : (N, 3) :numpy:`ndarray`
+        K-points in absolute coordinates. As in :py:meth:`wulfric.Kpoints.points`, both
+        ends of each segment are included.
+    flat_points : (N, ) :numpy:`ndarray`
+        Flat coordinates of the k-points, compatible with
+        :py:meth:`wulfric.Kpoints.ticks`.
+    omegas : (N, M) :numpy:`ndarray`
+        Magnon energies, see :py:meth:`.LSWT.diagonalize`.
+    deltas : (N, ) :numpy:`ndarray`
+        Constant energy terms, see :py:meth:`.LSWT.diagonalize`.
+    G : (N, M, 2M) :numpy:`ndarray`
+        Transformation matrices, see :py:meth:`.LSWT.diagonalize`.
+
+    Notes
+    -----
+    Two modes are considered to change their order over the interval, if the
+    transformation matrix of each of them at one end has the largest overlap with the
+    other one at the other end. Modes that are closer to the other modes than
+    ``tolerance`` times the range of energies are considered degenerate and ignored
+    by this criterion.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import numpy as np
+        >>> import magnopy
+        >>> import wulfric
+        >>> spinham = magnopy.examples.cubic_ferro_nn()
+        >>> lswt = magnopy.LSWT(spinham=spinham, spin_directions=[[0, 0, 1]])
+        >>> kp = wulfric.Kpoints.from_crystal(
+        ...     cell=spinham.cell, atoms=spinham.atoms, convention="HPKOT"
+        ... )
+        >>> kpoints, flat_points, omegas, deltas, G = magnopy.refine_kpath(
+        ...     lswt=lswt, kp=kp, number_processors=1
+        ... )
+        >>> bool(np.isclose(flat_points[-1], kp.ticks()[-1]))
+        True
+    """
+
+    if n_initial < 0:
+        raise ValueError(f"Expected non-negative n_initial, got {n_initial}.")
+
+    if max_depth < 0:
+        raise ValueError(f"Expected non-negative max_depth, got {max_depth}.")
+
+    rcell = np.array(kp.rcell, dtype=float)
+
+    # Segments of the path, relative coordinates of their ends
+    segments = []
+    for subpath in kp.path:
+        for i in range(len(subpath) - 1):
+            segments.append(
+                (
+                    np.array(kp.hs_coordinates[subpath[i]], dtype=float),
+                    np.array(kp.hs_coordinates[subpath[i + 1]], dtype=float),
+                )
+            )
+
+    # Positions of the points along each segment, from 0 to 1
+    ts = [np.linspace(0, 1, n_initial + 2) for _ in segments]
+
+    # Results of the diagonalization for each point, shared by all segments
+    cache = {}
+
+    def get_key(k):
+        return tuple(np.round(k, 10) + 0.0)
+
+    def evaluate(points):
+        new = {}
+        for k in points:
+            key = get_key(k)
+            if key not in cache:
+                new[key] = k
+
+        if len(new) == 0:
+            return
+
+        results = multiprocess_over_k(
+            kpoints=np.array(list(new.values())) @ rcell,
+            function=lswt.diagonalize,
+            relative=False,
+            number_processors=number_processors,
+        )
+
+        for key, result in zip(new, results):
+            cache[key] = (
+                np.array(result[0], dtype=complex),
+                complex(result[1]),
+                np.array(result[2], dtype=complex),
+            )
+
+    def get_points(s_i, t):
+        start, end = segments[s_i]
+        return start + t[:, np.newaxis] * (end - start)
+
+    for depth in range(max_depth + 1):
+        evaluate(np.concatenate([get_points(s_i, t) for s_i, t in enumerate(ts)]))
+
+        if depth == max_depth:
+            break
+
+        omegas = [
+            np.array([cache[get_key(k)][0].real for k in get_points(s_i, t)])
+            for s_i, t in enumerate(ts)
+        ]
+
+        finite = np.concatenate(omegas)
+        finite = finite[np.isfinite(finite)]
+        if len(finite) == 0:
+            break
+        scale = tolerance * max(finite.max() - finite.min(), np.finfo(float).eps)
+
+        refined = False
+        for s_i, t in enumerate(ts):
+            G = np.array([cache[get_key(k)][2] for k in get_points(s_i, t)])
+
+            flags = _flag_curvature(t=t, omegas=omegas[s_i], scale=scale)
+            flags |= _flag_mode_order(omegas=omegas[s_i], G=G, scale=scale)
+
+            if np.any(flags):
+                refined = True
+                ts[s_i] = np.sort(
+                    np.concatenate((t, 0.5 * (t[:-1][flags] + t[1:][flags])))
+                )
+
+        if not refined:
+            break
+
+    # Collect the results in the order of the path
+    kpoints = []
+    flat_points = []
+    start_flat = 0.0
+    for s_i, t in enumerate(ts):
+        start, end = segments[s_i]
+        length = np.linalg.norm((end - start) @ rcell)
+
+        kpoints.append(get_points(s_i, t))
+        flat_points.append(start_flat + t * length)
+        start_flat += length
+
+    kpoints = np.concatenate(kpoints)
+    results = [cache[get_key(k)] for k in kpoints]
+
+    return (
+        kpoints @ rcell,
+        np.concatenate(flat_points),
+        np.array([result[0] for result in results]),
+        np.array([result[1] for result in results]),
+        np.array([result[2] for result in results]),
+    )
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
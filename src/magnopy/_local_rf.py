@@ -198,21 +198,78 @@ def span_local_rfs(directional_vectors, hybridize=False):
         array([[ 0.        ,  0.        ,  1.        ],
                [ 0.        ,  0.        , -1.        ],
                [ 0.57735027,  0.57735027,  0.57735027]])
+
+    .. versionchanged:: 0.3.0
+        Computed for all direction vectors at once, without the loop over
+        :py:func:`.span_local_rf`. Results are identical.
     """
 
-    results = []
+    directions = np.array(directional_vectors, dtype=float).reshape(-1, 3)
 
-    for directional_vector in directional_vectors:
-        results.append(
-            span_local_rf(direction_vector=directional_vector, hybridize=hybridize)
-        )
+    if np.any(np.all(np.isclose(directions, 0), axis=1)):
+        raise ValueError("Zero vector.")
 
-    results = np.array(results)
+    directions /= np.sqrt(_row_dot(directions, directions))[:, np.newaxis]
+
+    # Same special cases as in span_local_rf
+    along_z = np.all(np.isclose(directions, [0, 0, 1]), axis=1)
+    opposite_z = np.all(np.isclose(directions, [0, 0, -1]), axis=1) & ~along_z
+    general = ~(along_z | opposite_z)
+
+    x_alphas = np.empty(directions.shape, dtype=float)
+    y_alphas = np.empty(directions.shape, dtype=float)
+
+    x_alphas[along_z] = [1, 0, 0]
+    y_alphas[along_z] = [0, 1, 0]
+    x_alphas[opposite_z] = [0, -1, 0]
+    y_alphas[opposite_z] = [-1, 0, 0]
+
+    z_dir = np.array([0, 0, 1], dtype=float)
+    d = directions[general]
+
+    rotation_axes = np.cross(z_dir, d)
+    sin_rot_angle = np.sqrt(_row_dot(rotation_axes, rotation_axes))
+    cos_rot_angle = _row_dot(d, np.broadcast_to(z_dir, d.shape))
+    # direction vectors and z_dir are unit vectors
+    ux, uy, uz = (rotation_axes / sin_rot_angle[:, np.newaxis]).T
+    # For the arrays ux**2 is computed as ux * ux and for the scalars in span_local_rf
+    # as pow(ux, 2). Results differ in the last digit for some values.
+    ux_2 = np.float_power(ux, 2)
+    uy_2 = np.float_power(uy, 2)
+
+    x_alphas[general] = np.stack(
+        [
+            ux_2 * (1 - cos_rot_angle) + cos_rot_angle,
+            ux * uy * (1 - cos_rot_angle) + uz * sin_rot_angle,
+            ux * uz * (1 - cos_rot_angle) - uy * sin_rot_angle,
+        ],
+        axis=1,
+    )
+    y_alphas[general] = np.stack(
+        [
+            ux * uy * (1 - cos_rot_angle) - uz * sin_rot_angle,
+            uy_2 * (1 - cos_rot_angle) + cos_rot_angle,
+            uy * uz * (1 - cos_rot_angle) + ux * sin_rot_angle,
+        ],
+        axis=1,
+    )
 
     if hybridize:
-        return results[:, 0], results[:, 1]
+        # z_alphas are complex for the compatibility with the previous versions
+        return x_alphas + 1j * y_alphas, directions.astype(complex)
+
+    return x_alphas, y_alphas, directions
+
+
+def _row_dot(a, b):
+    r"""
+    Computes the dot products of the rows of two (M, 3) arrays.
+
+    Uses the same summation as :numpy:`dot` for a single pair of vectors, so that the
+    result is identical to the one of :py:func:`.span_local_rf`.
+    """
 
-    return results[:, 0], results[:, 1], results[:, 2]
+    return np.matmul(a[:, np.newaxis, :], b[:, :, np.newaxis])[:, 0, 0]
 
 
 # Populate __all__ with objects defined in this file
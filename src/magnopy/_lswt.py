@@ -22,9 +22,11 @@
 
 import numpy as np
 
+from magnopy._constants._internal_units import BOHR_MAGNETON
 from magnopy._diagonalization import solve_via_colpa
 from magnopy._exceptions import ColpaFailed
 from magnopy._local_rf import span_local_rfs
+from magnopy._spinham._ewald import _Ewald_dipole_dipole
 
 # Save local scope at this moment
 old_dir = set(dir())
@@ -48,6 +50,17 @@ class LSWT:
         If spin Hamiltonian contains non-magnetic atom, then only the spin directions
         for the magnetic atoms are expected. The order of spin directions is the same as
         the order of magnetic atoms in ``spinham.atoms.spins``.
+    h : (3, ) |array-like|_, optional
+        External magnetic field, given in the units of Tesla. It is added to the
+        Hamiltonian as in :py:meth:`.SpinHamiltonian.add_magnetic_field` for all
+        magnetic atoms, without modification of ``spinham``.
+
+        .. versionadded:: 0.3.0
+
+    Raises
+    ------
+    ValueError
+        If ``h`` is given, but g-factors of the magnetic atoms are not defined.
 
     Attributes
     ----------
@@ -79,7 +92,7 @@ class LSWT:
         >>> lswt = magnopy.LSWT(spinham=spinham, spin_directions=[[0, 0, 1]])
     """
 
-    def __init__(self, spinham, spin_directions):
+    def __init__(self, spinham, spin_directions, h=None):
         spin_directions = np.array(spin_directions, dtype=float)
         spin_directions /= np.linalg.norm(spin_directions, axis=1)[:, np.newaxis]
 
@@ -90,15 +103,26 @@ class LSWT:
 
         self.spins = np.array(spinham.magnetic_atoms.spins, dtype=float)
 
-        initial_convention = spinham.convention
-
-        spinham.convention = initial_convention.get_modified(
-            spin_normalized=False, multiple_counting=True
+        spinham = spinham.view(
+            convention=spinham.convention.get_modified(
+                spin_normalized=False, multiple_counting=True
+            )
         )
 
         self.M = spinham.M
         self.cell = spinham.cell
 
+        # Long-range dipole dipole interaction
+        if spinham._dipole_dipole_ewald is None:
+            self._J_dd = None
+        else:
+            self._J_dd = _Ewald_dipole_dipole(
+                cell=spinham.cell,
+                positions=spinham.magnetic_atoms.positions,
+                g_factors=spinham.magnetic_atoms.get("g_factors"),
+                **spinham._dipole_dipole_ewald,
+            )
+
         ########################################################################
         #                    Renormalized one-spin parameter                   #
         ########################################################################
@@ -258,6 +282,24 @@ class LSWT:
                 * self.spins[epsilon]
             )
 
+        # External magnetic field
+        if h is not None:
+            if "g_factors" not in spinham.magnetic_atoms:
+                raise ValueError(
+                    "Magnetic field requires g-factors of the magnetic atoms, but atoms "
+                    "of the spin Hamiltonian have none."
+                )
+
+            self._J1 = self._J1 + BOHR_MAGNETON * np.outer(
+                spinham.magnetic_atoms.g_factors, np.array(h, dtype=float)
+            )
+
+        # Long-range dipole dipole interaction
+        if self._J_dd is not None:
+            self._J1 = self._J1 + 2 * np.einsum(
+                "abij,bj,b->ai", self._J_dd(k=[0, 0, 0]).real, self.z, self.spins
+            )
+
         ########################################################################
         #                   Renormalized two-spins parameter                   #
         ########################################################################
@@ -401,8 +443,6 @@ class LSWT:
                 * self.spins[epsilon]
             )
 
-        spinham.convention = initial_convention
-
         self.A1 = 0.5 * np.sum(self._J1 * self.z, axis=1)
 
         self.A2 = {}
@@ -583,6 +623,16 @@ class LSWT:
                 phase = k @ (nu @ self.cell)
             result = result + self.A2[nu] * np.exp(1j * phase)
 
+        if self._J_dd is not None:
+            result = result + 0.5 * np.einsum(
+                "abij,a,b,ai,bj->ab",
+                self._J_dd(k=k, relative=relative),
+                np.sqrt(self.spins),
+                np.sqrt(self.spins),
+                self.p,
+                np.conjugate(self.p),
+            )
+
         result = result - np.diag(self.A1)
 
         return result
@@ -667,6 +717,16 @@ class LSWT:
                 phase = k @ (nu @ self.cell)
             result = result + self.B2[nu] * np.exp(1j * phase)
 
+        if self._J_dd is not None:
+            result = result + 0.5 * np.einsum(
+                "abij,a,b,ai,bj->ab",
+                self._J_dd(k=k, relative=relative),
+                np.sqrt(self.spins),
+                np.sqrt(self.spins),
+                np.conjugate(self.p),
+                np.conjugate(self.p),
+            )
+
         result = result
 
         return result
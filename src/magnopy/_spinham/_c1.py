@@ -95,7 +95,6 @@ def _add_1(spinham, alpha: int, parameter, replace=False) -> None:
     """
 
     _validate_atom_index(index=alpha, atoms=spinham.atoms)
-    spinham._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -108,6 +107,7 @@ def _add_1(spinham, alpha: int, parameter, replace=False) -> None:
             # Either replace
             if replace:
                 spinham._1[index] = [alpha, parameter]
+                spinham._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -118,12 +118,14 @@ def _add_1(spinham, alpha: int, parameter, replace=False) -> None:
         # If it should be inserted before current element
         if spinham._1[index][0] > alpha:
             spinham._1.insert(index, [alpha, parameter])
+            spinham._update_counts(added=(alpha,))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     spinham._1.append([alpha, parameter])
+    spinham._update_counts(added=(alpha,))
 
 
 def _remove_1(spinham, alpha: int) -> None:
@@ -153,5 +155,5 @@ def _remove_1(spinham, alpha: int) -> None:
 
         if spinham._1[i][0] == alpha:
             del spinham._1[i]
-            spinham._reset_internals()
+            spinham._update_counts(removed=(alpha,))
             return
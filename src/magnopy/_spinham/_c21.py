@@ -96,7 +96,6 @@ def _add_21(self, alpha: int, parameter, replace=False) -> None:
     """
 
     _validate_atom_index(index=alpha, atoms=self.atoms)
-    self._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -109,6 +108,7 @@ def _add_21(self, alpha: int, parameter, replace=False) -> None:
             # Either replace
             if replace:
                 self._21[index] = [alpha, parameter]
+                self._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -119,12 +119,14 @@ def _add_21(self, alpha: int, parameter, replace=False) -> None:
         # If it should be inserted before current element
         if self._21[index][0] > alpha:
             self._21.insert(index, [alpha, parameter])
+            self._update_counts(added=(alpha,))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     self._21.append([alpha, parameter])
+    self._update_counts(added=(alpha,))
 
 
 def _remove_21(self, alpha: int) -> None:
@@ -154,5 +156,5 @@ def _remove_21(self, alpha: int) -> None:
 
         if self._21[i][0] == alpha:
             del self._21[i]
-            self._reset_internals()
+            self._update_counts(removed=(alpha,))
             return
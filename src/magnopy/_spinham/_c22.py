@@ -22,6 +22,7 @@
 
 import numpy as np
 
+from magnopy._spinham._expanded import _Expanded_iterator
 from magnopy._spinham._validators import (
     _spins_ordered,
     _validate_atom_index,
@@ -77,6 +78,8 @@ class _P22_iterator:
     Iterator over the (two spins & two sites) parameters of the spin Hamiltonian.
     """
 
+    __slots__ = ("container", "mc", "length", "index")
+
     def __init__(self, spinham) -> None:
         self.container = spinham._22
         self.mc = spinham.convention.multiple_counting
@@ -149,6 +152,9 @@ def _p22(spinham):
     remove_22
     """
 
+    if spinham.convention.multiple_counting:
+        return _Expanded_iterator(spinham=spinham, name="22", iterator=_P22_iterator)
+
     return _P22_iterator(spinham)
 
 
@@ -216,7 +222,6 @@ def _add_22(
     _validate_atom_index(index=alpha, atoms=spinham.atoms)
     _validate_atom_index(index=beta, atoms=spinham.atoms)
     _validate_unit_cell_index(ijk=nu)
-    spinham._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -234,6 +239,7 @@ def _add_22(
             # Either replace
             if replace:
                 spinham._22[index] = [alpha, beta, nu, parameter]
+                spinham._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -244,12 +250,14 @@ def _add_22(
         # If it should be inserted before current element
         if spinham._22[index][:3] > [alpha, beta, nu]:
             spinham._22.insert(index, [alpha, beta, nu, parameter])
+            spinham._update_counts(added=(alpha, beta))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     spinham._22.append([alpha, beta, nu, parameter])
+    spinham._update_counts(added=(alpha, beta))
 
 
 def _remove_22(spinham, alpha: int, beta: int, nu: tuple) -> None:
@@ -318,5 +326,5 @@ def _remove_22(spinham, alpha: int, beta: int, nu: tuple) -> None:
 
         if spinham._22[index][:3] == [alpha, beta, nu]:
             del spinham._22[index]
-            spinham._reset_internals()
+            spinham._update_counts(removed=(alpha, beta))
             return
@@ -97,7 +97,6 @@ def _add_31(self, alpha: int, parameter, replace=False) -> None:
     """
 
     _validate_atom_index(index=alpha, atoms=self.atoms)
-    self._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -110,6 +109,7 @@ def _add_31(self, alpha: int, parameter, replace=False) -> None:
             # Either replace
             if replace:
                 self._31[index] = [alpha, parameter]
+                self._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -120,12 +120,14 @@ def _add_31(self, alpha: int, parameter, replace=False) -> None:
         # If it should be inserted before current element
         if self._31[index][0] > alpha:
             self._31.insert(index, [alpha, parameter])
+            self._update_counts(added=(alpha,))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     self._31.append([alpha, parameter])
+    self._update_counts(added=(alpha,))
 
 
 def _remove_31(self, alpha: int) -> None:
@@ -155,5 +157,5 @@ def _remove_31(self, alpha: int) -> None:
 
         if self._31[i][0] == alpha:
             del self._31[i]
-            self._reset_internals()
+            self._update_counts(removed=(alpha,))
             return
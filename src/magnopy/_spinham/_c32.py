@@ -22,6 +22,7 @@
 
 import numpy as np
 
+from magnopy._spinham._expanded import _Expanded_iterator
 from magnopy._spinham._validators import (
     _spins_ordered,
     _validate_atom_index,
@@ -81,6 +82,8 @@ class _P32_iterator:
     Iterator over the (three spins & two sites) parameters of the spin Hamiltonian.
     """
 
+    __slots__ = ("container", "mc", "length", "index", "spins")
+
     def __init__(self, spinham) -> None:
         self.container = spinham._32
         self.mc = spinham.convention.multiple_counting
@@ -162,6 +165,9 @@ def _p32(spinham):
     remove_32
     """
 
+    if spinham.convention.multiple_counting:
+        return _Expanded_iterator(spinham=spinham, name="32", iterator=_P32_iterator)
+
     return _P32_iterator(spinham)
 
 
@@ -228,7 +234,6 @@ def _add_32(
     _validate_atom_index(index=alpha, atoms=spinham.atoms)
     _validate_atom_index(index=beta, atoms=spinham.atoms)
     _validate_unit_cell_index(ijk=nu)
-    spinham._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -251,6 +256,7 @@ def _add_32(
             # Either replace
             if replace:
                 spinham._32[index] = [alpha, beta, nu, parameter]
+                spinham._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -261,12 +267,14 @@ def _add_32(
         # If it should be inserted before current element
         if spinham._32[index][:3] > [alpha, beta, nu]:
             spinham._32.insert(index, [alpha, beta, nu, parameter])
+            spinham._update_counts(added=(alpha, beta))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     spinham._32.append([alpha, beta, nu, parameter])
+    spinham._update_counts(added=(alpha, beta))
 
 
 def _remove_32(spinham, alpha: int, beta: int, nu: tuple) -> None:
@@ -334,5 +342,5 @@ def _remove_32(spinham, alpha: int, beta: int, nu: tuple) -> None:
 
         if spinham._32[index][:3] == [alpha, beta, nu]:
             del spinham._32[index]
-            spinham._reset_internals()
+            spinham._update_counts(removed=(alpha, beta))
             return
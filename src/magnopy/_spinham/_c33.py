@@ -22,6 +22,7 @@
 
 import numpy as np
 
+from magnopy._spinham._expanded import _Expanded_iterator
 from magnopy._spinham._validators import (
     _spins_ordered,
     _validate_atom_index,
@@ -141,6 +142,8 @@ class _P33_iterator:
     Iterator over the (three spins & three sites) parameters of the spin Hamiltonian.
     """
 
+    __slots__ = ("container", "mc", "length", "index")
+
     def __init__(self, spinham) -> None:
         self.container = spinham._33
         self.mc = spinham.convention.multiple_counting
@@ -303,6 +306,9 @@ def _p33(spinham):
     remove_33
     """
 
+    if spinham.convention.multiple_counting:
+        return _Expanded_iterator(spinham=spinham, name="33", iterator=_P33_iterator)
+
     return _P33_iterator(spinham)
 
 
@@ -391,7 +397,6 @@ def _add_33(
     _validate_atom_index(index=gamma, atoms=spinham.atoms)
     _validate_unit_cell_index(ijk=nu)
     _validate_unit_cell_index(ijk=_lambda)
-    spinham._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -409,6 +414,7 @@ def _add_33(
             # Either replace
             if replace:
                 spinham._33[index] = [alpha, beta, gamma, nu, _lambda, parameter]
+                spinham._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -419,12 +425,14 @@ def _add_33(
         # If it should be inserted before current element
         if spinham._33[index][:5] > [alpha, beta, gamma, nu, _lambda]:
             spinham._33.insert(index, [alpha, beta, gamma, nu, _lambda, parameter])
+            spinham._update_counts(added=(alpha, beta, gamma))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     spinham._33.append([alpha, beta, gamma, nu, _lambda, parameter])
+    spinham._update_counts(added=(alpha, beta, gamma))
 
 
 def _remove_33(
@@ -506,5 +514,5 @@ def _remove_33(
 
         if spinham._33[index][:5] == [alpha, beta, gamma, nu, _lambda]:
             del spinham._33[index]
-            spinham._reset_internals()
+            spinham._update_counts(removed=(alpha, beta, gamma))
             return
@@ -98,7 +98,6 @@ def _add_41(self, alpha: int, parameter, replace=False) -> None:
     """
 
     _validate_atom_index(index=alpha, atoms=self.atoms)
-    self._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -111,6 +110,7 @@ def _add_41(self, alpha: int, parameter, replace=False) -> None:
             # Either replace
             if replace:
                 self._41[index] = [alpha, parameter]
+                self._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -121,12 +121,14 @@ def _add_41(self, alpha: int, parameter, replace=False) -> None:
         # If it should be inserted before current element
         if self._41[index][0] > alpha:
             self._41.insert(index, [alpha, parameter])
+            self._update_counts(added=(alpha,))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     self._41.append([alpha, parameter])
+    self._update_counts(added=(alpha,))
 
 
 def _remove_41(self, alpha: int) -> None:
@@ -156,5 +158,5 @@ def _remove_41(self, alpha: int) -> None:
 
         if self._41[i][0] == alpha:
             del self._41[i]
-            self._reset_internals()
+            self._update_counts(removed=(alpha,))
             return
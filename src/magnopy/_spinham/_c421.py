@@ -22,6 +22,7 @@
 
 import numpy as np
 
+from magnopy._spinham._expanded import _Expanded_iterator
 from magnopy._spinham._validators import (
     _spins_ordered,
     _validate_atom_index,
@@ -81,6 +82,8 @@ class _P421_iterator:
     Iterator over the (four spins & two sites (3+1)) parameters of the spin Hamiltonian.
     """
 
+    __slots__ = ("container", "mc", "length", "index", "spins")
+
     def __init__(self, spinham) -> None:
         self.container = spinham._421
         self.mc = spinham.convention.multiple_counting
@@ -162,6 +165,9 @@ def _p421(spinham):
     remove_421
     """
 
+    if spinham.convention.multiple_counting:
+        return _Expanded_iterator(spinham=spinham, name="421", iterator=_P421_iterator)
+
     return _P421_iterator(spinham)
 
 
@@ -228,7 +234,6 @@ def _add_421(
     _validate_atom_index(index=alpha, atoms=spinham.atoms)
     _validate_atom_index(index=beta, atoms=spinham.atoms)
     _validate_unit_cell_index(ijk=nu)
-    spinham._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -251,6 +256,7 @@ def _add_421(
             # Either replace
             if replace:
                 spinham._421[index] = [alpha, beta, nu, parameter]
+                spinham._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -261,12 +267,14 @@ def _add_421(
         # If it should be inserted before current element
         if spinham._421[index][:3] > [alpha, beta, nu]:
             spinham._421.insert(index, [alpha, beta, nu, parameter])
+            spinham._update_counts(added=(alpha, beta))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     spinham._421.append([alpha, beta, nu, parameter])
+    spinham._update_counts(added=(alpha, beta))
 
 
 def _remove_421(spinham, alpha: int, beta: int, nu: tuple) -> None:
@@ -334,5 +342,5 @@ def _remove_421(spinham, alpha: int, beta: int, nu: tuple) -> None:
 
         if spinham._421[index][:3] == [alpha, beta, nu]:
             del spinham._421[index]
-            spinham._reset_internals()
+            spinham._update_counts(removed=(alpha, beta))
             return
@@ -22,6 +22,7 @@
 
 import numpy as np
 
+from magnopy._spinham._expanded import _Expanded_iterator
 from magnopy._spinham._validators import (
     _spins_ordered,
     _validate_atom_index,
@@ -77,6 +78,8 @@ class _P422_iterator:
     Iterator over the (four spins & two sites (2+2)) parameters of the spin Hamiltonian.
     """
 
+    __slots__ = ("container", "mc", "length", "index")
+
     def __init__(self, spinham) -> None:
         self.container = spinham._422
         self.mc = spinham.convention.multiple_counting
@@ -151,6 +154,9 @@ def _p422(spinham):
     remove_422
     """
 
+    if spinham.convention.multiple_counting:
+        return _Expanded_iterator(spinham=spinham, name="422", iterator=_P422_iterator)
+
     return _P422_iterator(spinham)
 
 
@@ -217,7 +223,6 @@ def _add_422(
     _validate_atom_index(index=alpha, atoms=spinham.atoms)
     _validate_atom_index(index=beta, atoms=spinham.atoms)
     _validate_unit_cell_index(ijk=nu)
-    spinham._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -235,6 +240,7 @@ def _add_422(
             # Either replace
             if replace:
                 spinham._422[index] = [alpha, beta, nu, parameter]
+                spinham._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -245,12 +251,14 @@ def _add_422(
         # If it should be inserted before current element
         if spinham._422[index][:3] > [alpha, beta, nu]:
             spinham._422.insert(index, [alpha, beta, nu, parameter])
+            spinham._update_counts(added=(alpha, beta))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     spinham._422.append([alpha, beta, nu, parameter])
+    spinham._update_counts(added=(alpha, beta))
 
 
 def _remove_422(spinham, alpha: int, beta: int, nu: tuple) -> None:
@@ -318,5 +326,5 @@ def _remove_422(spinham, alpha: int, beta: int, nu: tuple) -> None:
 
         if spinham._422[index][:3] == [alpha, beta, nu]:
             del spinham._422[index]
-            spinham._reset_internals()
+            spinham._update_counts(removed=(alpha, beta))
             return
@@ -22,6 +22,7 @@
 
 import numpy as np
 
+from magnopy._spinham._expanded import _Expanded_iterator
 from magnopy._spinham._validators import (
     _spins_ordered,
     _validate_atom_index,
@@ -157,6 +158,8 @@ class _P43_iterator:
     Iterator over the (four spins & three sites) parameters of the spin Hamiltonian.
     """
 
+    __slots__ = ("container", "mc", "length", "index", "spins")
+
     def __init__(self, spinham) -> None:
         self.container = spinham._43
         self.mc = spinham.convention.multiple_counting
@@ -329,6 +332,9 @@ def _p43(spinham):
     remove_43
     """
 
+    if spinham.convention.multiple_counting:
+        return _Expanded_iterator(spinham=spinham, name="43", iterator=_P43_iterator)
+
     return _P43_iterator(spinham)
 
 
@@ -417,7 +423,6 @@ def _add_43(
     _validate_atom_index(index=gamma, atoms=spinham.atoms)
     _validate_unit_cell_index(ijk=nu)
     _validate_unit_cell_index(ijk=_lambda)
-    spinham._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -443,6 +448,7 @@ def _add_43(
             # Either replace
             if replace:
                 spinham._43[index] = [alpha, beta, gamma, nu, _lambda, parameter]
+                spinham._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -453,12 +459,14 @@ def _add_43(
         # If it should be inserted before current element
         if spinham._43[index][:5] > [alpha, beta, gamma, nu, _lambda]:
             spinham._43.insert(index, [alpha, beta, gamma, nu, _lambda, parameter])
+            spinham._update_counts(added=(alpha, beta, gamma))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     spinham._43.append([alpha, beta, gamma, nu, _lambda, parameter])
+    spinham._update_counts(added=(alpha, beta, gamma))
 
 
 def _remove_43(
@@ -540,5 +548,5 @@ def _remove_43(
 
         if spinham._43[index][:5] == [alpha, beta, gamma, nu, _lambda]:
             del spinham._43[index]
-            spinham._reset_internals()
+            spinham._update_counts(removed=(alpha, beta, gamma))
             return
@@ -22,6 +22,7 @@
 
 import numpy as np
 
+from magnopy._spinham._expanded import _Expanded_iterator
 from magnopy._spinham._validators import (
     _spins_ordered,
     _validate_atom_index,
@@ -138,7 +139,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         alpha, beta, gamma, epsilon = alpha, gamma, epsilon, beta
         nu, _lambda, rho = _lambda, rho, nu
         if parameter is not None:
-            parameter = np.transpose(parameter, (0, 3, 1, 2))
+            parameter = np.transpose(parameter, (0, 2, 3, 1))
     # Case 5
     elif _ordered(
         mu1=(0, 0, 0),
@@ -153,7 +154,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         alpha, beta, gamma, epsilon = alpha, epsilon, beta, gamma
         nu, _lambda, rho = rho, nu, _lambda
         if parameter is not None:
-            parameter = np.transpose(parameter, (0, 2, 3, 1))
+            parameter = np.transpose(parameter, (0, 3, 1, 2))
     # Case 6
     elif _ordered(
         mu1=(0, 0, 0),
@@ -228,7 +229,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (-nu1, -nu2, -nu3)
         rho = (rho1 - nu1, rho2 - nu2, rho3 - nu3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (2, 0, 1, 3))
+            parameter = np.transpose(parameter, (1, 2, 0, 3))
     # Case 10
     elif _ordered(
         mu1=nu,
@@ -248,7 +249,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (rho1 - nu1, rho2 - nu2, rho3 - nu3)
         rho = (-nu1, -nu2, -nu3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (3, 0, 1, 2))
+            parameter = np.transpose(parameter, (1, 2, 3, 0))
     # Case 11
     elif _ordered(
         mu1=nu,
@@ -268,7 +269,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (-nu1, -nu2, -nu3)
         rho = (lambda1 - nu1, lambda2 - nu2, lambda3 - nu3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (2, 0, 3, 1))
+            parameter = np.transpose(parameter, (1, 3, 0, 2))
     # Case 12
     elif _ordered(
         mu1=nu,
@@ -288,7 +289,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (lambda1 - nu1, lambda2 - nu2, lambda3 - nu3)
         rho = (-nu1, -nu2, -nu3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (3, 0, 2, 1))
+            parameter = np.transpose(parameter, (1, 3, 2, 0))
     # Case 13
     elif _ordered(
         mu1=_lambda,
@@ -308,7 +309,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (nu1 - lambda1, nu2 - lambda2, nu3 - lambda3)
         rho = (rho1 - lambda1, rho2 - lambda2, rho3 - lambda3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (1, 2, 0, 3))
+            parameter = np.transpose(parameter, (2, 0, 1, 3))
     # Case 14
     elif _ordered(
         mu1=_lambda,
@@ -328,7 +329,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (rho1 - lambda1, rho2 - lambda2, rho3 - lambda3)
         rho = (nu1 - lambda1, nu2 - lambda2, nu3 - lambda3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (1, 3, 0, 2))
+            parameter = np.transpose(parameter, (2, 0, 3, 1))
     # Case 15
     elif _ordered(
         mu1=_lambda,
@@ -368,7 +369,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (rho1 - lambda1, rho2 - lambda2, rho3 - lambda3)
         rho = (-lambda1, -lambda2, -lambda3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (3, 1, 0, 2))
+            parameter = np.transpose(parameter, (2, 1, 3, 0))
     # Case 17
     elif _ordered(
         mu1=_lambda,
@@ -408,7 +409,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (nu1 - lambda1, nu2 - lambda2, nu3 - lambda3)
         rho = (-lambda1, -lambda2, -lambda3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (3, 2, 0, 1))
+            parameter = np.transpose(parameter, (2, 3, 1, 0))
     # Case 19
     elif _ordered(
         mu1=rho,
@@ -428,7 +429,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (nu1 - rho1, nu2 - rho2, nu3 - rho3)
         rho = (lambda1 - rho1, lambda2 - rho2, lambda3 - rho3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (1, 2, 3, 0))
+            parameter = np.transpose(parameter, (3, 0, 1, 2))
     # Case 20
     elif _ordered(
         mu1=rho,
@@ -448,7 +449,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (lambda1 - rho1, lambda2 - rho2, lambda3 - rho3)
         rho = (nu1 - rho1, nu2 - rho2, nu3 - rho3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (1, 3, 2, 0))
+            parameter = np.transpose(parameter, (3, 0, 2, 1))
     # Case 21
     elif _ordered(
         mu1=rho,
@@ -468,7 +469,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (-rho1, -rho2, -rho3)
         rho = (lambda1 - rho1, lambda2 - rho2, lambda3 - rho3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (2, 1, 3, 0))
+            parameter = np.transpose(parameter, (3, 1, 0, 2))
     # Case 22
     elif _ordered(
         mu1=rho,
@@ -500,7 +501,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         mu4=nu,
         alpha4=beta,
     ):
-        alpha, beta, gamma, epsilon = epsilon, beta, gamma, alpha
+        alpha, beta, gamma, epsilon = epsilon, gamma, alpha, beta
         nu1, nu2, nu3 = nu
         lambda1, lambda2, lambda3 = _lambda
         rho1, rho2, rho3 = rho
@@ -508,7 +509,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         _lambda = (-rho1, -rho2, -rho3)
         rho = (nu1 - rho1, nu2 - rho2, nu3 - rho3)
         if parameter is not None:
-            parameter = np.transpose(parameter, (2, 3, 1, 0))
+            parameter = np.transpose(parameter, (3, 2, 0, 1))
     # Case 24
     elif _ordered(
         mu1=rho,
@@ -520,7 +521,7 @@ def _get_primary_p44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=No
         mu4=(0, 0, 0),
         alpha4=alpha,
     ):
-        alpha, beta, gamma, epsilon = epsilon, beta, gamma, alpha
+        alpha, beta, gamma, epsilon = epsilon, gamma, beta, alpha
         nu1, nu2, nu3 = nu
         lambda1, lambda2, lambda3 = _lambda
         rho1, rho2, rho3 = rho
@@ -541,6 +542,8 @@ class _P44_iterator:
     Iterator over the (four spins & four sites) parameters of the spin Hamiltonian.
     """
 
+    __slots__ = ("container", "mc", "length", "index")
+
     def __init__(self, spinham) -> None:
         self.container = spinham._44
         self.mc = spinham.convention.multiple_counting
@@ -598,7 +601,7 @@ class _P44_iterator:
                 _lambda,
                 rho,
                 nu,
-                np.transpose(parameter, (0, 3, 1, 2)),
+                np.transpose(parameter, (0, 2, 3, 1)),
             ]
         # Case 5
         elif self.mc and self.index < 5 * self.length:
@@ -614,7 +617,7 @@ class _P44_iterator:
                 rho,
                 nu,
                 _lambda,
-                np.transpose(parameter, (0, 2, 3, 1)),
+                np.transpose(parameter, (0, 3, 1, 2)),
             ]
         # Case 6
         elif self.mc and self.index < 6 * self.length:
@@ -699,7 +702,7 @@ class _P44_iterator:
                 (lambda1 - nu1, lambda2 - nu2, lambda3 - nu3),
                 (-nu1, -nu2, -nu3),
                 (rho1 - nu1, rho2 - nu2, rho3 - nu3),
-                np.transpose(parameter, (2, 0, 1, 3)),
+                np.transpose(parameter, (1, 2, 0, 3)),
             ]
         # Case 10
         elif self.mc and self.index < 10 * self.length:
@@ -722,7 +725,7 @@ class _P44_iterator:
                 (lambda1 - nu1, lambda2 - nu2, lambda3 - nu3),
                 (rho1 - nu1, rho2 - nu2, rho3 - nu3),
                 (-nu1, -nu2, -nu3),
-                np.transpose(parameter, (3, 0, 1, 2)),
+                np.transpose(parameter, (1, 2, 3, 0)),
             ]
         # Case 11
         elif self.mc and self.index < 11 * self.length:
@@ -745,7 +748,7 @@ class _P44_iterator:
                 (rho1 - nu1, rho2 - nu2, rho3 - nu3),
                 (-nu1, -nu2, -nu3),
                 (lambda1 - nu1, lambda2 - nu2, lambda3 - nu3),
-                np.transpose(parameter, (2, 0, 3, 1)),
+                np.transpose(parameter, (1, 3, 0, 2)),
             ]
         # Case 12
         elif self.mc and self.index < 12 * self.length:
@@ -768,7 +771,7 @@ class _P44_iterator:
                 (rho1 - nu1, rho2 - nu2, rho3 - nu3),
                 (lambda1 - nu1, lambda2 - nu2, lambda3 - nu3),
                 (-nu1, -nu2, -nu3),
-                np.transpose(parameter, (3, 0, 2, 1)),
+                np.transpose(parameter, (1, 3, 2, 0)),
             ]
         # Case 13
         elif self.mc and self.index < 13 * self.length:
@@ -791,7 +794,7 @@ class _P44_iterator:
                 (-lambda1, -lambda2, -lambda3),
                 (nu1 - lambda1, nu2 - lambda2, nu3 - lambda3),
                 (rho1 - lambda1, rho2 - lambda2, rho3 - lambda3),
-                np.transpose(parameter, (1, 2, 0, 3)),
+                np.transpose(parameter, (2, 0, 1, 3)),
             ]
         # Case 14
         elif self.mc and self.index < 14 * self.length:
@@ -814,7 +817,7 @@ class _P44_iterator:
                 (-lambda1, -lambda2, -lambda3),
                 (rho1 - lambda1, rho2 - lambda2, rho3 - lambda3),
                 (nu1 - lambda1, nu2 - lambda2, nu3 - lambda3),
-                np.transpose(parameter, (1, 3, 0, 2)),
+                np.transpose(parameter, (2, 0, 3, 1)),
             ]
         # Case 15
         elif self.mc and self.index < 15 * self.length:
@@ -860,7 +863,7 @@ class _P44_iterator:
                 (nu1 - lambda1, nu2 - lambda2, nu3 - lambda3),
                 (rho1 - lambda1, rho2 - lambda2, rho3 - lambda3),
                 (-lambda1, -lambda2, -lambda3),
-                np.transpose(parameter, (3, 1, 0, 2)),
+                np.transpose(parameter, (2, 1, 3, 0)),
             ]
         # Case 17
         elif self.mc and self.index < 17 * self.length:
@@ -906,7 +909,7 @@ class _P44_iterator:
                 (rho1 - lambda1, rho2 - lambda2, rho3 - lambda3),
                 (nu1 - lambda1, nu2 - lambda2, nu3 - lambda3),
                 (-lambda1, -lambda2, -lambda3),
-                np.transpose(parameter, (3, 2, 0, 1)),
+                np.transpose(parameter, (2, 3, 1, 0)),
             ]
         # Case 19
         elif self.mc and self.index < 19 * self.length:
@@ -929,7 +932,7 @@ class _P44_iterator:
                 (-rho1, -rho2, -rho3),
                 (nu1 - rho1, nu2 - rho2, nu3 - rho3),
                 (lambda1 - rho1, lambda2 - rho2, lambda3 - rho3),
-                np.transpose(parameter, (1, 2, 3, 0)),
+                np.transpose(parameter, (3, 0, 1, 2)),
             ]
         # Case 20
         elif self.mc and self.index < 20 * self.length:
@@ -952,7 +955,7 @@ class _P44_iterator:
                 (-rho1, -rho2, -rho3),
                 (lambda1 - rho1, lambda2 - rho2, lambda3 - rho3),
                 (nu1 - rho1, nu2 - rho2, nu3 - rho3),
-                np.transpose(parameter, (1, 3, 2, 0)),
+                np.transpose(parameter, (3, 0, 2, 1)),
             ]
         # Case 21
         elif self.mc and self.index < 21 * self.length:
@@ -975,7 +978,7 @@ class _P44_iterator:
                 (nu1 - rho1, nu2 - rho2, nu3 - rho3),
                 (-rho1, -rho2, -rho3),
                 (lambda1 - rho1, lambda2 - rho2, lambda3 - rho3),
-                np.transpose(parameter, (2, 1, 3, 0)),
+                np.transpose(parameter, (3, 1, 0, 2)),
             ]
         # Case 22
         elif self.mc and self.index < 22 * self.length:
@@ -1015,13 +1018,13 @@ class _P44_iterator:
             ) = self.container[self.index - 1 - 22 * self.length]
             return [
                 epsilon,
-                beta,
                 gamma,
                 alpha,
+                beta,
                 (lambda1 - rho1, lambda2 - rho2, lambda3 - rho3),
                 (-rho1, -rho2, -rho3),
                 (nu1 - rho1, nu2 - rho2, nu3 - rho3),
-                np.transpose(parameter, (2, 3, 1, 0)),
+                np.transpose(parameter, (3, 2, 0, 1)),
             ]
         # Case 24
         elif self.mc and self.index < 24 * self.length:
@@ -1038,8 +1041,8 @@ class _P44_iterator:
             ) = self.container[self.index - 1 - 23 * self.length]
             return [
                 epsilon,
-                beta,
                 gamma,
+                beta,
                 alpha,
                 (lambda1 - rho1, lambda2 - rho2, lambda3 - rho3),
                 (nu1 - rho1, nu2 - rho2, nu3 - rho3),
@@ -1113,6 +1116,9 @@ def _p44(spinham):
     remove_44
     """
 
+    if spinham.convention.multiple_counting:
+        return _Expanded_iterator(spinham=spinham, name="44", iterator=_P44_iterator)
+
     return _P44_iterator(spinham)
 
 
@@ -1218,7 +1224,6 @@ def _add_44(
     _validate_unit_cell_index(ijk=nu)
     _validate_unit_cell_index(ijk=_lambda)
     _validate_unit_cell_index(ijk=rho)
-    spinham._reset_internals()
 
     parameter = np.array(parameter)
 
@@ -1252,6 +1257,7 @@ def _add_44(
                     rho,
                     parameter,
                 ]
+                spinham._update_counts()
                 return
             # Or raise an error
             raise ValueError(
@@ -1264,12 +1270,14 @@ def _add_44(
             spinham._44.insert(
                 index, [alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter]
             )
+            spinham._update_counts(added=(alpha, beta, gamma, epsilon))
             return
 
         index += 1
 
     # If it should be inserted at the end or at the beginning of the list
     spinham._44.append([alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter])
+    spinham._update_counts(added=(alpha, beta, gamma, epsilon))
 
 
 def _remove_44(
@@ -1379,5 +1387,5 @@ def _remove_44(
 
         if spinham._44[index][:7] == [alpha, beta, gamma, epsilon, nu, _lambda, rho]:
             del spinham._44[index]
-            spinham._reset_internals()
+            spinham._update_counts(removed=(alpha, beta, gamma, epsilon))
             return
@@ -0,0 +1,370 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+from math import ceil, erfc
+
+import numpy as np
+
+# meV * Angstrom^3, same constant as in SpinHamiltonian.add_dipole_dipole
+MU_0_MU_B = 1.256637061 * 9.2740100657**2 * 6.241509074 / 1000
+
+# Maximum number of (alpha, beta, nu) triples, that are processed at once in the real
+# space part
+_CHUNK_SIZE = 2**20
+
+# Maximum number of non-zero terms of the real space part, that are kept in memory
+# between the calls
+_CACHE_SIZE = 2**21
+
+_erfc = np.vectorize(erfc, otypes=[float])
+
+
+def _get_lattice_points(cell, radius):
+    r"""
+    Returns indices of all lattice points, that are not further than ``radius`` from
+    any point of the (0, 0, 0) unit cell.
+
+    Parameters
+    ----------
+    cell : (3, 3) :numpy:`ndarray`
+        Matrix of the cell, rows are lattice vectors.
+    radius : float
+        Radius of the sphere.
+
+    Returns
+    -------
+    nus : (N, 3) :numpy:`ndarray`
+        Indices of the lattice points.
+    """
+
+    a1, a2, a3 = cell
+    volume = abs(np.linalg.det(cell))
+
+    # Distances between the opposite faces of the cell
+    m_1_max = ceil(radius * np.linalg.norm(np.cross(a2, a3)) / volume) + 1
+    m_2_max = ceil(radius * np.linalg.norm(np.cross(a3, a1)) / volume) + 1
+    m_3_max = ceil(radius * np.linalg.norm(np.cross(a1, a2)) / volume) + 1
+
+    return np.stack(
+        np.meshgrid(
+            np.arange(-m_1_max, m_1_max + 1),
+            np.arange(-m_2_max, m_2_max + 1),
+            np.arange(-m_3_max, m_3_max + 1),
+            indexing="ij",
+        ),
+        axis=-1,
+    ).reshape(-1, 3)
+
+
+class _Ewald_dipole_dipole:
+    r"""
+    Lattice sum of the magnetic dipole dipole interaction, computed with the Ewald
+    method.
+
+    Computes
+
+    .. math::
+
+        D_{\alpha\beta}^{ij}(\boldsymbol{k})
+        =
+        \sum_{\nu}
+        C_{2,2}
+        J_{dd}(\boldsymbol{r}_{\nu,\alpha\beta})^{ij}
+        e^{i\boldsymbol{k}\boldsymbol{r}_{\nu}}
+
+        J_{dd}(\boldsymbol{r}_{\nu,\alpha\beta})^{ij}
+        =
+        \dfrac{\mu_0\mu_B^2}{8\pi C_{2,2}}
+        \dfrac{g_{\alpha}g_{\beta}}{\vert\boldsymbol{r}_{\nu,\alpha\beta}\vert^3}
+        (\delta_{i,j} - 3\hat{r}_{\nu,\alpha\beta}^i\hat{r}_{\nu,\alpha\beta}^j)
+
+    where the sum runs over all lattice vectors. This is the parameter of
+    :py:meth:`.SpinHamiltonian.add_dipole_dipole` with
+    ``multiple_counting=True``, summed with ``R_cut`` going to infinity. For
+    :math:`\boldsymbol{k} = 0` the conditionally convergent sum is taken over the
+    growing spheres, as in :py:meth:`.SpinHamiltonian.add_dipole_dipole`.
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of the cell, rows are lattice vectors.
+    positions : (M, 3) |array-like|_
+        Relative positions of the magnetic atoms.
+    g_factors : (M, ) |array-like|_
+        g-factors of the magnetic atoms.
+    tolerance : float
+        Desired relative accuracy of the lattice sums. Both real space and
+        reciprocal space sums are truncated where their terms decay below it.
+    factor : float, default 1
+        Additional scaling factor of the interaction.
+    eta : float, optional
+        Splitting parameter of the Ewald method, in inverse Angstroms. Result does not
+        depend on it. By default it is chosen based on the volume of the cell.
+
+    Raises
+    ------
+    ValueError
+        If ``g_factors`` is ``None``.
+
+    Notes
+    -----
+    Real space part is processed in chunks of the first atom, each chunk holds at most
+    ``_CHUNK_SIZE`` pairs of atoms and lattice points. Only the terms within the
+    cut-off radius are kept. They are computed once if there are no more than
+    ``_CACHE_SIZE`` of them, otherwise they are recomputed for each
+    :math:`\boldsymbol{k}`. Memory does not grow as :math:`M^2` in either case.
+    """
+
+    __slots__ = (
+        "cell",
+        "reciprocal_cell",
+        "volume",
+        "M",
+        "eta",
+        "prefactor",
+        "r_cut",
+        "nus",
+        "chunk",
+        "real_space",
+        "gs",
+        "positions",
+        "self_term",
+    )
+
+    def __init__(
+        self, cell, positions, g_factors, tolerance, factor=1.0, eta=None
+    ) -> None:
+        self.cell = np.array(cell, dtype=float)
+        self.reciprocal_cell = 2 * np.pi * np.linalg.inv(self.cell).T
+        self.volume = abs(np.linalg.det(self.cell))
+
+        if g_factors is None:
+            raise ValueError(
+                "Dipole dipole interaction requires g-factors of the magnetic atoms, "
+                "but none are given."
+            )
+
+        positions = np.array(positions, dtype=float).reshape(-1, 3)
+        g_factors = np.array(g_factors, dtype=float)
+        self.M = len(positions)
+
+        if eta is None:
+            eta = np.sqrt(np.pi) / self.volume ** (1 / 3)
+        self.eta = float(eta)
+
+        # Both real space and reciprocal space terms decay as exp(-p^2)
+        p = np.sqrt(-np.log(tolerance))
+        self.r_cut = p / self.eta
+        g_cut = 2 * p * self.eta
+
+        # (M, M)
+        self.prefactor = factor * MU_0_MU_B / 8 / np.pi * np.outer(g_factors, g_factors)
+
+        # Cartesian positions of the atoms of the (0, 0, 0) unit cell, (M, 3)
+        self.positions = positions @ self.cell
+
+        ########################################################################
+        #                            Real space part                           #
+        ########################################################################
+        self.nus = _get_lattice_points(cell=self.cell, radius=self.r_cut)
+        self.chunk = max(1, _CHUNK_SIZE // (self.M * len(self.nus)))
+
+        self.real_space = []
+        n_terms = 0
+        for terms in self._real_space_terms():
+            n_terms += len(terms[2])
+            if n_terms > _CACHE_SIZE:
+                self.real_space = None
+                break
+            self.real_space.append(terms)
+
+        ########################################################################
+        #                         Reciprocal space part                        #
+        ########################################################################
+        # k is reduced to the first unit cell of the reciprocal lattice, therefore
+        # the cut-off is increased by the size of that cell.
+        g_max = g_cut + np.linalg.norm(self.reciprocal_cell, axis=1).sum() / 2
+        gs = _get_lattice_points(cell=self.reciprocal_cell, radius=g_max)
+        gs = gs @ self.reciprocal_cell
+        self.gs = gs[np.linalg.norm(gs, axis=1) <= g_max]
+
+        ########################################################################
+        #                               Self term                              #
+        ########################################################################
+        self.self_term = 4 * self.eta**3 / 3 / np.sqrt(np.pi)
+
+    def _real_space_terms(self):
+        r"""
+        Yields non-zero terms of the real space part for the chunks of the first atom.
+
+        Yields
+        ------
+        start : int
+            Index of the first atom of the chunk.
+        pairs : (n, ) :numpy:`ndarray`
+            Flat indices of the pairs of atoms ``(alpha - start) * M + beta``.
+        nus : (n, ) :numpy:`ndarray`
+            Indices of the lattice points.
+        b_terms : (n, ) :numpy:`ndarray`
+            Isotropic parts of the terms.
+        c_terms : (n, ) :numpy:`ndarray`
+            Anisotropic parts of the terms.
+        vectors : (n, 3) :numpy:`ndarray`
+            Vectors between the atoms.
+        """
+
+        lattice_vectors = self.nus @ self.cell
+
+        for start in range(0, self.M, self.chunk):
+            # (m, M, N, 3)
+            vectors = (
+                self.positions[np.newaxis, :, np.newaxis, :]
+                - self.positions[start : start + self.chunk, np.newaxis, np.newaxis, :]
+                + lattice_vectors[np.newaxis, np.newaxis, :, :]
+            )
+            distances = np.linalg.norm(vectors, axis=-1)
+
+            mask = (distances <= self.r_cut) & (distances > 0)
+            alphas, betas, nus = np.nonzero(mask)
+            vectors = vectors[mask]
+            distances = distances[mask]
+
+            eta_r = self.eta * distances
+            gaussian = 2 * eta_r / np.sqrt(np.pi) * np.exp(-(eta_r**2))
+            erfc_r = _erfc(eta_r) if len(eta_r) > 0 else eta_r
+
+            yield (
+                start,
+                alphas * self.M + betas,
+                nus,
+                (erfc_r + gaussian) / distances**3,
+                (3 * erfc_r + gaussian * (3 + 2 * eta_r**2)) / distances**5,
+                vectors,
+            )
+
+    def _real_space_sum(self, phases):
+        r"""
+        Computes the real space part.
+
+        Parameters
+        ----------
+        phases : (N, ) :numpy:`ndarray`
+            Phase factors of the lattice points.
+
+        Returns
+        -------
+        result : (M, M, 3, 3) :numpy:`ndarray`
+            Real space part. Elements are complex numbers.
+        """
+
+        def accumulate(pairs, weights, size):
+            return np.bincount(pairs, weights.real, size) + 1j * np.bincount(
+                pairs, weights.imag, size
+            )
+
+        result = np.zeros((self.M, self.M, 3, 3), dtype=complex)
+
+        if self.real_space is None:
+            terms = self._real_space_terms()
+        else:
+            terms = self.real_space
+
+        for start, pairs, nus, b_terms, c_terms, vectors in terms:
+            size = (min(start + self.chunk, self.M) - start) * self.M
+            part = result[start : start + self.chunk].reshape(size, 3, 3)
+
+            b_terms = b_terms * phases[nus]
+            c_terms = c_terms * phases[nus]
+
+            diagonal = accumulate(pairs, b_terms, size)
+            for i in range(3):
+                for j in range(i, 3):
+                    part[:, i, j] = -accumulate(
+                        pairs, c_terms * vectors[:, i] * vectors[:, j], size
+                    )
+                    part[:, j, i] = part[:, i, j]
+                part[:, i, i] += diagonal
+
+        return result
+
+    def __call__(self, k, relative=False):
+        r"""
+        Computes the lattice sum.
+
+        Parameters
+        ----------
+        k : (3,) |array-like|_
+            Reciprocal vector
+        relative : bool, default False
+            If ``relative=True``, then ``k`` is interpreted as given relative to the
+            reciprocal unit cell. Otherwise it is interpreted as given in absolute
+            coordinates.
+
+        Returns
+        -------
+        D : (M, M, 3, 3) :numpy:`ndarray`
+            :math:`D_{\alpha\beta}^{ij}(\boldsymbol{k})`. Elements are complex
+            numbers.
+        """
+
+        k = np.array(k, dtype=float)
+
+        if not relative:
+            k = self.cell @ k / 2 / np.pi
+
+        # The sum is periodic in the reciprocal space
+        k = k - np.round(k)
+        is_zero = np.allclose(k, 0)
+
+        # Real space part
+        result = self._real_space_sum(phases=np.exp(2j * np.pi * (self.nus @ k)))
+
+        # Reciprocal space part
+        qs = self.gs - k @ self.reciprocal_cell
+        q_squared = np.sum(qs**2, axis=1)
+
+        if is_zero:
+            mask = q_squared > 0
+            qs = qs[mask]
+            q_squared = q_squared[mask]
+
+        weights = 4 * np.pi / self.volume * np.exp(-q_squared / 4 / self.eta**2)
+        # exp(iq(r_b - r_a)) is factorized, so that no (M, M, G) array is created
+        phases = np.exp(1j * self.positions @ qs.T)
+        weights = weights / q_squared
+        for i in range(3):
+            for j in range(i, 3):
+                result[:, :, i, j] += (
+                    phases.conj() * (weights * qs[:, i] * qs[:, j])
+                ) @ phases.T
+                result[:, :, j, i] = result[:, :, i, j]
+
+        # Surface term of the sum over the growing spheres
+        if is_zero:
+            result = result + 4 * np.pi / 3 / self.volume * np.eye(3)
+
+        # Self interaction
+        result = result - self.self_term * np.einsum(
+            "ab,ij->abij", np.eye(self.M), np.eye(3)
+        )
+
+        return self.prefactor[:, :, np.newaxis, np.newaxis] * result
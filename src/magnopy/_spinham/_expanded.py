@@ -0,0 +1,102 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+
+
+def _get_expanded(spinham, name, iterator):
+    r"""
+    Returns the multiple-counted parameters of one term of the Hamiltonian.
+
+    The parameters are synthesized by the ``iterator`` once and cached in the
+    Hamiltonian. The cache is dropped by the same methods, that drop the views and the
+    fingerprint of the Hamiltonian, i.e. on any change of the parameters, of the
+    convention or of the atoms.
+
+    Parameters
+    ----------
+    spinham : :py:class:`.SpinHamiltonian`
+        Spin Hamiltonian.
+    name : str
+        Name of the term, i.e. ``"22"``.
+    iterator : class
+        Iterator over the parameters of the term, i.e. ``_P22_iterator``.
+
+    Returns
+    -------
+    parameters : list
+        List of all parameters, primary ones first. Parameters are read-only arrays.
+    """
+
+    if name not in spinham._expanded:
+        parameters = []
+        for entry in iterator(spinham):
+            # Doubles are transposed views of the primary parameters, store them as
+            # contiguous arrays. A view of the primary parameter is taken, so that
+            # only the cached version is read-only.
+            parameter = np.ascontiguousarray(entry[-1]).view()
+            parameter.flags.writeable = False
+            parameters.append(entry[:-1] + [parameter])
+
+        spinham._expanded[name] = parameters
+
+    return spinham._expanded[name]
+
+
+class _Expanded_iterator:
+    R"""
+    Iterator over the cached multiple-counted parameters of the spin Hamiltonian.
+
+    Parameters are synthesized at the first call of ``next()``. Each entry is a new
+    list, but the arrays of the parameters are shared with the cache and are
+    read-only.
+    """
+
+    __slots__ = ("spinham", "name", "iterator", "container", "index")
+
+    def __init__(self, spinham, name, iterator) -> None:
+        self.spinham = spinham
+        self.name = name
+        self.iterator = iterator
+        self.container = None
+        self.index = 0
+
+    def __next__(self):
+        if self.container is None:
+            self.container = _get_expanded(
+                spinham=self.spinham, name=self.name, iterator=self.iterator
+            )
+
+        if self.index < len(self.container):
+            self.index += 1
+            return list(self.container[self.index - 1])
+
+        raise StopIteration
+
+    def __len__(self):
+        if self.container is None:
+            return len(self.iterator(self.spinham))
+
+        return len(self.container)
+
+    def __iter__(self):
+        return self
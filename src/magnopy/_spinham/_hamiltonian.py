@@ -20,15 +20,19 @@
 # ================================ END LICENSE =================================
 
 
+import hashlib
+import json
+import threading
 from copy import deepcopy
 from math import ceil
 
 import numpy as np
 from wulfric import add_sugar
 
+from magnopy._constants._internal_units import BOHR_MAGNETON
 from magnopy._spinham._c1 import _add_1, _p1, _remove_1
 from magnopy._spinham._c21 import _add_21, _p21, _remove_21
-from magnopy._spinham._c22 import _add_22, _get_primary_p22, _p22, _remove_22
+from magnopy._spinham._c22 import _add_22, _p22, _remove_22
 from magnopy._spinham._c31 import _add_31, _p31, _remove_31
 from magnopy._spinham._c32 import _add_32, _p32, _remove_32
 from magnopy._spinham._c33 import _add_33, _p33, _remove_33
@@ -43,6 +47,10 @@ from magnopy._spinham._convention import Convention
 old_dir = set(dir())
 old_dir.add("old_dir")
 
+# Guards the creation of the views, so that the threads, that request the same view at
+# once, get the same object
+_VIEWS_LOCK = threading.RLock()
+
 
 def _merge(list1: list, list2: list) -> list:
     r"""
@@ -125,11 +133,23 @@ class SpinHamiltonian:
 
         self._atoms = add_sugar(atoms)
 
+        # Number of parameters in which each atom is involved
+        self._atom_counts = None
+
         # Only the magnetic sites
         self._magnetic_atoms = None
         self._map_to_magnetic = None
         self._map_to_all = None
 
+        # Read-only copies of the Hamiltonian in other conventions
+        self._views = {}
+
+        # Multiple-counted parameters, synthesized on demand
+        self._expanded = {}
+
+        # Hash of the content, computed on demand
+        self._fingerprint = None
+
         self._convention = convention
 
         # [[alpha, parameter], ...]
@@ -165,6 +185,10 @@ class SpinHamiltonian:
         # [[alpha, beta, gamma, epsilon, nu, lambda, rho, parameter], ...]
         self._44 = []
 
+        # Long-range dipole dipole interaction, summed in reciprocal space
+        # dict(tolerance=..., factor=...) or None
+        self._dipole_dipole_ewald = None
+
     ############################################################################
     #                              Cell and Atoms                              #
     ############################################################################
@@ -299,75 +323,110 @@ class SpinHamiltonian:
         )
 
     def _reset_internals(self):
+        self._atom_counts = None
         self._map_to_magnetic = None
         self._map_to_all = None
         self._magnetic_atoms = None
+        self._views = {}
+        self._expanded = {}
+        self._fingerprint = None
 
-    def _update_internals(self):
-        # Identify magnetic sites
-        indices = set()
+    def _update_counts(self, added=(), removed=()):
+        r"""
+        Updates the internals after one parameter was added, replaced or removed.
+
+        Parameters
+        ----------
+        added : tuple of int, default ()
+            Indices of the atoms of the added parameter. One index per spin.
+        removed : tuple of int, default ()
+            Indices of the atoms of the removed parameter. One index per spin.
+        """
 
-        for alpha, _ in self._1:
-            indices.add(alpha)
+        self._views = {}
+        self._expanded = {}
+        self._fingerprint = None
 
-        for alpha, _ in self._21:
-            indices.add(alpha)
+        # Nothing to update, counts are computed on demand
+        if self._atom_counts is None:
+            return
 
-        for alpha, beta, _, _ in self._22:
-            indices.add(alpha)
-            indices.add(beta)
+        magnetic_atoms_changed = False
 
-        for alpha, _ in self._31:
-            indices.add(alpha)
+        for index in added:
+            magnetic_atoms_changed = (
+                magnetic_atoms_changed or self._atom_counts[index] == 0
+            )
+            self._atom_counts[index] += 1
 
-        for alpha, beta, _, _ in self._32:
-            indices.add(alpha)
-            indices.add(beta)
+        for index in removed:
+            self._atom_counts[index] -= 1
+            magnetic_atoms_changed = (
+                magnetic_atoms_changed or self._atom_counts[index] == 0
+            )
 
-        for alpha, beta, gamma, _, _, _ in self._33:
-            indices.add(alpha)
-            indices.add(beta)
-            indices.add(gamma)
+        if magnetic_atoms_changed:
+            self._map_to_magnetic = None
+            self._map_to_all = None
+            self._magnetic_atoms = None
 
-        for alpha, _ in self._41:
-            indices.add(alpha)
+    def _count_atoms(self):
+        r"""
+        Counts the parameters in which each atom is involved.
 
-        for alpha, beta, _, _ in self._421:
-            indices.add(alpha)
-            indices.add(beta)
+        Returns
+        -------
+        counts : (L, ) :numpy:`ndarray`
+            Integers. ``L = len(spinham.atoms.names)``.
+        """
 
-        for alpha, beta, _, _ in self._422:
-            indices.add(alpha)
-            indices.add(beta)
+        counts = np.zeros(len(self.atoms.names), dtype=int)
+
+        for parameters, n_spins in [
+            (self._1, 1),
+            (self._21, 1),
+            (self._22, 2),
+            (self._31, 1),
+            (self._32, 2),
+            (self._33, 3),
+            (self._41, 1),
+            (self._421, 2),
+            (self._422, 2),
+            (self._43, 3),
+            (self._44, 4),
+        ]:
+            if len(parameters) > 0:
+                indices = np.array(
+                    [parameter[:n_spins] for parameter in parameters], dtype=int
+                )
+                counts += np.bincount(indices.flatten(), minlength=len(counts))
 
-        for alpha, beta, gamma, _, _, _ in self._43:
-            indices.add(alpha)
-            indices.add(beta)
-            indices.add(gamma)
+        return counts
 
-        for alpha, beta, gamma, epsilon, _, _, _, _ in self._44:
-            indices.add(alpha)
-            indices.add(beta)
-            indices.add(gamma)
-            indices.add(epsilon)
+    def _update_internals(self):
+        # Everything is built in the local variables and assigned at the end, so that
+        # the other threads never see partially filled maps
+        atom_counts = self._atom_counts
+        if atom_counts is None:
+            atom_counts = self._count_atoms()
 
-        indices = sorted(list(indices))
+        # Identify magnetic sites
+        indices = [int(index) for index in np.nonzero(atom_counts)[0]]
 
         # Create index map from all to magnetic
-        self._map_to_magnetic = [None for _ in range(len(self.atoms.names))]
+        map_to_magnetic = [None for _ in range(len(self.atoms.names))]
         for i in range(len(indices)):
-            self._map_to_magnetic[indices[i]] = i
-
-        # Create index map from magnetic to all
-        self._map_to_all = indices
+            map_to_magnetic[indices[i]] = i
 
         # Create magnetic atoms dictionary
-        self._magnetic_atoms = add_sugar({})
+        magnetic_atoms = add_sugar({})
         for key in self.atoms:
-            self._magnetic_atoms[key] = []
+            magnetic_atoms[key] = [self.atoms[key][index] for index in indices]
 
-            for full_index in indices:
-                self._magnetic_atoms[key].append(self.atoms[key][full_index])
+        self._atom_counts = atom_counts
+        self._magnetic_atoms = magnetic_atoms
+        self._map_to_all = indices
+        self._map_to_magnetic = map_to_magnetic
 
     @property
     def map_to_magnetic(self):
@@ -409,7 +468,8 @@ class SpinHamiltonian:
         Magnetic atom is defined as an atom with at least one parameter associated with
         it.
 
-        This property is dynamically computed at every call.
+        This property is computed on demand and kept up to date when parameters are
+        added or removed.
 
         Returns
         -------
@@ -480,6 +540,120 @@ class SpinHamiltonian:
         self._set_c44(new_convention._c44)
 
         self._convention = new_convention
+        self._views = {}
+        self._expanded = {}
+        self._fingerprint = None
+
+    def view(self, convention: Convention):
+        r"""
+        Returns the same Hamiltonian, expressed in the given convention, without
+        modifying the original one.
+
+        .. versionadded:: 0.3.0
+
+        Parameters
+        ----------
+        convention : :py:class:`.Convention`
+            Desired convention of the spin Hamiltonian.
+
+        Returns
+        -------
+        spinham : :py:class:`.SpinHamiltonian`
+            Spin Hamiltonian in the given ``convention``. It shares the cell, atoms and
+            unchanged parameters with the original Hamiltonian and is meant to be used
+            only for reading. If ``convention`` is the same as the one of the
+            Hamiltonian, then the Hamiltonian itself is returned.
+
+        Notes
+        -----
+        In contrast to the assignment of the :py:attr:`.SpinHamiltonian.convention`
+        this method does not touch the parameters of the original Hamiltonian.
+        Therefore, it is safe to use it when the same Hamiltonian is processed by
+        several threads at once.
+
+        The result is cached for each convention and computed only once. The cache is
+        cleared on any modification of the Hamiltonian through its methods.
+
+        Examples
+        --------
+
+        .. doctest::
+
+            >>> import numpy as np
+            >>> import magnopy
+            >>> convention = magnopy.Convention(
+            ...     multiple_counting=True, spin_normalized=False, c22=1
+            ... )
+            >>> spinham = magnopy.SpinHamiltonian(
+            ...     cell=np.eye(3),
+            ...     atoms=dict(names=["Fe"], spins=[2], positions=[[0, 0, 0]]),
+            ...     convention=convention,
+            ... )
+            >>> spinham.add_22(alpha=0, beta=0, nu=(1, 0, 0), parameter=np.eye(3))
+            >>> view = spinham.view(convention.get_modified(c22=-0.5))
+            >>> for alpha, beta, nu, parameter in view.p22:
+            ...     print(alpha, beta, nu, parameter[0][0])
+            0 0 (1, 0, 0) -2.0
+            0 0 (-1, 0, 0) -2.0
+            >>> for alpha, beta, nu, parameter in spinham.p22:
+            ...     print(alpha, beta, nu, parameter[0][0])
+            0 0 (1, 0, 0) 1.0
+            0 0 (-1, 0, 0) 1.0
+        """
+
+        if convention == self.convention:
+            return self
+
+        key = tuple(
+            getattr(convention, name)
+            for name in Convention.__slots__
+            if name != "_name"
+        )
+
+        with _VIEWS_LOCK:
+            return self._get_view(convention=convention, key=key)
+
+    def _get_view(self, convention, key):
+        r"""
+        Returns the cached view or creates it. Called with the lock acquired.
+        """
+
+        spinham = self._views.get(key)
+
+        if spinham is None:
+            spinham = SpinHamiltonian(
+                cell=self.cell, atoms={}, convention=self.convention
+            )
+            spinham._atoms = self.atoms
+
+            # Set of parameters is the same, therefore magnetic atoms are the same
+            spinham._map_to_magnetic = self.map_to_magnetic
+            spinham._map_to_all = self.map_to_all
+            spinham._magnetic_atoms = self.magnetic_atoms
+            spinham._atom_counts = self._atom_counts.copy()
+
+            # Parameters are rescaled by reassignment, therefore a copy of the
+            # outer and inner lists is sufficient
+            spinham._1 = [list(entry) for entry in self._1]
+            spinham._21 = [list(entry) for entry in self._21]
+            spinham._22 = [list(entry) for entry in self._22]
+            spinham._31 = [list(entry) for entry in self._31]
+            spinham._32 = [list(entry) for entry in self._32]
+            spinham._33 = [list(entry) for entry in self._33]
+            spinham._41 = [list(entry) for entry in self._41]
+            spinham._421 = [list(entry) for entry in self._421]
+            spinham._422 = [list(entry) for entry in self._422]
+            spinham._43 = [list(entry) for entry in self._43]
+            spinham._44 = [list(entry) for entry in self._44]
+
+            # Does not depend on the convention
+            spinham._dipole_dipole_ewald = self._dipole_dipole_ewald
+
+            spinham.convention = convention
+
+            self._views[key] = spinham
+
+        return spinham
 
     def _set_multiple_counting(self, multiple_counting: bool) -> None:
         if multiple_counting is None or self.convention._multiple_counting is None:
@@ -489,7 +663,7 @@ class SpinHamiltonian:
 
         if self.convention.multiple_counting == multiple_counting:
             return
-            
+
         # It was absent before
         if multiple_counting:
             factor = 0.5
@@ -519,7 +693,7 @@ class SpinHamiltonian:
         # It was present before
         else:
             factor = 6
-            
+
         # For (three spins & three sites)
         for index in range(len(self._33)):
             self._33[index][5] = self._33[index][5] * factor
@@ -899,8 +1073,6 @@ class SpinHamiltonian:
 
         h = np.array(h, dtype=float)
 
-        BOHR_MAGNETON = 0.057883818060  # meV / Tesla
-
         if alphas is None:
             alphas = self.map_to_all
 
@@ -912,12 +1084,14 @@ class SpinHamiltonian:
         i = 0
         j = 0
         new_p1 = []
+        new_alphas = []
         while i < len(alphas) or j < len(self._1):
             if i >= len(alphas) or (j < len(self._1) and alphas[i] > self._1[j][0]):
                 new_p1.append(self._1[j])
                 j += 1
             elif j >= len(self._1) or (i < len(alphas) and alphas[i] < self._1[j][0]):
                 new_p1.append([alphas[i], zeeman_parameters[i]])
+                new_alphas.append(alphas[i])
                 i += 1
             elif alphas[i] == self._1[j][0]:
                 new_p1.append(
@@ -930,7 +1104,7 @@ class SpinHamiltonian:
                 j += 1
 
         self._1 = new_p1
-        self._reset_internals()
+        self._update_counts(added=new_alphas)
 
     ############################################################################
     #                    Magnetic dipole-dipole interaction                    #
@@ -1090,58 +1264,302 @@ class SpinHamiltonian:
 
         m_1_max = ceil(R_cut / np.linalg.norm(a1))
 
-        # Run over all pairs of atoms between (0, 0, 0) and all unit cells of
-        # interest
-        tmp_parameters = []
+        # All unit cells of interest, shape (N, 3)
+        nus = np.stack(
+            np.meshgrid(
+                np.arange(-m_1_max, m_1_max + 1),
+                np.arange(-m_2_max, m_2_max + 1),
+                np.arange(-m_3_max, m_3_max + 1),
+                indexing="ij",
+            ),
+            axis=-1,
+        ).reshape(-1, 3)
+
+        # Only primary pairs are added, see _spins_ordered
+        i, j, k = nus.T
+        nu_is_zero = (i == 0) & (j == 0) & (k == 0)
+        nu_is_positive = (
+            (i > 0) | ((i == 0) & (j > 0)) | ((i == 0) & (j == 0) & (k > 0))
+        )
 
         if alphas is None:
             alphas = self.map_to_all
 
+        alphas = np.array(alphas, dtype=int)
+        positions = np.array(self.atoms.positions, dtype=float)
+        g_factors = np.array(self.atoms.g_factors, dtype=float)
+
+        # Run over all pairs of atoms between (0, 0, 0) and all unit cells of
+        # interest. Pairs with the same first atom are processed at once.
+        tmp_parameters = []
+
         for alpha in alphas:
-            for k in range(-m_3_max, m_3_max + 1):
-                for j in range(-m_2_max, m_2_max + 1):
-                    for i in range(-m_1_max, m_1_max + 1):
-                        for beta in alphas:
-                            if k == 0 and j == 0 and i == 0 and alpha == beta:
-                                continue
-
-                            if _get_primary_p22(
-                                alpha=alpha, beta=beta, nu=(i, j, k)
-                            ) != (alpha, beta, (i, j, k)):
-                                continue
-
-                            vector = (
-                                np.array([i, j, k])
-                                + self.atoms.positions[beta]
-                                - self.atoms.positions[alpha]
-                            ) @ self.cell
-                            distance = np.linalg.norm(vector)
-
-                            if distance <= R_cut:
-                                parameter = (
-                                    MU_0_MU_B
-                                    / 4
-                                    / np.pi
-                                    / self.convention.c22
-                                    * self.atoms.g_factors[alpha]
-                                    * self.atoms.g_factors[beta]
-                                    / distance**3
-                                ) * (
-                                    np.eye(3, dtype=float)
-                                    - 3 * np.outer(vector, vector) / distance**2
-                                )
-                                if self.convention.multiple_counting:
-                                    parameter = parameter / 2
-
-                                if E_cut is None or (np.abs(parameter) >= E_cut).any():
-                                    tmp_parameters.append(
-                                        [alpha, beta, (i, j, k), parameter]
-                                    )
+            # Shape (B, N), where B = len(alphas)
+            is_primary = nu_is_positive[np.newaxis, :] | (
+                nu_is_zero[np.newaxis, :] & (alpha < alphas)[:, np.newaxis]
+            )
+
+            # Shape (B, N, 3)
+            vectors = (
+                nus[np.newaxis, :, :]
+                + positions[alphas][:, np.newaxis, :]
+                - positions[alpha]
+            ) @ self.cell
+            distances = np.linalg.norm(vectors, axis=-1)
+
+            mask = is_primary & (distances <= R_cut)
+
+            betas = np.broadcast_to(alphas[:, np.newaxis], mask.shape)[mask]
+            cells = np.broadcast_to(nus[np.newaxis, :, :], (*mask.shape, 3))[mask]
+            vectors = vectors[mask]
+            distances = distances[mask]
+
+            # Shape (P, 3, 3), where P is the amount of selected pairs
+            parameters = (
+                MU_0_MU_B
+                / 4
+                / np.pi
+                / self.convention.c22
+                * g_factors[alpha]
+                * g_factors[betas]
+                / distances**3
+            )[:, np.newaxis, np.newaxis] * (
+                np.eye(3, dtype=float)[np.newaxis, :, :]
+                - 3
+                * np.einsum("pi,pj->pij", vectors, vectors)
+                / distances[:, np.newaxis, np.newaxis] ** 2
+            )
+            if self.convention.multiple_counting:
+                parameters = parameters / 2
+
+            if E_cut is not None:
+                mask = (np.abs(parameters) >= E_cut).any(axis=(1, 2))
+                betas = betas[mask]
+                cells = cells[mask]
+                parameters = parameters[mask]
+
+            tmp_parameters.extend(
+                [int(alpha), beta, tuple(nu), parameter]
+                for beta, nu, parameter in zip(
+                    betas.tolist(), cells.tolist(), parameters
+                )
+            )
 
         if len(tmp_parameters) > 0:
             tmp_parameters.sort(key=lambda x: x[:-1])
 
+            # Parameters of the existing bonds are summed with the new ones, only the
+            # new bonds change the counts of the atoms
+            existing = {(alpha, beta, nu) for alpha, beta, nu, _ in self._22}
+            added = [
+                atom
+                for alpha, beta, nu, _ in tmp_parameters
+                if (alpha, beta, nu) not in existing
+                for atom in (alpha, beta)
+            ]
+
             self._22 = _merge(list1=self._22, list2=tmp_parameters)
+            self._update_counts(added=added)
+
+    @property
+    def dipole_dipole_ewald(self):
+        r"""
+        Whether the long-range magnetic dipole dipole interaction is included.
+
+        .. versionadded:: 0.3.0
+
+        Returns
+        -------
+        tolerance : float or None
+            Accuracy of the lattice sums of the dipole dipole interaction or ``None``
+            if the interaction is not included.
+
+        See Also
+        --------
+        add_dipole_dipole_ewald
+        remove_dipole_dipole_ewald
+        """
+
+        if self._dipole_dipole_ewald is None:
+            return None
+
+        return self._dipole_dipole_ewald["tolerance"]
+
+    def add_dipole_dipole_ewald(self, tolerance=1e-8):
+        r"""
+        Add long-range magnetic dipole dipole interaction to the Hamiltonian.
+
+        .. versionadded:: 0.3.0
+
+        In contrast to :py:meth:`.SpinHamiltonian.add_dipole_dipole` no parameters
+        are added to the Hamiltonian. Instead, the interaction between all magnetic
+        atoms of the crystal is summed by the Ewald method, when the Hamiltonian is
+        processed by :py:class:`.LSWT` or :py:class:`.Energy`. The cost of that does
+        not depend on the range of the interaction.
+
+        The interaction is the same as the one of
+        :py:meth:`.SpinHamiltonian.add_dipole_dipole` with ``R_cut`` going to
+        infinity. Parameter is defined with the actual values of spins, i.e. as in the
+        convention with ``spin_normalized=False``. The conditionally convergent sum for
+        :math:`\boldsymbol{k} = 0` is taken over the growing spheres.
+
+        Parameters
+        ----------
+        tolerance : float, default 1e-8
+            Desired accuracy of the lattice sums. :math:`0 < tolerance < 1`.
+
+        Raises
+        ------
+        ValueError
+            If ``tolerance <= 0`` or ``tolerance >= 1``.
+
+        Notes
+        -----
+        The interaction acts between the magnetic atoms of the Hamiltonian (see
+        :py:attr:`.SpinHamiltonian.magnetic_atoms`), i.e. between the atoms that have
+        at least one other parameter associated with them.
+
+        Of the functions of :py:mod:`magnopy.io` the interaction is written only by
+        :py:func:`magnopy.io.save_spinham`. Use
+        :py:meth:`.SpinHamiltonian.add_dipole_dipole` to get explicit parameters.
+
+        Examples
+        --------
+
+        .. doctest::
+
+            >>> import magnopy
+            >>> spinham = magnopy.examples.cubic_ferro_nn()
+            >>> spinham.add_dipole_dipole_ewald()
+            >>> spinham.dipole_dipole_ewald
+            1e-08
+        """
+
+        tolerance = float(tolerance)
+
+        if not 0 < tolerance < 1:
+            raise ValueError(f"Expected tolerance between 0 and 1, got {tolerance}.")
+
+        self._dipole_dipole_ewald = dict(tolerance=tolerance, factor=1.0)
+
+        self._views = {}
+        self._fingerprint = None
+
+    def remove_dipole_dipole_ewald(self):
+        r"""
+        Removes long-range magnetic dipole dipole interaction from the Hamiltonian.
+
+        .. versionadded:: 0.3.0
+
+        See Also
+        --------
+        add_dipole_dipole_ewald
+        """
+
+        self._dipole_dipole_ewald = None
+
+        self._views = {}
+        self._fingerprint = None
+
+    ############################################################################
+    #                                Fingerprint                               #
+    ############################################################################
+    def fingerprint(self) -> str:
+        r"""
+        Returns a hash of the content of the Hamiltonian.
+
+        .. versionadded:: 0.3.0
+
+        Hash is computed over the cell, atoms, convention, all parameters and the
+        settings of :py:meth:`.SpinHamiltonian.add_dipole_dipole_ewald`. It is the same
+        for the Hamiltonians with the same content, independently of the python
+        session or the order in which the parameters were added.
+
+        Returns
+        -------
+        fingerprint : str
+            Hexadecimal SHA-256 digest.
+
+        Notes
+        -----
+        The result is cached and computed only once. The cache is cleared on any
+        modification of the Hamiltonian through its methods. Direct modification of
+        the arrays of the parameters is not detected.
+
+        The same physical Hamiltonian, written in two different conventions, has two
+        different fingerprints. Name of the convention is ignored.
+
+        Examples
+        --------
+
+        .. doctest::
+
+            >>> import magnopy
+            >>> spinham = magnopy.examples.cubic_ferro_nn()
+            >>> fingerprint = spinham.fingerprint()
+            >>> spinham.copy().fingerprint() == fingerprint
+            True
+            >>> spinham.add_magnetic_field(h=[0, 0, 1])
+            >>> spinham.fingerprint() == fingerprint
+            False
+        """
+
+        if self._fingerprint is not None:
+            return self._fingerprint
+
+        digest = hashlib.sha256()
+
+        def update_floats(array):
+            # Adding 0.0 turns -0.0 into 0.0
+            array = np.ascontiguousarray(array, dtype="<f8") + 0.0
+            digest.update(repr(array.shape).encode())
+            digest.update(array.tobytes())
+
+        update_floats(self.cell)
+
+        def update_json(value):
+            digest.update(
+                json.dumps(
+                    value,
+                    sort_keys=True,
+                    default=lambda value: np.asarray(value).tolist(),
+                ).encode()
+            )
+
+        update_json(self.atoms)
+
+        digest.update(
+            repr(
+                tuple(
+                    getattr(self.convention, name)
+                    for name in Convention.__slots__
+                    if name != "_name"
+                )
+            ).encode()
+        )
+
+        for name, parameters in [
+            ("1", self._1),
+            ("21", self._21),
+            ("22", self._22),
+            ("31", self._31),
+            ("32", self._32),
+            ("33", self._33),
+            ("41", self._41),
+            ("421", self._421),
+            ("422", self._422),
+            ("43", self._43),
+            ("44", self._44),
+        ]:
+            digest.update(name.encode())
+            update_json([entry[:-1] for entry in parameters])
+            update_floats([entry[-1] for entry in parameters])
+
+        update_json(self._dipole_dipole_ewald)
+
+        self._fingerprint = digest.hexdigest()
+
+        return self._fingerprint
 
     ############################################################################
     #                                Copy getter                               #
@@ -1158,6 +1576,24 @@ class SpinHamiltonian:
 
         return deepcopy(self)
 
+    def __deepcopy__(self, memo):
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+
+        for name, value in self.__dict__.items():
+            # Cached views, multiple-counted parameters and fingerprint are not
+            # copied, the copy starts with the empty caches
+            if name in ("_views", "_expanded"):
+                value = {}
+            elif name == "_fingerprint":
+                value = None
+            else:
+                value = deepcopy(value, memo)
+
+            setattr(result, name, value)
+
+        return result
+
     def get_empty(self):
         r"""
         Returns the Hamiltonian with the same cell, atoms and convention, but with no
@@ -1188,6 +1624,7 @@ class SpinHamiltonian:
             )
 
         spinham = self.copy()
+        spinham._update_counts()
 
         # One spin
         for i in range(len(spinham._1)):
@@ -1226,6 +1663,9 @@ class SpinHamiltonian:
         for i in range(len(spinham._44)):
             spinham._44[i][7] *= number
 
+        if spinham._dipole_dipole_ewald is not None:
+            spinham._dipole_dipole_ewald["factor"] *= number
+
         return spinham
 
     def __rmul__(self, number):
@@ -1265,8 +1705,7 @@ class SpinHamiltonian:
             )
 
         # Make sure that conventions are the same
-        other_convention = other.convention
-        other.convention = self.convention
+        other = other.view(convention=self.convention)
 
         result = self.get_empty()
 
@@ -1289,8 +1728,20 @@ class SpinHamiltonian:
         result._43 = _merge(list1=self._43, list2=other._43)
         result._44 = _merge(list1=self._44, list2=other._44)
 
-        # Restore convention of other Hamiltonian
-        other.convention = other_convention
+        # Long-range dipole dipole interaction
+        if other._dipole_dipole_ewald is None:
+            result._dipole_dipole_ewald = deepcopy(self._dipole_dipole_ewald)
+        elif self._dipole_dipole_ewald is None:
+            result._dipole_dipole_ewald = deepcopy(other._dipole_dipole_ewald)
+        else:
+            result._dipole_dipole_ewald = dict(
+                tolerance=min(
+                    self._dipole_dipole_ewald["tolerance"],
+                    other._dipole_dipole_ewald["tolerance"],
+                ),
+                factor=self._dipole_dipole_ewald["factor"]
+                + other._dipole_dipole_ewald["factor"],
+            )
 
         return result
 
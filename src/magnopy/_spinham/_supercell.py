@@ -24,7 +24,18 @@ R"""
 Convention of spin Hamiltonian
 """
 
+import numpy as np
+from wulfric import add_sugar
+
+from magnopy._spinham._c22 import _get_primary_p22
+from magnopy._spinham._c32 import _get_primary_p32
+from magnopy._spinham._c33 import _get_primary_p33
+from magnopy._spinham._c43 import _get_primary_p43
+from magnopy._spinham._c44 import _get_primary_p44
+from magnopy._spinham._c421 import _get_primary_p421
+from magnopy._spinham._c422 import _get_primary_p422
 from magnopy._spinham._hamiltonian import SpinHamiltonian
+from magnopy._spinham._validators import _to_sorted_list
 
 # Save local scope at this moment
 old_dir = set(dir())
@@ -222,170 +233,503 @@ def make_supercell(spinham: SpinHamiltonian, supercell):
 
     new_cell = [supercell[i] * spinham.cell[i] for i in range(3)]
 
-    new_atoms = {}
+    ijk = _get_unit_cells(supercell=supercell)
+
+    n_atoms = len(spinham.atoms.names)
 
-    for key in spinham.atoms:
-        new_atoms[key] = []
-
-    for k in range(supercell[2]):
-        for j in range(supercell[1]):
-            for i in range(supercell[0]):
-                for atom_index in range(len(spinham.atoms.names)):
-                    for key in spinham.atoms:
-                        if key == "positions":
-                            position = spinham.atoms.positions[atom_index]
-                            new_position = [
-                                (position[0] + i) / supercell[0],
-                                (position[1] + j) / supercell[1],
-                                (position[2] + k) / supercell[2],
-                            ]
-                            new_atoms["positions"].append(new_position)
-                        elif key == "names":
-                            new_atoms["names"].append(
-                                f"{spinham.atoms.names[atom_index]}_{i}_{j}_{k}"
-                            )
-                        else:
-                            new_atoms[key].append(spinham.atoms[key][atom_index])
+    new_atoms = _get_supercell_atoms(atoms=spinham.atoms, supercell=supercell, ijk=ijk)
 
     new_spinham = SpinHamiltonian(
         cell=new_cell, atoms=new_atoms, convention=spinham.convention
     )
 
-    def get_new_indices(alpha, nu, ijk):
-        nu = [nu[index] + ijk[index] for index in range(3)]
+    # One spin
+    new_spinham._1 = [
+        [alphas[0], np.array(parameter)]
+        for alphas, _, parameter in _propagate(
+            parameters=spinham._1,
+            n_sites=1,
+            supercell=supercell,
+            ijk=ijk,
+            n_atoms=n_atoms,
+        )
+    ]
+
+    # Two spins
+    new_spinham._21 = [
+        [alphas[0], np.array(parameter)]
+        for alphas, _, parameter in _propagate(
+            parameters=spinham._21,
+            n_sites=1,
+            supercell=supercell,
+            ijk=ijk,
+            n_atoms=n_atoms,
+        )
+    ]
+
+    new_parameters = {}
+    for (alpha, beta), (nu,), parameter in _propagate(
+        parameters=spinham._22, n_sites=2, supercell=supercell, ijk=ijk, n_atoms=n_atoms
+    ):
+        alpha, beta, nu, parameter = _get_primary_p22(
+            alpha=alpha, beta=beta, nu=nu, parameter=np.array(parameter)
+        )
+        new_parameters[(alpha, beta, nu)] = parameter
+    new_spinham._22 = _to_sorted_list(new_parameters)
+
+    # Three spins
+    new_spinham._31 = [
+        [alphas[0], np.array(parameter)]
+        for alphas, _, parameter in _propagate(
+            parameters=spinham._31,
+            n_sites=1,
+            supercell=supercell,
+            ijk=ijk,
+            n_atoms=n_atoms,
+        )
+    ]
+
+    new_parameters = {}
+    for (alpha, beta), (nu,), parameter in _propagate(
+        parameters=spinham._32, n_sites=2, supercell=supercell, ijk=ijk, n_atoms=n_atoms
+    ):
+        alpha, beta, nu, parameter = _get_primary_p32(
+            alpha=alpha,
+            beta=beta,
+            nu=nu,
+            parameter=np.array(parameter),
+            S_alpha=new_spinham.atoms.spins[alpha],
+            S_beta=new_spinham.atoms.spins[beta],
+        )
+        new_parameters[(alpha, beta, nu)] = parameter
+    new_spinham._32 = _to_sorted_list(new_parameters)
+
+    new_parameters = {}
+    for (alpha, beta, gamma), (nu, _lambda), parameter in _propagate(
+        parameters=spinham._33, n_sites=3, supercell=supercell, ijk=ijk, n_atoms=n_atoms
+    ):
+        alpha, beta, gamma, nu, _lambda, parameter = _get_primary_p33(
+            alpha=alpha,
+            beta=beta,
+            gamma=gamma,
+            nu=nu,
+            _lambda=_lambda,
+            parameter=np.array(parameter),
+        )
+        new_parameters[(alpha, beta, gamma, nu, _lambda)] = parameter
+    new_spinham._33 = _to_sorted_list(new_parameters)
+
+    # Four spins
+    new_spinham._41 = [
+        [alphas[0], np.array(parameter)]
+        for alphas, _, parameter in _propagate(
+            parameters=spinham._41,
+            n_sites=1,
+            supercell=supercell,
+            ijk=ijk,
+            n_atoms=n_atoms,
+        )
+    ]
+
+    new_parameters = {}
+    for (alpha, beta), (nu,), parameter in _propagate(
+        parameters=spinham._421,
+        n_sites=2,
+        supercell=supercell,
+        ijk=ijk,
+        n_atoms=n_atoms,
+    ):
+        alpha, beta, nu, parameter = _get_primary_p421(
+            alpha=alpha,
+            beta=beta,
+            nu=nu,
+            parameter=np.array(parameter),
+            S_alpha=new_spinham.atoms.spins[alpha],
+            S_beta=new_spinham.atoms.spins[beta],
+        )
+        new_parameters[(alpha, beta, nu)] = parameter
+    new_spinham._421 = _to_sorted_list(new_parameters)
+
+    new_parameters = {}
+    for (alpha, beta), (nu,), parameter in _propagate(
+        parameters=spinham._422,
+        n_sites=2,
+        supercell=supercell,
+        ijk=ijk,
+        n_atoms=n_atoms,
+    ):
+        alpha, beta, nu, parameter = _get_primary_p422(
+            alpha=alpha, beta=beta, nu=nu, parameter=np.array(parameter)
+        )
+        new_parameters[(alpha, beta, nu)] = parameter
+    new_spinham._422 = _to_sorted_list(new_parameters)
+
+    new_parameters = {}
+    for (alpha, beta, gamma), (nu, _lambda), parameter in _propagate(
+        parameters=spinham._43, n_sites=3, supercell=supercell, ijk=ijk, n_atoms=n_atoms
+    ):
+        alpha, beta, gamma, nu, _lambda, parameter = _get_primary_p43(
+            alpha=alpha,
+            beta=beta,
+            gamma=gamma,
+            nu=nu,
+            _lambda=_lambda,
+            parameter=np.array(parameter),
+            S_alpha=new_spinham.atoms.spins[alpha],
+            S_beta=new_spinham.atoms.spins[beta],
+            S_gamma=new_spinham.atoms.spins[gamma],
+        )
+        new_parameters[(alpha, beta, gamma, nu, _lambda)] = parameter
+    new_spinham._43 = _to_sorted_list(new_parameters)
+
+    new_parameters = {}
+    for (alpha, beta, gamma, epsilon), (nu, _lambda, rho), parameter in _propagate(
+        parameters=spinham._44, n_sites=4, supercell=supercell, ijk=ijk, n_atoms=n_atoms
+    ):
+        alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter = _get_primary_p44(
+            alpha=alpha,
+            beta=beta,
+            gamma=gamma,
+            epsilon=epsilon,
+            nu=nu,
+            _lambda=_lambda,
+            rho=rho,
+            parameter=np.array(parameter),
+        )
+        new_parameters[(alpha, beta, gamma, epsilon, nu, _lambda, rho)] = parameter
+    new_spinham._44 = _to_sorted_list(new_parameters)
+
+    # Long-range dipole dipole interaction is defined by the atoms only
+    if spinham._dipole_dipole_ewald is not None:
+        new_spinham._dipole_dipole_ewald = dict(spinham._dipole_dipole_ewald)
+
+    new_spinham._reset_internals()
+
+    return new_spinham
+
+
+class SupercellView:
+    r"""
+    Spin Hamiltonian on the supercell, that is defined implicitly.
+
+    All unit cells of the supercell share the parameters of the original Hamiltonian,
+    therefore only the original Hamiltonian is stored and the memory footprint does not
+    depend on the size of the supercell. It can be used instead of the result of
+    :py:func:`.make_supercell` by the classes that support it (:py:class:`.Energy`).
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    spinham : :py:class:`.SpinHamiltonian`
+        Original spin Hamiltonian. ``spinham.cell`` is interpreted as the original
+        unit cell.
+    supercell : (3, ) tuple or list of int
+        Repetitions of the unit cell (``spinham.cell``) along each lattice vector. See
+        :py:func:`.make_supercell`.
+
+    Raises
+    ------
+    ValueError
+        If ``supercell[0] < 1`` or ``supercell[1] < 1`` or ``supercell[2] < 1``.
+
+    See Also
+    --------
+    make_supercell
+
+    Notes
+    -----
+    Magnetic atoms of the supercell are ordered in the same way as in the Hamiltonian,
+    that is returned by :py:func:`.make_supercell`: all magnetic atoms of the
+    (0, 0, 0) unit cell, then all magnetic atoms of the (1, 0, 0) unit cell and so on,
+    with the first lattice vector changing the fastest.
+
+    If the original Hamiltonian is modified, then the supercell Hamiltonian is modified
+    as well.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import numpy as np
+        >>> import magnopy
+        >>> atoms = dict(names=["Fe"], positions=[[0, 0, 0]], spins=[1], g_factors=[2])
+        >>> convention = magnopy.Convention(
+        ...     spin_normalized=False, multiple_counting=True, c22=1
+        ... )
+        >>> spinham = magnopy.SpinHamiltonian(
+        ...     cell=np.eye(3), atoms=atoms, convention=convention
+        ... )
+        >>> spinham.add_22(alpha=0, beta=0, nu=(1, 0, 0), parameter=np.eye(3))
+        >>> supercell_spinham = magnopy.SupercellView(
+        ...     spinham=spinham, supercell=(2, 1, 1)
+        ... )
+        >>> supercell_spinham.M
+        2
+        >>> supercell_spinham.magnetic_atoms.names
+        ['Fe_0_0_0', 'Fe_1_0_0']
+        >>> energy = magnopy.Energy(spinham=supercell_spinham)
+        >>> energy.E_0(spin_directions=[[0, 0, 1], [0, 0, -1]])
+        -4.0
+    """
+
+    def __init__(self, spinham: SpinHamiltonian, supercell) -> None:
+        supercell = tuple(supercell)
 
-        i, j, k = [nu[index] % supercell[index] for index in range(3)]
+        if supercell[0] < 1 or supercell[1] < 1 or supercell[2] < 1:
+            raise ValueError(
+                f"Supercell repetitions should be larger or equal to 1, got {supercell}"
+            )
 
-        nu = [nu[index] // supercell[index] for index in range(3)]
+        self._spinham = spinham
+        self._supercell = supercell
 
-        alpha = alpha + (i + j * supercell[0] + k * supercell[1] * supercell[0]) * len(
-            spinham.atoms.names
+    @property
+    def spinham(self) -> SpinHamiltonian:
+        r"""
+        Original spin Hamiltonian.
+
+        Returns
+        -------
+        spinham : :py:class:`.SpinHamiltonian`
+        """
+
+        return self._spinham
+
+    @property
+    def supercell(self) -> tuple:
+        r"""
+        Repetitions of the original unit cell along each lattice vector.
+
+        Returns
+        -------
+        supercell : (3, ) tuple of int
+        """
+
+        return self._supercell
+
+    @property
+    def cell(self):
+        r"""
+        Matrix of the supercell, rows are interpreted as vectors.
+
+        Returns
+        -------
+        cell : (3, 3) :numpy:`ndarray`
+        """
+
+        return self.spinham.cell * np.array(self.supercell)[:, np.newaxis]
+
+    @property
+    def convention(self):
+        r"""
+        Convention of the spin Hamiltonian.
+
+        Returns
+        -------
+        convention : :py:class:`.Convention`
+        """
+
+        return self.spinham.convention
+
+    @property
+    def M(self) -> int:
+        r"""
+        Number of spins (magnetic atoms) in the supercell.
+
+        Returns
+        -------
+        M : int
+        """
+
+        return (
+            self.spinham.M * self.supercell[0] * self.supercell[1] * self.supercell[2]
         )
 
-        return alpha, tuple(nu)
+    @property
+    def magnetic_atoms(self):
+        r"""
+        Magnetic atoms of the supercell.
+
+        This property is dynamically computed at every call.
+
+        Returns
+        -------
+        magnetic_atoms : dict
+            Positions are relative to the supercell. Names are appended with the
+            indices of the unit cell.
+        """
+
+        return add_sugar(
+            _get_supercell_atoms(
+                atoms=self.spinham.magnetic_atoms,
+                supercell=self.supercell,
+                ijk=_get_unit_cells(supercell=self.supercell),
+            )
+        )
 
-    for k in range(supercell[2]):
-        for j in range(supercell[1]):
-            for i in range(supercell[0]):
-                # One spin
-                for alpha, parameter in spinham._1:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
+    def view(self, convention):
+        r"""
+        Returns the same supercell Hamiltonian, expressed in the given convention,
+        without modifying the original one.
 
-                    new_spinham.add_1(alpha=alpha, parameter=parameter)
+        Parameters
+        ----------
+        convention : :py:class:`.Convention`
+            Convention of the returned Hamiltonian.
 
-                # Two spins
-                for alpha, parameter in spinham._21:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
+        Returns
+        -------
+        supercell_spinham : :py:class:`.SupercellView`
 
-                    new_spinham.add_21(alpha=alpha, parameter=parameter)
+        See Also
+        --------
+        SpinHamiltonian.view
+        """
 
-                for alpha, beta, nu, parameter in spinham._22:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
-                    beta, nu = get_new_indices(alpha=beta, nu=nu, ijk=(i, j, k))
+        return SupercellView(
+            spinham=self.spinham.view(convention=convention), supercell=self.supercell
+        )
 
-                    new_spinham.add_22(
-                        alpha=alpha, beta=beta, nu=nu, parameter=parameter, replace=True
-                    )
+    def materialize(self) -> SpinHamiltonian:
+        r"""
+        Constructs the supercell Hamiltonian explicitly.
 
-                # Three spins
-                for alpha, parameter in spinham._31:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
+        Returns
+        -------
+        spinham : :py:class:`.SpinHamiltonian`
+            Same as ``make_supercell(spinham=self.spinham, supercell=self.supercell)``.
+        """
 
-                    new_spinham.add_31(alpha=alpha, parameter=parameter)
+        return make_supercell(spinham=self.spinham, supercell=self.supercell)
 
-                for alpha, beta, nu, parameter in spinham._32:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
-                    beta, nu = get_new_indices(alpha=beta, nu=nu, ijk=(i, j, k))
 
-                    new_spinham.add_32(
-                        alpha=alpha, beta=beta, nu=nu, parameter=parameter, replace=True
-                    )
+def _get_unit_cells(supercell):
+    r"""
+    Returns indices of all unit cells of the supercell.
 
-                for alpha, beta, gamma, nu, _lambda, parameter in spinham._33:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
-                    beta, nu = get_new_indices(alpha=beta, nu=nu, ijk=(i, j, k))
-                    gamma, _lambda = get_new_indices(
-                        alpha=gamma, nu=_lambda, ijk=(i, j, k)
-                    )
+    Parameters
+    ----------
+    supercell : (3, ) tuple of int
+        Repetitions of the unit cell along each lattice vector.
 
-                    new_spinham.add_33(
-                        alpha=alpha,
-                        beta=beta,
-                        gamma=gamma,
-                        nu=nu,
-                        _lambda=_lambda,
-                        parameter=parameter,
-                        replace=True,
-                    )
+    Returns
+    -------
+    ijk : (K, 3) :numpy:`ndarray`
+        Indices of the unit cells. First lattice vector changes the fastest.
+        ``K = supercell[0] * supercell[1] * supercell[2]``.
+    """
 
-                # Four spins
-                for alpha, parameter in spinham._41:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
+    k, j, i = np.meshgrid(*[range(n) for n in supercell[::-1]], indexing="ij")
 
-                    new_spinham.add_41(alpha=alpha, parameter=parameter)
+    return np.stack((i.flatten(), j.flatten(), k.flatten()), axis=1)
 
-                for alpha, beta, nu, parameter in spinham._421:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
-                    beta, nu = get_new_indices(alpha=beta, nu=nu, ijk=(i, j, k))
 
-                    new_spinham.add_421(
-                        alpha=alpha, beta=beta, nu=nu, parameter=parameter, replace=True
-                    )
+def _get_supercell_atoms(atoms, supercell, ijk):
+    r"""
+    Propagates the atoms over all unit cells of the supercell.
 
-                for alpha, beta, nu, parameter in spinham._422:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
-                    beta, nu = get_new_indices(alpha=beta, nu=nu, ijk=(i, j, k))
+    Parameters
+    ----------
+    atoms : dict
+        Atoms of the original unit cell.
+    supercell : (3, ) tuple of int
+        Repetitions of the unit cell along each lattice vector.
+    ijk : (K, 3) :numpy:`ndarray`
+        Unit cells of the supercell.
 
-                    new_spinham.add_422(
-                        alpha=alpha, beta=beta, nu=nu, parameter=parameter, replace=True
-                    )
+    Returns
+    -------
+    new_atoms : dict
+        Atoms of the supercell. Positions are relative to the supercell. Names are
+        appended with the indices of the unit cell.
+    """
 
-                for alpha, beta, gamma, nu, _lambda, parameter in spinham._43:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
-                    beta, nu = get_new_indices(alpha=beta, nu=nu, ijk=(i, j, k))
-                    gamma, _lambda = get_new_indices(
-                        alpha=gamma, nu=_lambda, ijk=(i, j, k)
-                    )
+    new_atoms = {}
 
-                    new_spinham.add_43(
-                        alpha=alpha,
-                        beta=beta,
-                        gamma=gamma,
-                        nu=nu,
-                        _lambda=_lambda,
-                        parameter=parameter,
-                        replace=True,
+    for key in atoms:
+        if key == "positions":
+            new_atoms["positions"] = (
+                (
+                    (
+                        np.array(atoms["positions"])[np.newaxis, :, :]
+                        + ijk[:, np.newaxis, :]
                     )
+                    / supercell
+                )
+                .reshape(-1, 3)
+                .tolist()
+            )
+        elif key == "names":
+            new_atoms["names"] = [
+                f"{name}_{i}_{j}_{k}" for i, j, k in ijk for name in atoms["names"]
+            ]
+        else:
+            new_atoms[key] = [
+                atoms[key][atom_index]
+                for _ in range(len(ijk))
+                for atom_index in range(len(atoms["names"]))
+            ]
+
+    return new_atoms
+
+
+def _propagate(parameters, n_sites, supercell, ijk, n_atoms):
+    r"""
+    Propagates the parameters of one term over all unit cells of the supercell.
 
-                for (
-                    alpha,
-                    beta,
-                    gamma,
-                    epsilon,
-                    nu,
-                    _lambda,
-                    rho,
-                    parameter,
-                ) in spinham._44:
-                    alpha, _ = get_new_indices(alpha=alpha, nu=(0, 0, 0), ijk=(i, j, k))
-                    beta, nu = get_new_indices(alpha=beta, nu=nu, ijk=(i, j, k))
-                    gamma, _lambda = get_new_indices(
-                        alpha=gamma, nu=_lambda, ijk=(i, j, k)
-                    )
-                    epsilon, rho = get_new_indices(alpha=epsilon, nu=rho, ijk=(i, j, k))
-                    new_spinham.add_44(
-                        alpha=alpha,
-                        beta=beta,
-                        gamma=gamma,
-                        epsilon=epsilon,
-                        nu=nu,
-                        _lambda=_lambda,
-                        rho=rho,
-                        parameter=parameter,
-                        replace=True,
-                    )
+    Parameters
+    ----------
+    parameters : list
+        Parameters of one term of the original Hamiltonian, i.e. ``spinham._22``. First
+        ``n_sites`` elements of each entry are indices of atoms, next ``n_sites - 1``
+        elements are unit cells of all atoms but the first one and the last element is
+        the value of the parameter.
+    n_sites : int
+        Number of sites of the term.
+    supercell : (3, ) tuple of int
+        Repetitions of the unit cell along each lattice vector.
+    ijk : (K, 3) :numpy:`ndarray`
+        Unit cells of the supercell.
+    n_atoms : int
+        Number of atoms in the original unit cell.
 
-    return new_spinham
+    Returns
+    -------
+    new_parameters : iterator
+        Tuples ``(alphas, nus, parameter)`` with the indices of atoms and the unit cells
+        with respect to the supercell. Parameters propagated to the first unit cell of
+        ``ijk`` go first, then the ones propagated to the second one and so on.
+    """
+
+    if len(parameters) == 0:
+        return iter([])
+
+    alphas = np.array([entry[:n_sites] for entry in parameters], dtype=int)
+    nus = np.zeros((len(parameters), n_sites, 3), dtype=int)
+    if n_sites > 1:
+        nus[:, 1:] = [entry[n_sites : 2 * n_sites - 1] for entry in parameters]
+
+    # Shape (K, P, n_sites, 3), where P is the amount of parameters
+    new_nus, ijk = np.divmod(
+        nus[np.newaxis, :, :, :] + ijk[:, np.newaxis, np.newaxis, :], supercell
+    )
+
+    new_alphas = (
+        alphas[np.newaxis, :, :]
+        + (ijk[..., 0] + supercell[0] * (ijk[..., 1] + supercell[1] * ijk[..., 2]))
+        * n_atoms
+    )
+
+    new_alphas = new_alphas.reshape(-1, n_sites).tolist()
+    new_nus = [
+        tuple(tuple(nu) for nu in nus)
+        for nus in new_nus[:, :, 1:].reshape(len(new_alphas), n_sites - 1, 3).tolist()
+    ]
+    new_parameters = [entry[-1] for entry in parameters] * len(ijk)
+
+    return zip(new_alphas, new_nus, new_parameters)
 
 
 # Populate __all__ with objects defined in this file
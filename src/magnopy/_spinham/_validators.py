@@ -129,3 +129,23 @@ def _spins_ordered(mu1, alpha1, mu2, alpha2) -> bool:
         return True
 
     return False
+
+
+def _to_sorted_list(parameters):
+    r"""
+    Converts the dictionary of parameters to the sorted list, that is used to store
+    them in the spin Hamiltonian.
+
+    Parameters
+    ----------
+    parameters : dict
+        Keys are tuples with indices of atoms and unit cells, values are the
+        parameters.
+
+    Returns
+    -------
+    parameters : list
+        List of ``[*key, parameter]``, sorted by keys.
+    """
+
+    return [[*key, parameters[key]] for key in sorted(parameters)]
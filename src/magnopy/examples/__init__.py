@@ -22,3 +22,4 @@
 
 from ._ferro import *
 from ._other import *
+from ._synthetic import *
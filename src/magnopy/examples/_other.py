@@ -22,6 +22,7 @@
 
 import numpy as np
 
+from magnopy._constants._internal_units import BOHR_MAGNETON
 from magnopy._parameters._p22 import from_dmi, from_iso
 from magnopy._spinham._convention import Convention
 from magnopy._spinham._hamiltonian import SpinHamiltonian
@@ -97,8 +98,6 @@ def ivuzjo(N=10, J=10):
 
     D = J / 2
 
-    BOHR_MAGNETON = 0.057883818060  # meV / Tesla
-
     cell = np.eye(3, dtype=float) * N
 
     atoms = dict(names=[], positions=[], g_factors=[], spins=[])
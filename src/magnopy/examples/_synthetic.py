@@ -0,0 +1,389 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+
+from magnopy._spinham._convention import Convention
+from magnopy._spinham._hamiltonian import SpinHamiltonian
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+_TERMS = ["1", "21", "22", "31", "32", "33", "41", "421", "422", "43", "44"]
+
+
+def _to_parameter_list(indices, n_atoms, n_cells, parameters):
+    r"""
+    Converts the arrays of indices and parameters to the list, that is used to store
+    the parameters in the spin Hamiltonian.
+
+    Parameters
+    ----------
+    indices : (N, K) :numpy:`ndarray`
+        Indices of atoms, followed by the indices of unit cells. Rows are sorted.
+    n_atoms : int
+        Number of atom indices in each row.
+    n_cells : int
+        Number of unit cell indices in each row.
+    parameters : (N, 3, ...) :numpy:`ndarray`
+        Parameters.
+
+    Returns
+    -------
+    parameters : list
+        List of ``[*atoms, *cells, parameter]``.
+    """
+
+    columns = indices.T.tolist()
+    cells = [
+        zip(*columns[n_atoms + 3 * c : n_atoms + 3 * c + 3]) for c in range(n_cells)
+    ]
+
+    return [list(entry) for entry in zip(*columns[:n_atoms], *cells, list(parameters))]
+
+
+def _add_sites(rng, alphas, cells, nus, n_sublattices, n_new):
+    r"""
+    Adds random sites to the given groups of sites and returns the primary versions
+    of the groups.
+
+    Parameters
+    ----------
+    rng : :numpy:`random.Generator`
+        Random number generator.
+    alphas : (N, K) :numpy:`ndarray`
+        Indices of atoms of the groups.
+    cells : (N, K, 3) :numpy:`ndarray`
+        Indices of unit cells of the groups.
+    nus : (C, 3) :numpy:`ndarray`
+        Unit cells, from which the new sites are chosen.
+    n_sublattices : int
+        Number of atoms in the unit cell.
+    n_new : int
+        Number of sites to add to each group.
+
+    Returns
+    -------
+    indices : (P, K + n_new + 3 * (K + n_new - 1)) :numpy:`ndarray`
+        Unique groups of distinct sites. Sites of each group are ordered and the first
+        one is in the (0, 0, 0) unit cell. Rows are sorted.
+    """
+
+    alphas = np.concatenate(
+        (alphas, rng.integers(n_sublattices, size=(len(alphas), n_new))), axis=1
+    )
+    cells = np.concatenate(
+        (cells, nus[rng.integers(len(nus), size=(len(cells), n_new))]), axis=1
+    )
+
+    # Order of the sites (i, j, k, alpha), see _spins_ordered
+    offset = np.abs(cells).max(initial=0)
+    width = 2 * offset + 1
+    keys = (
+        ((cells[..., 0] + offset) * width + cells[..., 1] + offset) * width
+        + cells[..., 2]
+        + offset
+    ) * n_sublattices + alphas
+
+    order = np.argsort(keys, axis=1)
+    keys = np.take_along_axis(keys, order, axis=1)
+    alphas = np.take_along_axis(alphas, order, axis=1)
+    cells = np.take_along_axis(cells, order[..., np.newaxis], axis=1)
+
+    # Groups, in which any site repeats, are dropped
+    distinct = np.all(keys[:, 1:] != keys[:, :-1], axis=1)
+    alphas = alphas[distinct]
+    cells = cells[distinct]
+
+    # First site of each group is moved to the (0, 0, 0) unit cell
+    cells = cells[:, 1:] - cells[:, :1]
+
+    indices = np.concatenate(
+        (alphas, cells.reshape(len(cells), 3 * (cells.shape[1]))), axis=1
+    )
+
+    return np.unique(indices, axis=0)
+
+
+def random_ham(
+    n_sublattices: int = 1,
+    n_shells: int = 1,
+    terms=("21", "22"),
+    J_iso: float = -1,
+    anisotropy: float = 0.1,
+    dmi: float = 0.1,
+    higher_order: float = 0.01,
+    S: float = 1,
+    a: float = 1,
+    seed=None,
+) -> SpinHamiltonian:
+    r"""
+    Random spin Hamiltonian of the controllable size.
+
+    Intended for the tests of performance and memory. All parameters are added to
+    the Hamiltonian at once, thus models with millions of bonds are constructed in
+    seconds.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    n_sublattices : int, default 1
+        Number of atoms in the unit cell. Atoms are placed at random positions
+        within the unit cell.
+    n_shells : int, default 1
+        Number of shells of the neighboring unit cells. The shells are formed by the
+        unit cells :math:`\nu = (i, j, k)` with the same :math:`i^2 + j^2 + k^2`.
+        Bonds are added between all pairs of atoms of the (0, 0, 0) unit cell and
+        of the unit cells of the first ``n_shells`` shells (including the (0, 0, 0)
+        unit cell itself).
+    terms : list of str, default ("21", "22")
+        Terms of the Hamiltonian. Any of "1", "21", "22", "31", "32", "33", "41",
+        "421", "422", "43" and "44".
+    J_iso : float, default -1
+        Scale of the isotropic exchange of the "22" term. Values are drawn uniformly
+        from the interval between ``0.5 * J_iso`` and ``1.5 * J_iso``. Negative
+        values favor the parallel spins.
+    anisotropy : float, default 0.1
+        Scale of the random on-site anisotropy of the "21" term. Elements of the
+        symmetric matrices are drawn uniformly from the interval between
+        ``-anisotropy`` and ``anisotropy``.
+    dmi : float, default 0.1
+        Scale of the random Dzyaloshinskii-Moriya interaction of the "22" term.
+        Components of the DMI vectors are drawn uniformly from the interval between
+        ``-dmi`` and ``dmi``.
+    higher_order : float, default 0.01
+        Scale of the parameters of the terms other than "21" and "22". Elements of
+        the parameters are drawn uniformly from the interval between ``-higher_order``
+        and ``higher_order``.
+    S : float, default 1
+        Spin value of the magnetic sites.
+    a : float, default 1
+        Lattice parameter of the cubic lattice.
+    seed : int, optional
+        Seed of the random number generator. Hamiltonians with the same arguments and
+        the same seed are identical.
+
+    Returns
+    -------
+    spinham : :py:class:`.SpinHamiltonian`
+        Spin Hamiltonian.
+
+    Raises
+    ------
+    ValueError
+        If ``n_sublattices < 1``, ``n_shells < 0`` or if an unknown term is given.
+
+    Notes
+    -----
+    The convention of the Hamiltonian is multiple counting, not normalized spins,
+    with all numerical factors equal to one.
+
+    Two sites terms ("22", "32", "421" and "422") share the same bonds. The number
+    of bonds (primary versions only) is
+
+    .. math::
+
+        \dfrac{M(M-1)}{2} + \dfrac{M^2 (C - 1)}{2}
+
+    where :math:`M` is ``n_sublattices`` and :math:`C` is the number of unit cells
+    in the first ``n_shells`` shells including the (0, 0, 0) unit cell (7 for one
+    shell, 19 for two, 27 for three). For example, ``n_sublattices=550`` with one
+    shell gives about :math:`10^6` bonds.
+
+    For the three (four) sites terms one (two) random sites are added to each bond.
+    Groups of sites with repeated sites are skipped.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import magnopy
+        >>> spinham = magnopy.examples.random_ham(n_sublattices=10, n_shells=2, seed=0)
+        >>> spinham.M
+        10
+        >>> len(spinham.p22) // 2
+        945
+        >>> spinham = magnopy.examples.random_ham(
+        ...     n_sublattices=4, terms=["21", "22", "33", "44"], seed=0
+        ... )
+    """
+
+    if n_sublattices < 1:
+        raise ValueError(f"Expected at least one sublattice, got {n_sublattices}.")
+
+    if n_shells < 0:
+        raise ValueError(f"Expected non-negative number of shells, got {n_shells}.")
+
+    terms = [str(term) for term in terms]
+    for term in terms:
+        if term not in _TERMS:
+            raise ValueError(
+                f"Unknown term '{term}', supported terms are {', '.join(_TERMS)}."
+            )
+
+    rng = np.random.default_rng(seed)
+    M = n_sublattices
+
+    cell = a * np.eye(3, dtype=float)
+    atoms = dict(
+        names=[f"X{alpha + 1}" for alpha in range(M)],
+        species=["X" for _ in range(M)],
+        spins=[S for _ in range(M)],
+        g_factors=[2 for _ in range(M)],
+        positions=rng.random(size=(M, 3)).tolist(),
+    )
+    convention = Convention(
+        multiple_counting=True,
+        spin_normalized=False,
+        **{f"c{term}": 1 for term in _TERMS},
+    )
+
+    spinham = SpinHamiltonian(cell=cell, atoms=atoms, convention=convention)
+
+    # Unit cells of the first n_shells shells, (C, 3), (0, 0, 0) is the first one
+    nus = np.stack(
+        np.meshgrid(
+            *[np.arange(-n_shells, n_shells + 1) for _ in range(3)], indexing="ij"
+        ),
+        axis=-1,
+    ).reshape(-1, 3)
+    squared = np.sum(nus**2, axis=1)
+    shells = np.unique(squared)[: n_shells + 1]
+    nus = nus[np.isin(squared, shells)]
+    nus = nus[np.argsort(np.sum(nus**2, axis=1), kind="stable")]
+
+    # Primary bonds, see _spins_ordered
+    i, j, k = nus.T
+    nu_is_positive = (i > 0) | ((i == 0) & (j > 0)) | ((i == 0) & (j == 0) & (k > 0))
+    alphas, betas, cells = np.meshgrid(
+        np.arange(M), np.arange(M), np.arange(len(nus)), indexing="ij"
+    )
+    primary = nu_is_positive[cells] | ((cells == 0) & (alphas < betas))
+    bonds = np.concatenate(
+        (
+            alphas[primary][:, np.newaxis],
+            betas[primary][:, np.newaxis],
+            nus[cells[primary]],
+        ),
+        axis=1,
+    )
+    bonds = bonds[np.lexsort(bonds.T[::-1])]
+
+    def random(size, scale):
+        return rng.uniform(-scale, scale, size=size)
+
+    # One site terms
+    one_site = np.arange(M)[:, np.newaxis]
+
+    if "1" in terms:
+        spinham._1 = _to_parameter_list(
+            one_site, 1, 0, random(size=(M, 3), scale=higher_order)
+        )
+
+    if "21" in terms:
+        parameters = random(size=(M, 3, 3), scale=anisotropy)
+        parameters = (parameters + np.transpose(parameters, (0, 2, 1))) / 2
+        spinham._21 = _to_parameter_list(one_site, 1, 0, parameters)
+
+    if "31" in terms:
+        spinham._31 = _to_parameter_list(
+            one_site, 1, 0, random(size=(M, 3, 3, 3), scale=higher_order)
+        )
+
+    if "41" in terms:
+        spinham._41 = _to_parameter_list(
+            one_site, 1, 0, random(size=(M, 3, 3, 3, 3), scale=higher_order)
+        )
+
+    # Two sites terms
+    if "22" in terms:
+        parameters = (
+            J_iso
+            * rng.uniform(0.5, 1.5, size=len(bonds))[:, np.newaxis, np.newaxis]
+            * np.eye(3)
+        )
+        # Matrix form of DMI, see from_dmi
+        dmis = random(size=(len(bonds), 3), scale=dmi)
+        parameters[:, 0, 1] += dmis[:, 2]
+        parameters[:, 0, 2] -= dmis[:, 1]
+        parameters[:, 1, 2] += dmis[:, 0]
+        parameters[:, 1, 0] -= dmis[:, 2]
+        parameters[:, 2, 0] += dmis[:, 1]
+        parameters[:, 2, 1] -= dmis[:, 0]
+        spinham._22 = _to_parameter_list(bonds, 2, 1, parameters)
+
+    for term, rank in [("32", 3), ("421", 4), ("422", 4)]:
+        if term in terms:
+            setattr(
+                spinham,
+                f"_{term}",
+                _to_parameter_list(
+                    bonds,
+                    2,
+                    1,
+                    random(
+                        size=(len(bonds), *[3 for _ in range(rank)]), scale=higher_order
+                    ),
+                ),
+            )
+
+    # Three and four sites terms
+    bond_alphas = bonds[:, :2]
+    bond_cells = np.stack((np.zeros((len(bonds), 3), dtype=int), bonds[:, 2:]), axis=1)
+
+    for term, n_sites, rank in [("33", 3, 3), ("43", 3, 4), ("44", 4, 4)]:
+        if term in terms:
+            indices = _add_sites(
+                rng=rng,
+                alphas=bond_alphas,
+                cells=bond_cells,
+                nus=nus,
+                n_sublattices=M,
+                n_new=n_sites - 2,
+            )
+            setattr(
+                spinham,
+                f"_{term}",
+                _to_parameter_list(
+                    indices,
+                    n_sites,
+                    n_sites - 1,
+                    random(
+                        size=(len(indices), *[3 for _ in range(rank)]),
+                        scale=higher_order,
+                    ),
+                ),
+            )
+
+    spinham._reset_internals()
+
+    return spinham
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
@@ -20,6 +20,7 @@
 # ================================ END LICENSE =================================
 
 
+from ._binary import *
 from ._grogu import *
 from ._k_resolved import *
 from ._spin_directions import *
@@ -0,0 +1,323 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import json
+import struct
+import zipfile
+
+import numpy as np
+
+from magnopy import __version__
+from magnopy._spinham._convention import Convention
+from magnopy._spinham._hamiltonian import SpinHamiltonian
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+_FORMAT_NAME = "magnopy-spinham"
+_FORMAT_VERSION = 1
+
+# Name of the term, number of atom indices, number of unit cell indices, rank of
+# the parameter
+_TERMS = [
+    ("1", 1, 0, 1),
+    ("21", 1, 0, 2),
+    ("22", 2, 1, 2),
+    ("31", 1, 0, 3),
+    ("32", 2, 1, 3),
+    ("33", 3, 2, 3),
+    ("41", 1, 0, 4),
+    ("421", 2, 1, 4),
+    ("422", 2, 1, 4),
+    ("43", 3, 2, 4),
+    ("44", 4, 3, 4),
+]
+
+_CONVENTION_KEYS = [
+    "multiple_counting",
+    "spin_normalized",
+    "c1",
+    "c21",
+    "c22",
+    "c31",
+    "c32",
+    "c33",
+    "c41",
+    "c421",
+    "c422",
+    "c43",
+    "c44",
+    "name",
+]
+
+
+def _to_builtin(value):
+    r"""
+    Converts numpy objects, that are nested in lists, tuples and dictionaries, to
+    the built-in python types.
+    """
+
+    if isinstance(value, dict):
+        return {str(key): _to_builtin(value[key]) for key in value}
+
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+
+    return value
+
+
+def _memmap_member(filename, archive, name):
+    r"""
+    Opens one array of the uncompressed .npz file as a read-only memory map.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the .npz file.
+    archive : :py:class:`zipfile.ZipFile`
+        Opened .npz file.
+    name : str
+        Name of the array.
+
+    Returns
+    -------
+    array : :numpy:`ndarray`
+        Array, that is mapped to the file. If the array is compressed or empty, then
+        it is read in memory.
+    """
+
+    info = archive.getinfo(f"{name}.npy")
+
+    if info.compress_type != zipfile.ZIP_STORED or info.file_size == 0:
+        with archive.open(info) as f:
+            return np.lib.format.read_array(f, allow_pickle=False)
+
+    with open(filename, "rb") as f:
+        # Local file header of the zip archive: 30 bytes, name and extra field
+        f.seek(info.header_offset)
+        header = f.read(30)
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    if dtype.hasobject or 0 in shape:
+        with archive.open(info) as f:
+            return np.lib.format.read_array(f, allow_pickle=False)
+
+    return np.asarray(
+        np.memmap(
+            filename,
+            dtype=dtype,
+            mode="r",
+            shape=shape,
+            order="F" if fortran_order else "C",
+            offset=offset,
+        )
+    )
+
+
+def save_spinham(spinham, filename) -> None:
+    r"""
+    Saves the spin Hamiltonian to the binary file.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    spinham : :py:class:`.SpinHamiltonian`
+        Spin Hamiltonian.
+    filename : str
+        Name of the file. If it does not end with ".npz", then ".npz" is appended.
+
+    See Also
+    --------
+    load_spinham
+
+    Notes
+    -----
+    The file is an uncompressed .npz archive (see :numpy:`savez`). It contains
+
+    * ``metadata`` - JSON string with the name and version of the format, version of
+      magnopy, convention, atoms and the settings of
+      :py:meth:`.SpinHamiltonian.add_dipole_dipole_ewald`.
+    * ``cell`` - (3, 3) array.
+    * ``p{term}_indices`` - (N, K) array with the indices of atoms, followed by the
+      indices of unit cells, for each of N parameters of the term. For example,
+      ``alpha, beta, i, j, k`` for ``p22``.
+    * ``p{term}_parameters`` - (N, 3, ...) array with the parameters of the term.
+
+    Only the terms with at least one parameter are saved. Parameters are saved as they
+    are stored in the Hamiltonian, i.e. only the primary versions of the bonds.
+    """
+
+    metadata = dict(
+        format=_FORMAT_NAME,
+        format_version=_FORMAT_VERSION,
+        magnopy_version=__version__,
+        convention={
+            key: getattr(spinham.convention, f"_{key}") for key in _CONVENTION_KEYS
+        },
+        atoms=_to_builtin(dict(spinham.atoms)),
+        dipole_dipole_ewald=_to_builtin(spinham._dipole_dipole_ewald),
+    )
+
+    arrays = dict(
+        metadata=np.array(json.dumps(metadata)),
+        cell=np.array(spinham.cell, dtype=float),
+    )
+
+    for name, n_atoms, n_cells, rank in _TERMS:
+        parameters = getattr(spinham, f"_{name}")
+
+        if len(parameters) == 0:
+            continue
+
+        indices = np.empty((len(parameters), n_atoms + 3 * n_cells), dtype=np.int64)
+        values = np.empty((len(parameters), *[3 for _ in range(rank)]), dtype=float)
+
+        for n, parameter in enumerate(parameters):
+            indices[n, :n_atoms] = parameter[:n_atoms]
+            for c in range(n_cells):
+                indices[n, n_atoms + 3 * c : n_atoms + 3 * c + 3] = parameter[
+                    n_atoms + c
+                ]
+            values[n] = parameter[-1]
+
+        arrays[f"p{name}_indices"] = indices
+        arrays[f"p{name}_parameters"] = values
+
+    np.savez(filename, **arrays)
+
+
+def load_spinham(filename, mmap=True) -> SpinHamiltonian:
+    r"""
+    Loads the spin Hamiltonian from the binary file, that was written by
+    :py:func:`.save_spinham`.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file.
+    mmap : bool, default True
+        Whether to map the parameters from the file to the memory instead of reading
+        them. Mapped parameters are read-only views of the file and are loaded from the
+        disk on demand. Pages of the file are shared by all processes, that open it.
+        Indices of atoms and unit cells are always read and converted to the lists of
+        the Hamiltonian, therefore the time of loading grows linearly with the number
+        of parameters in either case.
+
+    Returns
+    -------
+    spinham : :py:class:`.SpinHamiltonian`
+        Spin Hamiltonian.
+
+    Raises
+    ------
+    ValueError
+        If the file is not written by :py:func:`.save_spinham` or if it is written in
+        the newer version of the format.
+
+    See Also
+    --------
+    save_spinham
+    """
+
+    with zipfile.ZipFile(filename, "r") as archive:
+        names = [name[:-4] for name in archive.namelist() if name.endswith(".npy")]
+
+        if "metadata" not in names:
+            raise ValueError(
+                f"File '{filename}' does not contain a spin Hamiltonian saved by magnopy."
+            )
+
+        with archive.open("metadata.npy") as f:
+            metadata = json.loads(str(np.lib.format.read_array(f, allow_pickle=False)))
+
+        if metadata.get("format") != _FORMAT_NAME:
+            raise ValueError(
+                f"File '{filename}' does not contain a spin Hamiltonian saved by magnopy."
+            )
+
+        if metadata["format_version"] > _FORMAT_VERSION:
+            raise ValueError(
+                f"File '{filename}' is written in the version "
+                f"{metadata['format_version']} of the format, this version of magnopy "
+                f"supports versions up to {_FORMAT_VERSION}."
+            )
+
+        def read(name):
+            if mmap:
+                return _memmap_member(filename=filename, archive=archive, name=name)
+
+            with archive.open(f"{name}.npy") as f:
+                return np.lib.format.read_array(f, allow_pickle=False)
+
+        spinham = SpinHamiltonian(
+            cell=read("cell"),
+            atoms=metadata["atoms"],
+            convention=Convention(**metadata["convention"]),
+        )
+
+        for name, n_atoms, n_cells, _ in _TERMS:
+            if f"p{name}_indices" not in names:
+                continue
+
+            # Columns of indices, (K, N)
+            columns = read(f"p{name}_indices").T.tolist()
+            cells = [
+                zip(*columns[n_atoms + 3 * c : n_atoms + 3 * c + 3])
+                for c in range(n_cells)
+            ]
+            values = read(f"p{name}_parameters")
+
+            setattr(
+                spinham,
+                f"_{name}",
+                [
+                    list(entry)
+                    for entry in zip(*columns[:n_atoms], *cells, list(values))
+                ],
+            )
+
+    spinham._dipole_dipole_ewald = metadata["dipole_dipole_ewald"]
+    spinham._reset_internals()
+
+    return spinham
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
@@ -22,14 +22,76 @@
 
 import numpy as np
 
+from magnopy._spinham._c22 import _get_primary_p22
 from magnopy._spinham._convention import Convention
 from magnopy._spinham._hamiltonian import SpinHamiltonian
+from magnopy._spinham._validators import _to_sorted_list
 
 # Save local scope at this moment
 old_dir = set(dir())
 old_dir.add("old_dir")
 
 
+def _find_line(lines, start, keywords) -> int:
+    r"""
+    Finds the first line, that contains all keywords.
+
+    Parameters
+    ----------
+    lines : list of str
+        Lines of the file.
+    start : int
+        Index of the line from which the search starts.
+    keywords : list of str
+        Keywords in lower case. Comparison is case-insensitive.
+
+    Returns
+    -------
+    index : int
+        Index of the found line.
+
+    Raises
+    ------
+    ValueError
+        If no line contains all keywords.
+    """
+
+    for index in range(start, len(lines)):
+        line = lines[index].lower()
+        if all(keyword in line for keyword in keywords):
+            return index
+
+    raise ValueError(f"Can not find a line with the keywords {keywords}.")
+
+
+def _read_matrices(lines, first, period, n_matrices):
+    r"""
+    Parses 3x3 matrices, that are repeated with fixed period in the file.
+
+    Parameters
+    ----------
+    lines : list of str
+        Lines of the file.
+    first : int
+        Index of the first line of the first matrix.
+    period : int
+        Amount of lines between the first lines of the consecutive matrices.
+    n_matrices : int
+        Amount of matrices.
+
+    Returns
+    -------
+    matrices : (n_matrices, 3, 3) :numpy:`ndarray`
+    """
+
+    if n_matrices == 0:
+        return np.zeros((0, 3, 3), dtype=float)
+
+    rows = [lines[first + period * n + r] for n in range(n_matrices) for r in range(3)]
+
+    return np.fromstring(" ".join(rows), dtype=float, sep=" ").reshape(n_matrices, 3, 3)
+
+
 def load_grogu(filename) -> SpinHamiltonian:
     r"""
     Load a SpinHamiltonian object from a .txt file produced by |GROGU|_.
@@ -54,11 +116,7 @@ def load_grogu(filename) -> SpinHamiltonian:
         lines = f.readlines()
 
     # Read the cell
-    i = 0
-    while "cell" not in lines[i].lower() or "(ang)" not in lines[i].lower():
-        i += 1
-
-    i += 1
+    i = _find_line(lines, start=0, keywords=["cell", "(ang)"]) + 1
 
     cell = [
         list(map(float, lines[i].split())),
@@ -67,8 +125,7 @@ def load_grogu(filename) -> SpinHamiltonian:
     ]
 
     # Read the atoms
-    while "magnetic" not in lines[i].lower() or "sites" not in lines[i].lower():
-        i += 1
+    i = _find_line(lines, start=i, keywords=["magnetic", "sites"])
 
     i += 1
     M = int(lines[i].split()[3])
@@ -96,57 +153,44 @@ def load_grogu(filename) -> SpinHamiltonian:
     # Construct spin Hamiltonian:
     spinham = SpinHamiltonian(convention=convention, cell=cell, atoms=atoms)
 
-    while (
-        "intra-atomic" not in lines[i].lower()
-        or "anisotropy" not in lines[i].lower()
-        or "tensor" not in lines[i].lower()
-        or "(mev)" not in lines[i].lower()
-    ):
-        i += 1
-
-    for _ in range(M):
-        i += 2
-        name = lines[i].split()[0]
-        alpha = name_to_index[name]
-        i += 2
-        parameter = [
-            list(map(float, lines[i].split())),
-            list(map(float, lines[i + 1].split())),
-            list(map(float, lines[i + 2].split())),
-        ]
-        i += 2
-        spinham.add_21(alpha=alpha, parameter=parameter)
-
-    while (
-        "exchange" not in lines[i].lower()
-        or "tensor" not in lines[i].lower()
-        or "(mev)" not in lines[i].lower()
-    ):
-        i += 1
-
-    i += 1
-    N = int(lines[i].split()[3])
-    i += 2
+    # Read on-site anisotropy. Each block takes six lines: separator, name of the
+    # atom, title and three rows of the matrix.
+    i = _find_line(
+        lines, start=i, keywords=["intra-atomic", "anisotropy", "tensor", "(mev)"]
+    )
 
-    for _ in range(N):
-        i += 2
+    parameters = _read_matrices(lines, first=i + 4, period=6, n_matrices=M)
 
-        words = lines[i].split()
-        alpha = name_to_index[words[0]]
-        beta = name_to_index[words[1]]
-        nu = tuple(list(map(int, words[2:5])))
+    for n in range(M):
+        alpha = name_to_index[lines[i + 2 + 6 * n].split()[0]]
+        spinham.add_21(alpha=alpha, parameter=parameters[n])
 
-        i += 2
+    i += 6 * M
 
-        parameter = [
-            list(map(float, lines[i].split())),
-            list(map(float, lines[i + 1].split())),
-            list(map(float, lines[i + 2].split())),
-        ]
+    # Read exchange. Each block takes six lines: separator, names of the atoms
+    # with the unit cell, title and three rows of the matrix.
+    i = _find_line(lines, start=i, keywords=["exchange", "tensor", "(mev)"])
 
-        i += 2
+    i += 1
+    N = int(lines[i].split()[3])
+    i += 2
 
-        spinham.add_22(alpha=alpha, beta=beta, nu=nu, parameter=parameter, replace=True)
+    parameters = _read_matrices(lines, first=i + 4, period=6, n_matrices=N)
+
+    # The last block wins if the same bond (or its double) is given twice
+    new_parameters = {}
+    for n in range(N):
+        words = lines[i + 2 + 6 * n].split()
+        alpha, beta, nu, parameter = _get_primary_p22(
+            alpha=name_to_index[words[0]],
+            beta=name_to_index[words[1]],
+            nu=tuple(map(int, words[2:5])),
+            parameter=parameters[n],
+        )
+        new_parameters[(alpha, beta, nu)] = parameter
+
+    spinham._22 = _to_sorted_list(new_parameters)
+    spinham._reset_internals()
 
     return spinham
 
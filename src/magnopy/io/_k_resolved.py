@@ -20,15 +20,15 @@
 # ================================ END LICENSE =================================
 
 
+from importlib.util import find_spec
 from typing import Iterable
 import warnings
 
-try:
-    import matplotlib.pyplot as plt
-
+# matplotlib is imported only when the plot is requested
+if find_spec("matplotlib") is not None:
     MATPLOTLIB_AVAILABLE = True
     MATPLOTLIB_ERROR_MESSAGE = "If you see this message, please contact developers of the code (see magnopy.org)."
-except ImportError:
+else:
     MATPLOTLIB_AVAILABLE = False
     MATPLOTLIB_ERROR_MESSAGE = "\n".join(
         [
@@ -200,7 +200,7 @@ def output_k_resolved(
         return lines
 
 
-def plot_k_resolved(data, kp=None, output_filename=None, ylabel=None):
+def plot_k_resolved(data, kp=None, output_filename=None, ylabel=None, flat_points=None):
     r"""
     Plot some k-resolved data.
 
@@ -220,6 +220,11 @@ def plot_k_resolved(data, kp=None, output_filename=None, ylabel=None):
         opened in the interactive matplotlib window.
     ylabel : str, optional
         Label for the ordinate (y axis).
+    flat_points : (N, ) |array-like|_, optional
+        Abscissa of the data, compatible with ``kp.ticks()``. By default
+        ``kp.flat_points()`` is used. Ignored if ``kp`` is not given.
+
+        .. versionadded:: 0.3.0
     """
 
     if not MATPLOTLIB_AVAILABLE:
@@ -229,20 +234,25 @@ def plot_k_resolved(data, kp=None, output_filename=None, ylabel=None):
 
         return
 
+    import matplotlib.pyplot as plt
+
     data = np.array(data).T
 
+    if kp is not None and flat_points is None:
+        flat_points = kp.flat_points()
+
     fig, ax = plt.subplots()
 
     if len(data.shape) == 2:
         for entry in data:
             if kp is not None:
-                ax.plot(kp.flat_points(), entry, lw=1, color="#A47864")
+                ax.plot(flat_points, entry, lw=1, color="#A47864")
             else:
                 ax.plot(entry, lw=1, color="#A47864")
                 ax.set_xlim(0, len(entry))
     else:
         if kp is not None:
-            ax.plot(kp.flat_points(), data, lw=1, color="#A47864")
+            ax.plot(flat_points, data, lw=1, color="#A47864")
         else:
             ax.plot(data, lw=1, color="#A47864")
             ax.set_xlim(0, len(data))
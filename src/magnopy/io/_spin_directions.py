@@ -20,14 +20,15 @@
 # ================================ END LICENSE =================================
 
 
-import numpy as np
+from importlib.util import find_spec
 
-try:
-    import plotly.graph_objects as go
+import numpy as np
 
+# plotly is imported only when the plot is requested
+if find_spec("plotly") is not None:
     PLOTLY_AVAILABLE = True
     PLOTLY_ERROR_MESSAGE = "If you see this message, please contact developers of the code (see magnopy.org)."
-except ImportError:
+else:
     PLOTLY_AVAILABLE = False
     PLOTLY_ERROR_MESSAGE = "\n".join(
         [
@@ -128,6 +129,8 @@ def _plot_cones(fig, positions, spin_directions, color, name=None):
     if not PLOTLY_AVAILABLE:
         raise ImportError(PLOTLY_ERROR_MESSAGE)
 
+    import plotly.graph_objects as go
+
     # Prepare data
     x, y, z = np.transpose(positions, axes=(1, 0))
     u, v, w = np.transpose(spin_directions, axes=(1, 0))
@@ -21,11 +21,11 @@
 
 
 import numpy as np
-from wulfric.crystal import get_distance
 
-from magnopy._parameters._p22 import from_dmi, from_iso
+from magnopy._spinham._c22 import _get_primary_p22
 from magnopy._spinham._convention import Convention
 from magnopy._spinham._hamiltonian import SpinHamiltonian
+from magnopy._spinham._validators import _to_sorted_list
 
 # Save local scope at this moment
 old_dir = set(dir())
@@ -153,66 +153,88 @@ def load_tb2j(
     for index, name in enumerate(spinham.atoms.names):
         index_mapping[name] = index
 
-    # Read exchange (22) parameters
-    while line:
-        while line and minor_sep not in line:
-            line = file.readline()
-        line = file.readline().translate(garbage).split()
-        atom1 = index_mapping[line[0]]
-        atom2 = index_mapping[line[1]]
-        ijk = tuple(map(int, line[2:5]))
-        distance = float(line[-1])
-        iso = None
-        aniso = None
-        dmi = None
-        while line and minor_sep not in line:
-            line = file.readline()
-
-            # Read isotropic exchange
-            if line and iso_flag in line:
-                iso = float(line.split()[-1])
-
-            # Read anisotropic exchange
-            if line and aniso_flag in line:
-                aniso = np.array(
-                    [
-                        list(map(float, file.readline().translate(garbage).split())),
-                        list(map(float, file.readline().translate(garbage).split())),
-                        list(map(float, file.readline().translate(garbage).split())),
-                    ]
-                )
-
-            # Read DMI
-            if line and dmi_flag in line:
-                dmi = tuple(map(float, line.translate(garbage).split()[-3:]))
-
-        parameter = np.zeros((3, 3), dtype=float)
-        if iso is not None:
-            parameter = parameter + from_iso(iso=iso)
-        if dmi is not None:
-            parameter = parameter + from_dmi(dmi=dmi)
+    # Read exchange (22) parameters. Data of all blocks are accumulated first and the
+    # parameters are added to the Hamiltonian at once.
+    alphas = []
+    betas = []
+    nus = []
+    distances = []
+    isos = []
+    anisos = []
+    dmis = []
+
+    for line in file:
+        # New exchange block
+        if minor_sep in line:
+            line = next(file, "").translate(garbage).split()
+            if not line:
+                break
+            alphas.append(index_mapping[line[0]])
+            betas.append(index_mapping[line[1]])
+            nus.append(tuple(map(int, line[2:5])))
+            distances.append(float(line[-1]))
+            isos.append(0.0)
+            anisos.append(None)
+            dmis.append((0.0, 0.0, 0.0))
+
+        # Read isotropic exchange
+        elif iso_flag in line:
+            isos[-1] = float(line.split()[-1])
+
+        # Read anisotropic exchange
+        elif aniso_flag in line:
+            anisos[-1] = [
+                list(map(float, next(file).translate(garbage).split()))
+                for _ in range(3)
+            ]
+
+        # Read DMI
+        elif dmi_flag in line:
+            dmis[-1] = tuple(map(float, line.translate(garbage).split()[-3:]))
+
+    file.close()
+
+    # Full matrices of all parameters, (N, 3, 3)
+    parameters = np.array(isos, dtype=float)[:, np.newaxis, np.newaxis] * np.eye(3)
+    # Matrix form of DMI, see from_dmi
+    dmis = np.array(dmis, dtype=float).reshape(-1, 3)
+    parameters[:, 0, 1] += dmis[:, 2]
+    parameters[:, 0, 2] -= dmis[:, 1]
+    parameters[:, 1, 2] += dmis[:, 0]
+    parameters[:, 1, 0] -= dmis[:, 2]
+    parameters[:, 2, 0] += dmis[:, 1]
+    parameters[:, 2, 1] -= dmis[:, 0]
+    # Avoid making aniso traceless and symmetric, as it would loose part of the
+    # matrix. Due to the TB2J problem: aniso not always traceless.
+    for index, aniso in enumerate(anisos):
         if aniso is not None:
-            parameter = parameter + aniso
-
-        # Adding info from the exchange block to the SpinHamiltonian structure
-        spinham.add_22(
-            alpha=atom1,
-            beta=atom2,
-            nu=ijk,
-            # Avoid passing aniso to the function as then the function make it traceless
-            # and symmetric, potentially loosing part of the matrix.
-            # Due to the TB2J problem: aniso not always traceless.
-            parameter=parameter,
-            replace=True,
+            parameters[index] += aniso
+
+    # Adding info from the exchange blocks to the SpinHamiltonian structure. The
+    # last block wins if the same bond (or its double) is given twice.
+    new_parameters = {}
+    for alpha, beta, nu, parameter in zip(alphas, betas, nus, parameters):
+        alpha, beta, nu, parameter = _get_primary_p22(
+            alpha=alpha, beta=beta, nu=nu, parameter=parameter
         )
+        new_parameters[(alpha, beta, nu)] = parameter
+    spinham._22 = _to_sorted_list(new_parameters)
+    spinham._reset_internals()
 
-        computed_distance = get_distance(spinham.cell, spinham.atoms, atom1, atom2, ijk)
-        if abs(computed_distance - distance) > 0.001 and not quiet:
-            print(
-                "\nComputed distance is a different from the read one:\n"
-                + f"  Computed: {computed_distance:.4f}\n  "
-                + f"Read: {distance:.4f}\n"
-            )
+    # Compare computed distances with the read ones
+    if not quiet and len(alphas) > 0:
+        positions = np.array(spinham.atoms.positions, dtype=float)
+        computed_distances = np.linalg.norm(
+            (positions[betas] - positions[alphas] + np.array(nus)) @ spinham.cell,
+            axis=1,
+        )
+        for computed_distance, distance in zip(computed_distances, distances):
+            if abs(computed_distance - distance) > 0.001:
+                print(
+                    "\nComputed distance is a different from the read one:\n"
+                    + f"  Computed: {computed_distance:.4f}\n  "
+                    + f"Read: {distance:.4f}\n"
+                )
 
     # Populate spin_values of atoms
     if spin_values is not None:
@@ -232,6 +254,7 @@ def load_tb2j(
         ]
 
     spinham.atoms["spins"] = true_spin_values
+    # Values of spins are changed, drop everything, that is derived from them
     spinham._reset_internals()
 
     return spinham
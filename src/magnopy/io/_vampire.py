@@ -250,8 +250,7 @@ def dump_vampire_ucf(
     if materials is None:
         materials = [i for i in range(len(spinham.magnetic_atoms.names))]
 
-    original_convention = spinham.convention
-    spinham.convention = Convention.get_predefined(name="Vampire")
+    spinham = spinham.view(convention=Convention.get_predefined(name="Vampire"))
 
     if no_logo:
         text = []
@@ -293,9 +292,9 @@ def dump_vampire_ucf(
             J = custom_mask(J)
         else:
             if not dmi:
-                J -= to_dmi(J, matrix_form=True)
+                J = J - to_dmi(J, matrix_form=True)
             if not anisotropic:
-                J -= to_symm_anisotropy(J)
+                J = J - to_symm_anisotropy(J)
         J = J * ENERGY
         text.append(
             f"{IID:<5} {alpha:>3} {alpha:>3}  {0:>2} {0:>2} {0:>2}  "
@@ -314,9 +313,9 @@ def dump_vampire_ucf(
             J = custom_mask(J)
         else:
             if not dmi:
-                J -= to_dmi(J, matrix_form=True)
+                J = J - to_dmi(J, matrix_form=True)
             if not anisotropic:
-                J -= to_symm_anisotropy(J)
+                J = J - to_symm_anisotropy(J)
         # print(alpha, beta, nu)
         # print(J, end="\n\n")
         J = J * ENERGY
@@ -336,8 +335,6 @@ def dump_vampire_ucf(
         )
         IID += 1
 
-    spinham.convention = original_convention
-
     text = "\n".join(text)
 
     if filename is None:
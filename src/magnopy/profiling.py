@@ -0,0 +1,294 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+R"""
+Timing and profiling of the stages of the calculations.
+"""
+
+import cProfile
+import json
+import os
+import re
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+
+from magnopy import __version__
+
+try:
+    import resource
+
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+
+def _get_cpu_time():
+    r"""
+    Returns user and system CPU time of the process and of its terminated child
+    processes (i.e. workers of :py:func:`.multiprocess_over_k`), in seconds.
+    """
+
+    times = os.times()
+
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _get_peak_rss():
+    r"""
+    Returns maximum resident set size of the process since its start, in bytes.
+    ``None`` if it can not be obtained on this platform.
+    """
+
+    if not RESOURCE_AVAILABLE:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS reports bytes
+    if os.uname().sysname != "Darwin":
+        peak_rss *= 1024
+
+    return peak_rss
+
+
+class Profiler:
+    r"""
+    Records wall time, CPU time and peak memory of the consecutive stages of the
+    calculation.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    use_cprofile : bool, default False
+        Whether to run each stage under |cProfile|_. Profiles are written to the .prof
+        files by :py:meth:`.Profiler.save` and can be inspected with :py:mod:`pstats`
+        or any compatible viewer.
+    trace_memory : bool, default False
+        Whether to trace memory allocations of each stage with :py:mod:`tracemalloc`.
+        It gives the peak memory of each stage, but slows the calculation down.
+
+    Attributes
+    ----------
+    stages : list of dict
+        Recorded stages in the order of their start. Each stage is described by
+
+        * ``name`` - name of the stage.
+        * ``wall_time`` - wall time, seconds.
+        * ``cpu_time`` - user and system CPU time of the process and of its finished
+          child processes, seconds.
+        * ``peak_rss`` - maximum resident set size of the process at the end of the
+          stage, bytes. ``None`` if not available on the platform.
+        * ``peak_traced`` - peak size of the memory blocks allocated during the stage,
+          bytes. ``None`` if ``trace_memory=False``.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> from magnopy.profiling import Profiler
+        >>> profiler = Profiler()
+        >>> with profiler.stage("Sum"):
+        ...     s = sum(range(1000))
+        >>> profiler.start("Product")
+        >>> p = 2 * s
+        >>> profiler.stop()
+        >>> [stage["name"] for stage in profiler.stages]
+        ['Sum', 'Product']
+    """
+
+    def __init__(self, use_cprofile=False, trace_memory=False):
+        self.use_cprofile = bool(use_cprofile)
+        self.trace_memory = bool(trace_memory)
+
+        self.stages = []
+
+        self._profiles = {}
+        self._current = None
+
+    def start(self, name) -> None:
+        r"""
+        Starts the stage. Previous stage is stopped, if it was not stopped yet.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        """
+
+        if self._current is not None:
+            self.stop()
+
+        profile = None
+        if self.use_cprofile:
+            profile = cProfile.Profile()
+
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+
+        self._current = dict(
+            name=str(name),
+            profile=profile,
+            started_tracing=started_tracing,
+            wall_time=perf_counter(),
+            cpu_time=_get_cpu_time(),
+        )
+
+        if profile is not None:
+            profile.enable()
+
+    def stop(self) -> None:
+        r"""
+        Stops the current stage and records it in :py:attr:`.Profiler.stages`. Does
+        nothing if no stage is running.
+        """
+
+        if self._current is None:
+            return
+
+        current = self._current
+        self._current = None
+
+        if current["profile"] is not None:
+            current["profile"].disable()
+            self._profiles[len(self.stages)] = current["profile"]
+
+        wall_time = perf_counter() - current["wall_time"]
+        cpu_time = _get_cpu_time() - current["cpu_time"]
+
+        peak_traced = None
+        if self.trace_memory:
+            peak_traced = tracemalloc.get_traced_memory()[1]
+            if current["started_tracing"]:
+                tracemalloc.stop()
+
+        self.stages.append(
+            dict(
+                name=current["name"],
+                wall_time=wall_time,
+                cpu_time=cpu_time,
+                peak_rss=_get_peak_rss(),
+                peak_traced=peak_traced,
+            )
+        )
+
+    @contextmanager
+    def stage(self, name):
+        r"""
+        Context manager, that records the stage of the calculation.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        """
+
+        self.start(name)
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def summary(self) -> str:
+        r"""
+        Returns the table with the recorded stages.
+
+        Returns
+        -------
+        summary : str
+            One line per stage with the wall time, CPU time and peak memory.
+        """
+
+        lines = [f"{'Stage':<40} {'Wall, s':>12} {'CPU, s':>12} {'Peak RSS, MB':>14}"]
+
+        for stage in self.stages:
+            if stage["peak_rss"] is None:
+                peak_rss = f"{'-':>14}"
+            else:
+                peak_rss = f"{stage['peak_rss'] / 1024**2:>14.1f}"
+
+            lines.append(
+                f"{stage['name']:<40} {stage['wall_time']:>12.3f} "
+                f"{stage['cpu_time']:>12.3f} {peak_rss}"
+            )
+
+        lines.append(
+            f"{'Total':<40} {sum(stage['wall_time'] for stage in self.stages):>12.3f} "
+            f"{sum(stage['cpu_time'] for stage in self.stages):>12.3f}"
+        )
+
+        return "\n".join(lines)
+
+    def save(self, output_folder) -> list:
+        r"""
+        Saves the recorded stages to the file "TIMINGS.json" and, if
+        ``use_cprofile=True``, profiles of the stages to the files
+        "PROFILE-{stage}.prof".
+
+        Parameters
+        ----------
+        output_folder : str
+            Folder for the files. Created if it does not exist.
+
+        Returns
+        -------
+        filenames : list of str
+            Names of the written files.
+        """
+
+        os.makedirs(output_folder, exist_ok=True)
+
+        filenames = []
+
+        filename = os.path.join(output_folder, "TIMINGS.json")
+        with open(filename, "w") as f:
+            json.dump(
+                dict(magnopy_version=__version__, stages=self.stages), f, indent=4
+            )
+        filenames.append(filename)
+
+        for index, profile in self._profiles.items():
+            name = re.sub(r"[^A-Za-z0-9]+", "-", self.stages[index]["name"])
+            filename = os.path.join(
+                output_folder, f"PROFILE-{name.strip('-').upper()}.prof"
+            )
+            profile.dump_stats(filename)
+            filenames.append(filename)
+
+        return filenames
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
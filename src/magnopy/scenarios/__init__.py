@@ -20,5 +20,6 @@
 # ================================ END LICENSE =================================
 
 
+from ._field_sweep import *
 from ._optimize_sd import *
 from ._solve_lswt import *
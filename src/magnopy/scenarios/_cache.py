@@ -0,0 +1,173 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import hashlib
+import os
+import re
+import tempfile
+import zipfile
+
+import numpy as np
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+# Names of the cache entries. Other files in the cache directory are never touched
+_ENTRY_NAME = re.compile(r"[0-9a-f]{64}\.npz")
+
+
+def _get_cache_key(*parts) -> str:
+    r"""
+    Computes the key of the cache entry.
+
+    Parameters
+    ----------
+    *parts
+        Strings, numbers, arrays or ``None``. Arrays are compared by their values
+        as float64 numbers.
+
+    Returns
+    -------
+    key : str
+        Hexadecimal SHA-256 digest.
+    """
+
+    digest = hashlib.sha256()
+
+    for part in parts:
+        if part is None or isinstance(part, str):
+            digest.update(repr(part).encode())
+        else:
+            # Adding 0.0 turns -0.0 into 0.0
+            part = np.ascontiguousarray(part, dtype="<f8") + 0.0
+            digest.update(repr(part.shape).encode())
+            digest.update(part.tobytes())
+
+        # Separator between the parts
+        digest.update(b"|")
+
+    return digest.hexdigest()
+
+
+def _load_from_cache(cache_dir, key):
+    r"""
+    Loads the arrays from the cache entry.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory of the cache.
+    key : str
+        Key of the entry, see :py:func:`_get_cache_key`.
+
+    Returns
+    -------
+    arrays : dict or None
+        Arrays of the entry. ``None`` if the entry does not exist or can not be read.
+    """
+
+    filename = os.path.join(cache_dir, f"{key}.npz")
+
+    try:
+        with np.load(filename, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+    except (OSError, ValueError, zipfile.BadZipFile):
+        return None
+
+    # Mark the entry as recently used
+    try:
+        os.utime(filename)
+    except OSError:
+        pass
+
+    return arrays
+
+
+def _save_to_cache(cache_dir, key, max_size, **arrays) -> None:
+    r"""
+    Saves the arrays as the cache entry and removes the least recently used entries,
+    if the cache is too large.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory of the cache. Created if it does not exist.
+    key : str
+        Key of the entry, see :py:func:`_get_cache_key`.
+    max_size : int
+        Maximum total size of the entries in bytes. Only the files, that are named as
+        the cache entries, are counted and removed, other files in ``cache_dir`` are
+        left untouched.
+    **arrays
+        Arrays to be saved.
+    """
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Write to the temporary file first, so that the concurrent readers never see
+    # a partially written entry
+    descriptor, tmp_filename = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_filename, os.path.join(cache_dir, f"{key}.npz"))
+    except BaseException:
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
+        raise
+
+    # Only the files, that are named as the cache entries, are counted and removed
+    entries = []
+    for name in os.listdir(cache_dir):
+        if _ENTRY_NAME.fullmatch(name) is None:
+            continue
+        try:
+            stat = os.stat(os.path.join(cache_dir, name))
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name))
+
+    # Least recently used first
+    entries.sort()
+    total_size = sum(size for _, size, _ in entries)
+
+    for _, size, name in entries:
+        if total_size <= max_size:
+            break
+        # Just written entry is kept, even if it alone exceeds the limit
+        if name == f"{key}.npz":
+            continue
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            pass
+        total_size -= size
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
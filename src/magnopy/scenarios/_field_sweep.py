@@ -0,0 +1,277 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import os
+from multiprocessing import Pool
+
+import numpy as np
+import wulfric
+
+from magnopy._energy import Energy
+from magnopy._lswt import LSWT
+from magnopy._package_info import logo
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+
+def field_sweep(
+    spinham,
+    fields,
+    kpoints,
+    relative=False,
+    initial_guess=None,
+    energy_tolerance=1e-5,
+    torque_tolerance=1e-5,
+    output_folder="magnopy-results",
+    number_processors=None,
+    comment=None,
+    hide_personal_data=False,
+) -> None:
+    r"""
+    Solves the spin Hamiltonian at the level of Linear Spin Wave theory for a
+    sequence of external magnetic fields.
+
+    For each field the classical energy is optimized, starting from the spin
+    directions of the previous field, and the magnon energies are computed for the
+    same set of k-points. Outputs progress in the standard output (``print()``) and
+    saves all data in one file on the disk.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    spinham : :py:class:`.SpinHamiltonian`
+        Spin Hamiltonian. It is not modified.
+    fields : (F, 3) |array-like|_
+        Vectors of the external magnetic field, given in Tesla. The sweep follows the
+        given order.
+    kpoints : (N, 3) |array-like|_
+        List of k-points, used for every field.
+    relative : bool, default False
+        If ``relative == True``, then ``kpoints`` are interpreted as given relative to
+        the reciprocal unit cell. Otherwise it is interpreted as given in absolute
+        coordinates.
+    initial_guess : (M, 3) |array-like|_, optional
+        Initial guess for the spin directions at the first field. If ``None``, then
+        random directions are used.
+    energy_tolerance : float, default 1e-5
+        Energy tolerance of the optimization, see :py:meth:`.Energy.optimize`.
+    torque_tolerance : float, default 1e-5
+        Torque tolerance of the optimization, see :py:meth:`.Energy.optimize`.
+    output_folder : str, default "magnopy-results"
+        Name for the folder where to save the output files. If the folder does not exist
+        then it will be created.
+    number_processors : int, optional
+        Number of processors to be used in computation. By default magnopy uses all
+        available processes. Use ``number_processors=1`` to run in serial mode.
+    comment : str, optional
+        Any comment to output right after the logo.
+    hide_personal_data : bool, default False
+        Whether to use ``os.path.abspath()`` when printing the paths to the output and
+        input files.
+
+    Notes
+    -----
+
+    Results are saved in the file "FIELD-SWEEP.npz" (see :numpy:`savez`) with the
+    arrays
+
+    * ``fields`` - (F, 3), magnetic fields, Tesla.
+    * ``kpoints`` - (N, 3), k-points, absolute coordinates.
+    * ``kpoints_relative`` - (N, 3), k-points, relative to the reciprocal cell.
+    * ``spin_directions`` - (F, M, 3), spin directions of the ground state.
+    * ``E_0`` - (F, ), classical energy of the ground state, meV.
+    * ``E_2`` - (F, ), correction to the ground state energy, meV.
+    * ``omegas`` - (F, N, M), real part of the magnon energies, meV.
+    * ``omegas_imag`` - (F, N, M), imaginary part of the magnon energies, meV.
+    * ``deltas`` - (F, N), real part of the constant terms, meV.
+
+    When using this function of magnopy in your Python scripts make sure to safeguard
+    your script with the
+
+    .. code-block:: python
+
+        import magnopy
+
+        # Import more stuff
+        # or
+        # Define your functions, classes
+
+        if __name__ == "__main__":
+
+            # Write your executable code here
+
+    For more information refer to the  "Safe importing of main module" section in
+    |multiprocessing|_ docs.
+    """
+
+    ################################################################################
+    ##                   Data verification and envelope function                  ##
+    ################################################################################
+    def envelope_path(pathname):
+        if hide_personal_data:
+            return pathname
+        else:
+            return os.path.abspath(pathname)
+
+    fields = np.array(fields, dtype=float).reshape(-1, 3)
+
+    if relative:
+        kpoints_relative = np.array(kpoints, dtype=float).reshape(-1, 3)
+        kpoints_absolute = kpoints_relative @ wulfric.cell.get_reciprocal(
+            cell=spinham.cell
+        )
+    else:
+        kpoints_absolute = np.array(kpoints, dtype=float).reshape(-1, 3)
+        kpoints_relative = kpoints_absolute @ np.linalg.inv(
+            wulfric.cell.get_reciprocal(cell=spinham.cell)
+        )
+
+    # Create the output directory if it does not exist
+    os.makedirs(output_folder, exist_ok=True)
+
+    all_good = True
+
+    ################################################################################
+    ##                              Logo and comment                              ##
+    ################################################################################
+    # Print logo and a comment
+    print(logo(date_time=True))
+    if comment is not None:
+        print(f"\n{' Comment ':=^90}\n")
+        print(comment)
+
+    ################################################################################
+    ##                                 Field sweep                                ##
+    ################################################################################
+    print(f"\n{' Field sweep ':=^90}\n")
+    print(
+        f"{len(fields)} values of the magnetic field, {len(kpoints_absolute)} k-points"
+    )
+
+    # Energy and the convention view of the Hamiltonian are shared by all fields
+    energy = Energy(spinham=spinham)
+
+    spin_directions = []
+    E_0 = []
+    E_2 = []
+    omegas = []
+    deltas = []
+
+    print(
+        f"\n{'h_x':>10} {'h_y':>10} {'h_z':>10}   "
+        f"{'E_0, meV':>15} {'E_2, meV':>15} {'min omega, meV':>15}"
+    )
+
+    # Workers are started once and reused for all fields
+    pool = None if number_processors == 1 else Pool(number_processors)
+
+    try:
+        for h in fields:
+            # Warm start from the ground state of the previous field
+            sd = energy.optimize(
+                initial_guess=initial_guess,
+                energy_tolerance=energy_tolerance,
+                torque_tolerance=torque_tolerance,
+                quiet=True,
+                h=h,
+            )
+            initial_guess = sd
+
+            lswt = LSWT(spinham=spinham, spin_directions=sd, h=h)
+
+            if pool is None:
+                results = [
+                    lswt.diagonalize(k, relative=False) for k in kpoints_absolute
+                ]
+            else:
+                results = pool.starmap(
+                    lswt.diagonalize,
+                    zip(kpoints_absolute, [False for _ in kpoints_absolute]),
+                )
+
+            spin_directions.append(sd)
+            E_0.append(energy.E_0(spin_directions=sd, h=h))
+            E_2.append(lswt.E_2)
+            omegas.append([i[0] for i in results])
+            deltas.append([i[1] for i in results])
+
+            print(
+                f"{h[0]:10.4f} {h[1]:10.4f} {h[2]:10.4f}   "
+                f"{E_0[-1]:15.6f} {E_2[-1]:15.6f} {np.min(np.real(omegas[-1])):15.6f}"
+            )
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    omegas = np.array(omegas)
+    deltas = np.array(deltas)
+
+    # Save all data to one file
+    filename = os.path.join(output_folder, "FIELD-SWEEP.npz")
+    np.savez(
+        filename,
+        fields=fields,
+        kpoints=kpoints_absolute,
+        kpoints_relative=kpoints_relative,
+        spin_directions=np.array(spin_directions),
+        E_0=np.array(E_0),
+        E_2=np.array(E_2),
+        omegas=omegas.real,
+        omegas_imag=omegas.imag,
+        deltas=deltas.real,
+    )
+    print(
+        f"\nResults of the field sweep are saved in file\n  {envelope_path(filename)}"
+    )
+
+    # Check for the imaginary part
+    if not np.allclose(omegas.imag, np.zeros(omegas.imag.shape)):
+        all_good = False
+        print(f"\n{'  WARNING  ':!^90}")
+        print(
+            "Eigenfrequiencies has non-zero imaginary component for some k vectors at the",
+            "fields",
+            *[
+                f"  {h[0]:10.4f} {h[1]:10.4f} {h[2]:10.4f}"
+                for h in fields[~np.all(np.isclose(omegas.imag, 0), axis=(1, 2))]
+            ],
+            "It might indicate that the spin directions are not a ground state of the",
+            "considered spin Hamiltonian. The results might not be meaningful.",
+            sep="\n",
+        )
+        print(f"{'  END OF WARNING  ':!^90}\n")
+
+    if all_good:
+        print(f"\n{' Finished OK ':=^90}")
+    else:
+        print(f"\n{' Finished with WARNINGS ':=^90}")
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
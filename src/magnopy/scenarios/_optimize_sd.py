@@ -26,8 +26,8 @@ import numpy as np
 
 from magnopy._energy import Energy
 from magnopy._package_info import logo
-from magnopy._spinham._supercell import make_supercell
-from magnopy._plotly_engine import PlotlyEngine
+from magnopy.profiling import Profiler
+from magnopy._spinham._supercell import SupercellView
 
 
 # Save local scope at this moment
@@ -45,6 +45,7 @@ def optimize_sd(
     comment=None,
     no_html=False,
     hide_personal_data=False,
+    profiler=None,
 ) -> None:
     r"""
     Optimizes classical energy of spin Hamiltonian and finds a set of spin directions
@@ -61,6 +62,8 @@ def optimize_sd(
         .. versionadded:: 0.2.0
     magnetic_field : (3, ) |array-like|_
         Vector of external magnetic field, given in Tesla.
+
+        .. versionchanged:: 0.3.0 ``spinham`` is not modified.
     energy_tolerance : float, default 1e-5
         Tolerance parameter. Difference between classical energies of two consecutive
         optimization steps.
@@ -81,6 +84,13 @@ def optimize_sd(
         input files.
 
         .. versionadded:: 0.2.0
+    profiler : :py:class:`.Profiler`, optional
+        Profiler, that records the stages of the calculation. Stages, that are already
+        recorded in it (for example, loading of the Hamiltonian), are kept. Use
+        ``Profiler(use_cprofile=True)`` to save the |cProfile|_ profiles of the stages.
+        By default a new :py:class:`.Profiler` is created.
+
+        .. versionadded:: 0.3.0
 
     Raises
     ------
@@ -88,6 +98,11 @@ def optimize_sd(
         If ``len(supercell) != 3``.
     ValueError
         If ``supercell[0] < 1`` or ``supercell[1] < 1`` or ``supercell[2] < 1``.
+
+    Notes
+    -----
+    Wall time, CPU time and peak memory of each stage of the calculation are printed at
+    the end and saved in the file "TIMINGS.json" (see :py:meth:`.Profiler.save`).
     """
 
     def envelope_path(pathname):
@@ -108,6 +123,9 @@ def optimize_sd(
     if supercell[0] < 1 or supercell[1] < 1 or supercell[2] < 1:
         raise ValueError(f"Supercell repetitions must be >=1, got {supercell}.")
 
+    if profiler is None:
+        profiler = Profiler()
+
     # Print logo and a comment
     print(logo(date_time=True))
     if comment is not None:
@@ -119,14 +137,11 @@ def optimize_sd(
     print(f"Energy tolerance : {energy_tolerance:.5e}")
     print(f"Torque tolerance : {torque_tolerance:.5e}")
 
-    # Add magnetic field if any
-    if magnetic_field is not None:
-        spinham.add_magnetic_field(h=magnetic_field)
-
     # Make a supercell if needed
+    profiler.start("Initial guess")
     original_spinham = spinham
     if supercell != (1, 1, 1):
-        spinham = make_supercell(spinham=spinham, supercell=supercell)
+        spinham = SupercellView(spinham=spinham, supercell=supercell)
         print(
             f"Minimizing on the supercell of {supercell[0]} x {supercell[1]} x {supercell[2]} unit cells."
         )
@@ -148,20 +163,23 @@ def optimize_sd(
     )
 
     # Optimize spin directions
+    profiler.start("Optimization")
     energy = Energy(spinham=spinham)
     spin_directions = energy.optimize(
         initial_guess=initial_guess,
         energy_tolerance=energy_tolerance,
         torque_tolerance=torque_tolerance,
         quiet=False,
+        h=magnetic_field,
     )
     print("Optimization is done.")
 
     # Output classical energy
-    E_0 = energy.E_0(spin_directions=spin_directions)
+    E_0 = energy.E_0(spin_directions=spin_directions, h=magnetic_field)
     print(f"\nClassic ground state energy (E_0) is {E_0:>15.6f} meV")
 
     # Save spin directions to a .txt file
+    profiler.start("Output of spin directions")
     filename = os.path.join(output_folder, "SPIN_DIRECTIONS.txt")
     np.savetxt(
         filename,
@@ -184,6 +202,8 @@ def optimize_sd(
     if not no_html:
         filename = os.path.join(output_folder, "SPIN_DIRECTIONS.html")
 
+        from magnopy._plotly_engine import PlotlyEngine
+
         pe = PlotlyEngine()
 
         pe.plot_cell(
@@ -228,6 +248,20 @@ def optimize_sd(
             f"\nImage of spin directions is saved in file\n  {envelope_path(filename)}"
         )
 
+    profiler.stop()
+
+    print(f"\n{' Timings ':=^90}\n")
+    print(profiler.summary())
+    filenames = profiler.save(output_folder)
+    if len(filenames) == 1:
+        print(f"\nTimings are saved in file\n  {envelope_path(filenames[0])}")
+    else:
+        print(
+            "\nTimings and profiles are saved in files",
+            *[f"  {envelope_path(filename)}" for filename in filenames],
+            sep="\n",
+        )
+
     print(f"\n{' Finished ':=^90}")
 
 
@@ -26,11 +26,13 @@ import numpy as np
 import wulfric
 
 from magnopy._energy import Energy
+from magnopy._kpath import refine_kpath
 from magnopy._lswt import LSWT
 from magnopy._package_info import logo
 from magnopy._parallelization import multiprocess_over_k
+from magnopy.profiling import Profiler
 from magnopy.io._k_resolved import plot_k_resolved
-from magnopy._plotly_engine import PlotlyEngine
+from magnopy.scenarios._cache import _get_cache_key, _load_from_cache, _save_to_cache
 
 try:
     import scipy  # noqa F401
@@ -45,6 +47,38 @@ old_dir = set(dir())
 old_dir.add("old_dir")
 
 
+def _save_kpoints(filename, kpoints_absolute, kpoints_relative, flat_indices):
+    r"""
+    Saves the k-points to the .txt file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file.
+    kpoints_absolute : (N, 3) :numpy:`ndarray`
+        K-points in absolute coordinates.
+    kpoints_relative : (N, 3) :numpy:`ndarray`
+        K-points relative to the reciprocal unit cell.
+    flat_indices : (N, ) :numpy:`ndarray`
+        Flat coordinates of the k-points.
+    """
+
+    np.savetxt(
+        filename,
+        np.concatenate(
+            (
+                kpoints_absolute,
+                kpoints_relative,
+                flat_indices[:, np.newaxis],
+            ),
+            axis=1,
+        ),
+        fmt="%12.8f %12.8f %12.8f   %12.8f %12.8f %12.8f   %12.8f",
+        header=f"{'k_x':>12} {'k_y':>12} {'k_z':>12}   {'r_b1':>12} {'r_b2':>12} {'r_b3':>12}   {'flat index':>12}",
+        comments="",
+    )
+
+
 def solve_lswt(
     spinham,
     spin_directions=None,
@@ -58,6 +92,12 @@ def solve_lswt(
     no_html=False,
     hide_personal_data=False,
     spglib_symprec=1e-5,
+    cache_dir=None,
+    cache_max_size=2**30,
+    output_format="txt",
+    no_plots=False,
+    profiler=None,
+    adaptive_tolerance=None,
 ) -> None:
     r"""
     Solves the spin Hamiltonian at the level of Linear Spin Wave theory.
@@ -85,6 +125,8 @@ def solve_lswt(
         coordinates.
     magnetic_field : (3, ) |array-like|_
         Vector of external magnetic field, given in Tesla.
+
+        .. versionchanged:: 0.3.0 ``spinham`` is not modified.
     output_folder : str, default "magnopy-results"
         Name for the folder where to save the output files. If the folder does not exist
         then it will be created.
@@ -108,10 +150,56 @@ def solve_lswt(
         if the space group is not the one you expected.
 
         .. versionadded:: 0.2.0
+    cache_dir : str, optional
+        Directory for the cache of the results. If given, then the optimized spin
+        directions and the results of the calculations over k-points are saved there
+        and reused if :py:func:`.solve_lswt` is called again with the same
+        Hamiltonian (see :py:meth:`.SpinHamiltonian.fingerprint`), spin directions,
+        magnetic field and k-points. By default nothing is cached.
+
+        .. versionadded:: 0.3.0
+    cache_max_size : int, default 2**30
+        Maximum size of the cache in bytes. When it is exceeded, the least recently
+        used results are removed. Ignored if ``cache_dir`` is not given.
+
+        .. versionadded:: 0.3.0
+    output_format : str, default "txt"
+        Format of the files with the k-resolved data. Supported formats are
+
+        * "txt" - k-points, omegas and deltas are saved in the separate .txt files.
+        * "npz" - k-points, omegas, deltas and transformation matrices
+          :math:`\mathcal{G}` (see :py:meth:`.LSWT.diagonalize`) are saved in one
+          compressed file "LSWT.npz" (see :numpy:`savez_compressed`). Complex
+          arrays are saved as they are, including the imaginary parts.
+
+        .. versionadded:: 0.3.0
+    no_plots : bool, default False
+        Whether to skip all plots. If ``no_plots=True``, then neither .png nor .html
+        files are produced (implies ``no_html=True``) and neither |matplotlib|_ nor
+        |plotly|_ is imported. Only the numerical results are computed and saved.
+
+        .. versionadded:: 0.3.0
+    profiler : :py:class:`.Profiler`, optional
+        Profiler, that records the stages of the calculation. Stages, that are already
+        recorded in it (for example, loading of the Hamiltonian), are kept. Use
+        ``Profiler(use_cprofile=True)`` to save the |cProfile|_ profiles of the stages.
+        By default a new :py:class:`.Profiler` is created.
+
+        .. versionadded:: 0.3.0
+    adaptive_tolerance : float, optional
+        If given, then the k-path is sampled adaptively by :py:func:`.refine_kpath`
+        with ``tolerance=adaptive_tolerance``: more k-points are used where the magnon
+        energies change rapidly or the modes cross, fewer where they are flat. By
+        default the points are uniformly spaced. Ignored if ``kpoints`` are given.
+
+        .. versionadded:: 0.3.0
 
     Notes
     -----
 
+    Wall time, CPU time and peak memory of each stage of the calculation are printed at
+    the end and saved in the file "TIMINGS.json" (see :py:meth:`.Profiler.save`).
+
     When using this function of magnopy in your Python scripts make sure to safeguard
     your script with the
 
@@ -141,11 +229,23 @@ def solve_lswt(
         else:
             return os.path.abspath(pathname)
 
+    output_format = str(output_format).lower()
+    if output_format not in ["txt", "npz"]:
+        raise ValueError(
+            f'Supported output formats are "txt" and "npz", got "{output_format}".'
+        )
+
+    if no_plots:
+        no_html = True
+
     # Create the output directory if it does not exist
     os.makedirs(output_folder, exist_ok=True)
 
     all_good = True
 
+    if profiler is None:
+        profiler = Profiler()
+
     ################################################################################
     ##                              Logo and comment                              ##
     ################################################################################
@@ -160,22 +260,46 @@ def solve_lswt(
     ################################################################################
     # Print header
     print(f"\n{' Ground state ':=^90}\n")
-
-    # Add magnetic field if any
-    if magnetic_field is not None:
-        spinham.add_magnetic_field(h=magnetic_field)
+    profiler.start("Ground state")
 
     # Get energy class
     energy = Energy(spinham=spinham)
 
+    if cache_dir is not None:
+        fingerprint = spinham.fingerprint()
+
     # Optimize spin directions
     if spin_directions is None:
-        print("Spin directions are not given, start to optimize ...")
+        cached = None
+        if cache_dir is not None:
+            key = _get_cache_key(
+                "ground state", fingerprint, magnetic_field, 1e-5, 1e-5
+            )
+            cached = _load_from_cache(cache_dir=cache_dir, key=key)
 
-        spin_directions = energy.optimize(
-            energy_tolerance=1e-5, torque_tolerance=1e-5, quiet=False
-        )
-        print("Optimization is done.")
+        if cached is not None:
+            spin_directions = cached["spin_directions"]
+            print(
+                "Spin directions are not given, optimized ones are loaded from cache."
+            )
+        else:
+            print("Spin directions are not given, start to optimize ...")
+
+            spin_directions = energy.optimize(
+                energy_tolerance=1e-5,
+                torque_tolerance=1e-5,
+                quiet=False,
+                h=magnetic_field,
+            )
+            print("Optimization is done.")
+
+            if cache_dir is not None:
+                _save_to_cache(
+                    cache_dir=cache_dir,
+                    key=key,
+                    max_size=cache_max_size,
+                    spin_directions=spin_directions,
+                )
     # Or normalize them
     else:
         print("Spin directions of the ground state are provided by the user.")
@@ -202,6 +326,8 @@ def solve_lswt(
     if not no_html:
         filename = os.path.join(output_folder, "SPIN_DIRECTIONS.html")
 
+        from magnopy._plotly_engine import PlotlyEngine
+
         pe = PlotlyEngine()
 
         pe.plot_cell(
@@ -237,14 +363,16 @@ def solve_lswt(
         print(f"{name:{name_n}} {spglib_types[n_i]:>11}")
 
     # Output classical energy
-    E_0 = energy.E_0(spin_directions=spin_directions)
+    E_0 = energy.E_0(spin_directions=spin_directions, h=magnetic_field)
     print(f"\n{'Classic ground state energy (E_0)':<51} is {E_0:>15.6f} meV\n")
+    profiler.stop()
 
     ################################################################################
     ##                            K-points and k-path                             ##
     ################################################################################
     # Treat kpoints
     print(f"\n{' K-points and k-path ':=^90}\n")
+    profiler.start("K-points and k-path")
 
     if kpoints is not None:
         if relative:
@@ -265,7 +393,11 @@ def solve_lswt(
             )
         )
 
+        kp = None
+
         print("K-points are provided by the user.")
+        if adaptive_tolerance is not None:
+            print("Adaptive sampling is not applied to the user-provided k-points.")
 
     else:
         spglib_data = wulfric.get_spglib_data(
@@ -327,6 +459,12 @@ def solve_lswt(
         kpoints_absolute = kpoints_relative @ kp.rcell
         flat_indices = kp.flat_points(relative=False)
 
+        if adaptive_tolerance is not None:
+            print(
+                "K-path is sampled adaptively with the tolerance "
+                f"{adaptive_tolerance:.5e}."
+            )
+
         # Produce .html file with the hs points, k-path and brillouin zones
         if not no_html:
             if SCIPY_AVAILABLE:
@@ -361,29 +499,25 @@ def solve_lswt(
                     "\nCan not plot Brillouin zone without scipy. Please install it with\n  pip install scipy"
                 )
 
+    # Adaptively sampled k-points are known only after the calculations over k-points
+    adaptive = adaptive_tolerance is not None and kp is not None
+
     # Save k-points info to the .txt file
-    filename = os.path.join(output_folder, "K-POINTS.txt")
-    np.savetxt(
-        filename,
-        np.concatenate(
-            (
-                kpoints_absolute,
-                kpoints_relative,
-                flat_indices[:, np.newaxis],
-            ),
-            axis=1,
-        ),
-        fmt="%12.8f %12.8f %12.8f   %12.8f %12.8f %12.8f   %12.8f",
-        header=f"{'k_x':>12} {'k_y':>12} {'k_z':>12}   {'r_b1':>12} {'r_b2':>12} {'r_b3':>12}   {'flat index':>12}",
-        comments="",
-    )
-    print(f"\nExplicit list of k-points is saved in file\n  {envelope_path(filename)}")
+    if output_format == "txt" and not adaptive:
+        filename = os.path.join(output_folder, "K-POINTS.txt")
+        _save_kpoints(filename, kpoints_absolute, kpoints_relative, flat_indices)
+        print(
+            f"\nExplicit list of k-points is saved in file\n  {envelope_path(filename)}"
+        )
+    profiler.stop()
 
     ################################################################################
     ##                                    LSWT                                    ##
     ################################################################################
     print(f"\n{' Start LSWT ':=^90}\n")
-    lswt = LSWT(spinham=spinham, spin_directions=spin_directions)
+    profiler.start("Preparation of LSWT")
+    lswt = LSWT(spinham=spinham, spin_directions=spin_directions, h=magnetic_field)
+    profiler.stop()
 
     # Output correction energy
     print(
@@ -408,85 +542,207 @@ def solve_lswt(
         print(f"{'  END OF WARNING  ':!^90}\n")
 
     # Compute data for each k-point
-    print("\nStart calculations over k-points ... ", end="")
-    results = multiprocess_over_k(
-        kpoints=kpoints_absolute,
-        function=lswt.diagonalize,
-        relative=False,
-        number_processors=number_processors,
-    )
-    omegas = np.array([i[0] for i in results])
-    deltas = np.array([i[1] for i in results])
+    profiler.start("Calculations over k-points")
+    cached = None
+    if cache_dir is not None and adaptive:
+        key = _get_cache_key(
+            "lswt adaptive",
+            fingerprint,
+            spin_directions,
+            magnetic_field,
+            kpoints_absolute,
+            adaptive_tolerance,
+        )
+        cached = _load_from_cache(cache_dir=cache_dir, key=key)
+    elif cache_dir is not None:
+        key = _get_cache_key(
+            "lswt", fingerprint, spin_directions, magnetic_field, kpoints_absolute
+        )
+        cached = _load_from_cache(cache_dir=cache_dir, key=key)
+
+    if cached is not None and adaptive:
+        kpoints_absolute = cached["kpoints"]
+        flat_indices = cached["flat_indices"]
+        omegas = cached["omegas"]
+        deltas = cached["deltas"]
+        G = cached["G"]
+        print("\nResults of calculations over k-points are loaded from cache.")
+    elif cached is not None:
+        omegas = cached["omegas"]
+        deltas = cached["deltas"]
+        G = cached["G"]
+        print("\nResults of calculations over k-points are loaded from cache.")
+    elif adaptive:
+        print("\nStart adaptive calculations over k-points ... ", end="")
+        kpoints_absolute, flat_indices, omegas, deltas, G = refine_kpath(
+            lswt=lswt,
+            kp=kp,
+            tolerance=adaptive_tolerance,
+            number_processors=number_processors,
+        )
+        print("Done")
+
+        if cache_dir is not None:
+            _save_to_cache(
+                cache_dir=cache_dir,
+                key=key,
+                max_size=cache_max_size,
+                kpoints=kpoints_absolute,
+                flat_indices=flat_indices,
+                omegas=omegas,
+                deltas=deltas,
+                G=G,
+            )
+    else:
+        print("\nStart calculations over k-points ... ", end="")
+        results = multiprocess_over_k(
+            kpoints=kpoints_absolute,
+            function=lswt.diagonalize,
+            relative=False,
+            number_processors=number_processors,
+        )
+        omegas = np.array([i[0] for i in results])
+        deltas = np.array([i[1] for i in results])
+        G = np.array([i[2] for i in results])
+        print("Done")
+
+        if cache_dir is not None:
+            _save_to_cache(
+                cache_dir=cache_dir,
+                key=key,
+                max_size=cache_max_size,
+                omegas=omegas,
+                deltas=deltas,
+                G=G,
+            )
+    profiler.stop()
+
+    profiler.start("Output of k-resolved data")
     n_modes = len(omegas[0])
-    print("Done")
 
-    # Save omegas to the .txt file
-    filename = os.path.join(output_folder, "OMEGAS.txt")
-    np.savetxt(
-        filename,
-        omegas.real,
-        fmt=("%15.6e " * n_modes)[:-1],
-        header=" ".join([f"{f'mode {i + 1}':>15}" for i in range(n_modes)]),
-        comments="",
-    )
-    print(f"\nOmegas are saved in file\n  {envelope_path(filename)}")
+    if adaptive:
+        kpoints_relative = kpoints_absolute @ np.linalg.inv(kp.rcell)
+        print(f"\nK-path is sampled with {len(kpoints_absolute)} k-points.")
 
-    # Plot omegas as a .png
-    filename = filename[:-4] + ".png"
-    # TODO: REFACTOR
-    plot_k_resolved(
-        data=omegas.real,
-        kp=kp,
-        output_filename=filename,
-        ylabel=R"$\omega_{\alpha}(\boldsymbol{k})$, meV",
-    )
-    print(f"Plot is saved in file\n  {envelope_path(filename)}")
+        if output_format == "txt":
+            filename = os.path.join(output_folder, "K-POINTS.txt")
+            _save_kpoints(filename, kpoints_absolute, kpoints_relative, flat_indices)
+            print(
+                f"Explicit list of k-points is saved in file\n  {envelope_path(filename)}"
+            )
 
-    # Check for the imaginary part
-    if not np.allclose(omegas.imag, np.zeros(omegas.imag.shape)):
-        all_good = False
-        print(f"\n{'  WARNING  ':!^90}")
+    if output_format == "npz":
+        # Save all k-resolved data to one compressed file
+        filename = os.path.join(output_folder, "LSWT.npz")
+        np.savez_compressed(
+            filename,
+            kpoints=kpoints_absolute,
+            kpoints_relative=kpoints_relative,
+            flat_indices=flat_indices,
+            omegas=omegas,
+            deltas=deltas,
+            G=G,
+        )
         print(
-            "Eigenfrequiencies has non-zero imaginary component for some k vectors. It might\n"
-            "indicate that the ground state (spin directions) is not a ground state of the\n"
-            "considered spin Hamiltonian. The results might not be meaningful.\n"
+            "\nK-points, omegas, deltas and transformation matrices are saved in file\n"
+            f"  {envelope_path(filename)}"
         )
-        filename = os.path.join(output_folder, "OMEGAS-IMAG.txt")
+    else:
+        # Save omegas to the .txt file
+        filename = os.path.join(output_folder, "OMEGAS.txt")
         np.savetxt(
             filename,
-            omegas.imag,
+            omegas.real,
             fmt=("%15.6e " * n_modes)[:-1],
             header=" ".join([f"{f'mode {i + 1}':>15}" for i in range(n_modes)]),
             comments="",
         )
-        print(f"Imaginary part of omegas is saved in file\n  {envelope_path(filename)}")
+        print(f"\nOmegas are saved in file\n  {envelope_path(filename)}")
 
-        filename = filename[:-4] + ".png"
+    # Plot omegas as a .png
+    if not no_plots:
+        filename = os.path.join(output_folder, "OMEGAS.png")
         # TODO: REFACTOR
         plot_k_resolved(
-            data=omegas.imag,
+            data=omegas.real,
             kp=kp,
+            flat_points=flat_indices,
             output_filename=filename,
-            ylabel=R"$\mathcal{Im}(\omega_{\alpha}(\boldsymbol{k}))$, meV",
+            ylabel=R"$\omega_{\alpha}(\boldsymbol{k})$, meV",
         )
-        print(f"Plot of imaginary part is saved in file\n  {envelope_path(filename)}")
+        print(f"Plot is saved in file\n  {envelope_path(filename)}")
+
+    # Check for the imaginary part
+    if not np.allclose(omegas.imag, np.zeros(omegas.imag.shape)):
+        all_good = False
+        print(f"\n{'  WARNING  ':!^90}")
+        print(
+            "Eigenfrequiencies has non-zero imaginary component for some k vectors. It might\n"
+            "indicate that the ground state (spin directions) is not a ground state of the\n"
+            "considered spin Hamiltonian. The results might not be meaningful.\n"
+        )
+        if output_format == "txt":
+            filename = os.path.join(output_folder, "OMEGAS-IMAG.txt")
+            np.savetxt(
+                filename,
+                omegas.imag,
+                fmt=("%15.6e " * n_modes)[:-1],
+                header=" ".join([f"{f'mode {i + 1}':>15}" for i in range(n_modes)]),
+                comments="",
+            )
+            print(
+                f"Imaginary part of omegas is saved in file\n  {envelope_path(filename)}"
+            )
+
+        if not no_plots:
+            filename = os.path.join(output_folder, "OMEGAS-IMAG.png")
+            # TODO: REFACTOR
+            plot_k_resolved(
+                data=omegas.imag,
+                kp=kp,
+                flat_points=flat_indices,
+                output_filename=filename,
+                ylabel=R"$\mathcal{Im}(\omega_{\alpha}(\boldsymbol{k}))$, meV",
+            )
+            print(
+                f"Plot of imaginary part is saved in file\n  {envelope_path(filename)}"
+            )
         print(f"{'  END OF WARNING  ':!^90}\n")
 
     # Save deltas to the .txt file
-    filename = os.path.join(output_folder, "DELTAS.txt")
-    np.savetxt(filename, deltas.real, fmt="%10.6e", header="Delta", comments="")
-    print(f"Deltas are saved in file\n  {envelope_path(filename)}")
+    if output_format == "txt":
+        filename = os.path.join(output_folder, "DELTAS.txt")
+        np.savetxt(filename, deltas.real, fmt="%10.6e", header="Delta", comments="")
+        print(f"Deltas are saved in file\n  {envelope_path(filename)}")
 
     # Plot deltas as a .png
-    filename = filename[:-4] + ".png"
-    # TODO: REFACTOR
-    plot_k_resolved(
-        data=deltas.real,
-        kp=kp,
-        output_filename=filename,
-        ylabel=R"$\Delta(\boldsymbol{k})$, meV",
-    )
-    print(f"Plot is saved in file\n  {envelope_path(filename)}")
+    if not no_plots:
+        filename = os.path.join(output_folder, "DELTAS.png")
+        # TODO: REFACTOR
+        plot_k_resolved(
+            data=deltas.real,
+            kp=kp,
+            flat_points=flat_indices,
+            output_filename=filename,
+            ylabel=R"$\Delta(\boldsymbol{k})$, meV",
+        )
+        print(f"Plot is saved in file\n  {envelope_path(filename)}")
+    profiler.stop()
+
+    ################################################################################
+    ##                                   Timings                                  ##
+    ################################################################################
+    print(f"\n{' Timings ':=^90}\n")
+    print(profiler.summary())
+    filenames = profiler.save(output_folder)
+    if len(filenames) == 1:
+        print(f"\nTimings are saved in file\n  {envelope_path(filenames[0])}")
+    else:
+        print(
+            "\nTimings and profiles are saved in files",
+            *[f"  {envelope_path(filename)}" for filename in filenames],
+            sep="\n",
+        )
 
     if all_good:
         print(f"\n{' Finished OK ':=^90}")
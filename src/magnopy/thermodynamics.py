@@ -0,0 +1,537 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+R"""
+Magnon density of states and thermodynamics over the grids of k-points.
+"""
+
+import os
+from itertools import islice
+from multiprocessing import Pool
+
+import numpy as np
+
+from magnopy._constants._internal_units import K_BOLTZMANN
+
+# Save local scope at this moment
+old_dir = set(dir())
+old_dir.add("old_dir")
+
+# Six tetrahedra of a cube of the grid, that share its main diagonal. Corner
+# (dx, dy, dz) of the cube has the index 4 * dx + 2 * dy + dz.
+_TETRAHEDRA = np.array(
+    [
+        [0, 1, 3, 7],
+        [0, 1, 5, 7],
+        [0, 2, 3, 7],
+        [0, 2, 6, 7],
+        [0, 4, 5, 7],
+        [0, 4, 6, 7],
+    ]
+)
+
+# Maximum number of elements in the intermediate (tetrahedra, energies) arrays
+_MAX_ELEMENTS = 10_000_000
+
+
+# Linear spin wave theory of the worker process, it is sent once per worker
+_WORKER_LSWT = None
+
+
+def _init_worker(lswt):
+    global _WORKER_LSWT
+    _WORKER_LSWT = lswt
+
+
+def _diagonalize(k):
+    return _WORKER_LSWT.diagonalize(k, relative=False)
+
+
+def _iterate_over_kgrid(lswt, kgrid, chunk_size, number_processors):
+    r"""
+    Diagonalizes the Hamiltonian at the irreducible points of the grid, one chunk at a
+    time.
+
+    One pool of processes is used for the whole grid. Its workers receive ``lswt``
+    once and process the k-points in the order of the grid, while the chunks are
+    consumed.
+
+    Parameters
+    ----------
+    lswt : :py:class:`.LSWT`
+        Linear spin wave theory.
+    kgrid : :py:class:`.KGrid`
+        Grid of k-points.
+    chunk_size : int
+        Number of k-points in one chunk.
+    number_processors : int
+        Number of processes. ``None`` for all available, ``1`` for the serial mode.
+
+    Yields
+    ------
+    omegas : (C, M) :numpy:`ndarray`
+        Real parts of the magnon energies.
+    deltas : (C, ) :numpy:`ndarray`
+        Real parts of the constant energy terms.
+    weights : (C, ) :numpy:`ndarray`
+        Weights of the points.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"Expected positive chunk_size, got {chunk_size}.")
+
+    kpoints = kgrid.irreducible_points(relative=False)
+    weights = kgrid.weights
+
+    if number_processors == 1:
+        pool = None
+        results = (lswt.diagonalize(k, relative=False) for k in kpoints)
+    else:
+        pool = Pool(number_processors, initializer=_init_worker, initargs=(lswt,))
+        # Several k-points per task, but enough tasks to keep all workers busy
+        n_workers = number_processors or os.cpu_count() or 1
+        results = pool.imap(
+            _diagonalize, kpoints, chunksize=max(1, chunk_size // (4 * n_workers))
+        )
+
+    try:
+        for start in range(0, len(kpoints), chunk_size):
+            chunk = list(islice(results, chunk_size))
+
+            omegas = np.array([result[0] for result in chunk], dtype=complex).real
+            deltas = np.array([result[1] for result in chunk], dtype=complex).real
+
+            yield omegas, deltas, weights[start : start + chunk_size]
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def _gaussian_dos(lswt, kgrid, energies, sigma, chunk_size, number_processors):
+    r"""
+    Histogram of the magnon energies, convolved with the Gaussian.
+    """
+
+    step = energies[1] - energies[0]
+
+    # Histogram is extended to collect the tails of the Gaussians from outside of the
+    # energy window
+    n_tail = int(np.ceil(5 * sigma / step))
+    edges = energies[0] + step * (
+        np.arange(-n_tail, len(energies) + n_tail + 1, dtype=float) - 0.5
+    )
+
+    histogram = np.zeros(len(edges) - 1, dtype=float)
+    for omegas, _, weights in _iterate_over_kgrid(
+        lswt=lswt,
+        kgrid=kgrid,
+        chunk_size=chunk_size,
+        number_processors=number_processors,
+    ):
+        weights = np.broadcast_to(weights[:, np.newaxis], omegas.shape)
+        finite = np.isfinite(omegas)
+        counts, _ = np.histogram(omegas[finite], bins=edges, weights=weights[finite])
+        histogram += counts
+
+    # Gaussian is normalized on the energy mesh, so that the integral of the density
+    # of states does not depend on the ratio of sigma to the step
+    offsets = step * np.arange(-n_tail, n_tail + 1, dtype=float)
+    kernel = np.exp(-(offsets**2) / (2 * sigma**2))
+    kernel /= np.sum(kernel) * step
+
+    return np.convolve(histogram, kernel, mode="valid")
+
+
+def _tetrahedron_dos(lswt, kgrid, energies, chunk_size, number_processors):
+    r"""
+    Linear tetrahedron method for the density of states.
+    """
+
+    # Energies at the irreducible points, the tetrahedra need the neighbors of each
+    # point on the full grid
+    irreducible = np.concatenate(
+        [
+            omegas
+            for omegas, _, _ in _iterate_over_kgrid(
+                lswt=lswt,
+                kgrid=kgrid,
+                chunk_size=chunk_size,
+                number_processors=number_processors,
+            )
+        ],
+        axis=0,
+    )
+
+    n1, n2, n3 = kgrid.mesh
+    mapping = kgrid.mapping.reshape(n1, n2, n3)
+
+    # Each tetrahedron is 1 / 6 of the cube, each cube is 1 / N of the Brillouin zone
+    volume = 1 / (6 * kgrid.N)
+
+    dos = np.zeros(len(energies), dtype=float)
+    E = energies[np.newaxis, :]
+
+    for i in range(n1):
+        planes = [irreducible[mapping[i]], irreducible[mapping[(i + 1) % n1]]]
+
+        # (8, n2 * n3 * M), corners of all cubes between the two planes
+        corners = np.array(
+            [
+                np.roll(planes[dx], shift=(-dy, -dz), axis=(0, 1)).reshape(-1)
+                for dx, dy, dz in np.ndindex(2, 2, 2)
+            ]
+        )
+
+        # (6 * n2 * n3 * M, 4), sorted energies at the corners of the tetrahedra
+        tetrahedra = np.sort(
+            np.transpose(corners[_TETRAHEDRA], (0, 2, 1)).reshape(-1, 4), axis=1
+        )
+        tetrahedra = tetrahedra[np.all(np.isfinite(tetrahedra), axis=1)]
+
+        size = max(1, _MAX_ELEMENTS // len(energies))
+        for start in range(0, len(tetrahedra), size):
+            e1, e2, e3, e4 = [
+                e[:, np.newaxis] for e in tetrahedra[start : start + size].T
+            ]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                first = 3 * (E - e1) ** 2 / ((e2 - e1) * (e3 - e1) * (e4 - e1))
+                second = (
+                    3 * (e2 - e1)
+                    + 6 * (E - e2)
+                    - 3 * (e3 - e1 + e4 - e2) * (E - e2) ** 2 / ((e3 - e2) * (e4 - e2))
+                ) / ((e3 - e1) * (e4 - e1))
+                third = 3 * (e4 - E) ** 2 / ((e4 - e1) * (e4 - e2) * (e4 - e3))
+
+            contribution = np.where(
+                (e1 < E) & (E < e2),
+                first,
+                np.where(
+                    (e2 <= E) & (E < e3),
+                    second,
+                    np.where((e3 <= E) & (E < e4), third, 0),
+                ),
+            )
+
+            dos += volume * np.sum(contribution, axis=0)
+
+    return dos
+
+
+def magnon_dos(
+    lswt,
+    kgrid,
+    energies,
+    method="gaussian",
+    sigma=None,
+    chunk_size=1000,
+    number_processors=None,
+):
+    r"""
+    Magnon density of states.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    lswt : :py:class:`.LSWT`
+        Linear spin wave theory.
+    kgrid : :py:class:`.KGrid`
+        Grid of k-points. Hamiltonian is diagonalized only at its irreducible points.
+    energies : (E, ) |array-like|_
+        Energies at which the density of states is computed, in meV. Have to be
+        uniformly spaced and increasing for ``method="gaussian"``.
+    method : str, default "gaussian"
+        Method for the density of states. Case-insensitive.
+
+        * "gaussian" - the magnon energies are collected in a histogram with the bins
+          centered at ``energies``, which is convolved with a Gaussian.
+        * "tetrahedron" - linear tetrahedron method. Each cube of the grid is split in
+          six tetrahedra, magnon energies are interpolated linearly within each
+          tetrahedron.
+    sigma : float, optional
+        Standard deviation of the Gaussian for ``method="gaussian"``, in meV. By
+        default it is twice the step of ``energies``.
+    chunk_size : int, default 1000
+        Number of k-points that are diagonalized at once.
+    number_processors : int, optional
+        By default magnopy uses all available processes. Use ``number_processors=1``
+        to run in serial mode.
+
+    Returns
+    -------
+    dos : (E, ) :numpy:`ndarray`
+        Density of states per unit cell, in states per meV. Its integral over all
+        energies is the number of magnetic atoms in the unit cell.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is not supported or if ``energies`` are not uniformly spaced for
+        ``method="gaussian"``.
+
+    Notes
+    -----
+    The k-points are diagonalized in chunks of ``chunk_size``, the memory for the
+    Gaussian method does not depend on the size of the grid. The tetrahedron method
+    keeps the magnon energies at all irreducible points.
+
+    The k-points, at which the diagonalization fails (see
+    :py:meth:`.LSWT.diagonalize`), are skipped.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import numpy as np
+        >>> import magnopy
+        >>> spinham = magnopy.examples.cubic_ferro_nn()
+        >>> lswt = magnopy.LSWT(spinham=spinham, spin_directions=[[0, 0, 1]])
+        >>> kgrid = magnopy.KGrid.from_spinham(
+        ...     spinham=spinham, mesh=(10, 10, 10), spin_directions=[[0, 0, 1]]
+        ... )
+        >>> energies = np.linspace(-1, 14, 301)
+        >>> dos = magnopy.thermodynamics.magnon_dos(
+        ...     lswt=lswt, kgrid=kgrid, energies=energies, number_processors=1
+        ... )
+        >>> round(float(np.trapezoid(dos, energies)), 3)
+        1.0
+    """
+
+    energies = np.array(energies, dtype=float).reshape(-1)
+    method = method.lower()
+
+    if method == "gaussian":
+        if len(energies) < 2 or not np.allclose(
+            energies[1:] - energies[:-1], energies[1] - energies[0]
+        ):
+            raise ValueError(
+                "Expected uniformly spaced energies for the gaussian method."
+            )
+
+        step = energies[1] - energies[0]
+        if step <= 0:
+            raise ValueError("Expected increasing energies for the gaussian method.")
+
+        if sigma is None:
+            sigma = 2 * step
+
+        return _gaussian_dos(
+            lswt=lswt,
+            kgrid=kgrid,
+            energies=energies,
+            sigma=float(sigma),
+            chunk_size=chunk_size,
+            number_processors=number_processors,
+        )
+
+    if method == "tetrahedron":
+        return _tetrahedron_dos(
+            lswt=lswt,
+            kgrid=kgrid,
+            energies=energies,
+            chunk_size=chunk_size,
+            number_processors=number_processors,
+        )
+
+    raise ValueError(
+        f"Unsupported method '{method}', expected 'gaussian' or 'tetrahedron'."
+    )
+
+
+def thermodynamics(
+    lswt,
+    kgrid,
+    temperatures,
+    omega_min=1e-6,
+    chunk_size=1000,
+    number_processors=None,
+) -> dict:
+    r"""
+    Thermodynamic properties of the non-interacting magnons.
+
+    .. versionadded:: 0.3.0
+
+    Parameters
+    ----------
+    lswt : :py:class:`.LSWT`
+        Linear spin wave theory.
+    kgrid : :py:class:`.KGrid`
+        Grid of k-points. Hamiltonian is diagonalized only at its irreducible points.
+    temperatures : (T, ) |array-like|_
+        Temperatures, in Kelvin.
+    omega_min : float, default 1e-6
+        Modes with the energies below ``omega_min`` (in meV) are skipped in the
+        thermal quantities.
+    chunk_size : int, default 1000
+        Number of k-points that are diagonalized at once.
+    number_processors : int, optional
+        By default magnopy uses all available processes. Use ``number_processors=1``
+        to run in serial mode.
+
+    Returns
+    -------
+    results : dict
+        All quantities are given per unit cell. Keys are
+
+        * "temperatures" : (T, ) :numpy:`ndarray` - temperatures, in Kelvin.
+        * "magnon_number" : (T, ) :numpy:`ndarray` - number of thermal magnons. For a
+          collinear ferromagnet it is the thermal reduction of the total spin.
+        * "internal_energy" : (T, ) :numpy:`ndarray` - energy of the thermal magnons,
+          in meV.
+        * "specific_heat" : (T, ) :numpy:`ndarray` - in meV / Kelvin.
+        * "free_energy" : (T, ) :numpy:`ndarray` - in meV.
+        * "entropy" : (T, ) :numpy:`ndarray` - in meV / Kelvin.
+        * "quantum_correction" : float - correction to the classical ground state
+          energy at zero temperature, in meV.
+
+    Raises
+    ------
+    ValueError
+        If any temperature is negative.
+
+    Notes
+    -----
+    With the Bose-Einstein distribution
+    :math:`n_{\boldsymbol{k}, m} = 1 / (e^{x_{\boldsymbol{k}, m}} - 1)`, where
+    :math:`x_{\boldsymbol{k}, m} = \omega_m(\boldsymbol{k}) / k_B T`, the quantities
+    are
+
+    .. math::
+
+        n(T) = \dfrac{1}{N}\sum_{\boldsymbol{k}, m} n_{\boldsymbol{k}, m}
+        \qquad
+        U(T) = \dfrac{1}{N}\sum_{\boldsymbol{k}, m}
+        \omega_m(\boldsymbol{k}) n_{\boldsymbol{k}, m}
+
+    .. math::
+
+        C(T) = \dfrac{k_B}{N}\sum_{\boldsymbol{k}, m}
+        x_{\boldsymbol{k}, m}^2 n_{\boldsymbol{k}, m} (n_{\boldsymbol{k}, m} + 1)
+        \qquad
+        F(T) = \dfrac{k_B T}{N}\sum_{\boldsymbol{k}, m}
+        \ln\left(1 - e^{-x_{\boldsymbol{k}, m}}\right)
+        \qquad
+        S(T) = \dfrac{U(T) - F(T)}{T}
+
+    and the quantum correction is
+
+    .. math::
+
+        E^{(2)} + \dfrac{1}{N}\sum_{\boldsymbol{k}}\Delta(\boldsymbol{k})
+
+    where :math:`N` is the number of points in the full grid and the sums are computed
+    over the irreducible points with their weights.
+
+    Modes with the energies below ``omega_min`` (i.e. Goldstone modes) and the
+    k-points, at which the diagonalization fails, are skipped in the thermal
+    quantities. The k-points are
+    diagonalized in chunks of ``chunk_size``, the memory does not depend on the size of
+    the grid.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import magnopy
+        >>> spinham = magnopy.examples.cubic_ferro_nn()
+        >>> lswt = magnopy.LSWT(spinham=spinham, spin_directions=[[0, 0, 1]])
+        >>> kgrid = magnopy.KGrid.from_spinham(
+        ...     spinham=spinham, mesh=(10, 10, 10), spin_directions=[[0, 0, 1]]
+        ... )
+        >>> results = magnopy.thermodynamics.thermodynamics(
+        ...     lswt=lswt, kgrid=kgrid, temperatures=[0, 10, 100], number_processors=1
+        ... )
+        >>> results["magnon_number"].shape
+        (3,)
+        >>> float(results["magnon_number"][0])
+        0.0
+    """
+
+    temperatures = np.array(temperatures, dtype=float).reshape(-1)
+    if np.any(temperatures < 0):
+        raise ValueError("Expected non-negative temperatures.")
+
+    kT = K_BOLTZMANN * temperatures
+
+    magnon_number = np.zeros(len(temperatures), dtype=float)
+    internal_energy = np.zeros(len(temperatures), dtype=float)
+    specific_heat = np.zeros(len(temperatures), dtype=float)
+    free_energy = np.zeros(len(temperatures), dtype=float)
+    delta_sum = 0.0
+
+    for omegas, deltas, weights in _iterate_over_kgrid(
+        lswt=lswt,
+        kgrid=kgrid,
+        chunk_size=chunk_size,
+        number_processors=number_processors,
+    ):
+        finite = np.isfinite(deltas)
+        delta_sum += np.sum(weights[finite] * deltas[finite])
+
+        weights = np.broadcast_to(weights[:, np.newaxis], omegas.shape)
+        with np.errstate(invalid="ignore"):
+            positive = np.isfinite(omegas) & (omegas >= omega_min)
+        weights = weights[positive][:, np.newaxis]
+        omegas = omegas[positive][:, np.newaxis]
+
+        # Zero temperature gives infinite x and no thermal magnons
+        with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+            x = omegas / kT
+            n = 1 / np.expm1(x)
+            magnon_number += np.sum(weights * n, axis=0)
+            internal_energy += np.sum(weights * omegas * n, axis=0)
+            specific_heat += np.sum(
+                weights * np.where(np.isfinite(x), x**2 * n * (n + 1), 0), axis=0
+            )
+            free_energy += np.sum(
+                weights * np.where(np.isfinite(x), np.log1p(-np.exp(-x)), 0), axis=0
+            )
+
+    specific_heat *= K_BOLTZMANN
+    free_energy *= kT
+
+    entropy = np.zeros(len(temperatures), dtype=float)
+    nonzero = temperatures > 0
+    entropy[nonzero] = (internal_energy[nonzero] - free_energy[nonzero]) / temperatures[
+        nonzero
+    ]
+
+    return dict(
+        temperatures=temperatures,
+        magnon_number=magnon_number,
+        internal_energy=internal_energy,
+        specific_heat=specific_heat,
+        free_energy=free_energy,
+        entropy=entropy,
+        quantum_correction=float(lswt.E_2 + delta_sum),
+    )
+
+
+# Populate __all__ with objects defined in this file
+__all__ = list(set(dir()) - old_dir)
+# Remove all semi-private objects
+__all__ = [i for i in __all__ if not i.startswith("_")]
+del old_dir
@@ -0,0 +1,161 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from hypothesis.extra.numpy import arrays as harrays
+
+from magnopy import LSWT, Convention, Energy, SpinHamiltonian, SupercellView
+
+FIELD = harrays(
+    np.float64,
+    (3,),
+    elements=st.floats(min_value=-100, max_value=100),
+)
+
+
+def _get_spinham():
+    cell = np.eye(3, dtype=float)
+
+    atoms = dict(
+        names=["A1", "A2"],
+        positions=[[0, 0, 0], [0.5, 0.5, 0.5]],
+        spins=[0.5, 2],
+        g_factors=[2, 1.5],
+    )
+    convention = Convention(
+        multiple_counting=True, spin_normalized=False, c1=1, c21=1, c22=1
+    )
+
+    spinham = SpinHamiltonian(cell=cell, atoms=atoms, convention=convention)
+
+    spinham.add_21(alpha=0, parameter=np.diag([0, 0, -1]))
+    spinham.add_22(alpha=0, beta=1, nu=(0, 0, 0), parameter=-np.eye(3))
+    spinham.add_22(alpha=0, beta=0, nu=(1, 0, 0), parameter=-np.eye(3))
+    spinham.add_22(alpha=1, beta=1, nu=(0, 1, 0), parameter=-np.eye(3))
+
+    return spinham
+
+
+@given(FIELD)
+def test_energy_with_field(h):
+    spinham = _get_spinham()
+    spinham_with_field = _get_spinham()
+    spinham_with_field.add_magnetic_field(h=h)
+
+    energy = Energy(spinham=spinham)
+    reference = Energy(spinham=spinham_with_field)
+
+    spin_directions = np.random.default_rng(0).normal(size=(2, 3))
+
+    assert np.allclose(energy.E_0(spin_directions, h=h), reference.E_0(spin_directions))
+    assert np.allclose(
+        energy.gradient(spin_directions, h=h), reference.gradient(spin_directions)
+    )
+    assert np.allclose(
+        energy.torque(spin_directions, h=h), reference.torque(spin_directions)
+    )
+
+    # Original Hamiltonian is not modified
+    assert len(spinham._1) == 0
+
+
+@pytest.mark.parametrize("supercell", [(1, 1, 1), (2, 1, 3)])
+def test_energy_with_field_supercell(supercell):
+    spinham = _get_spinham()
+    h = [1, -2, 3]
+
+    n_cells = supercell[0] * supercell[1] * supercell[2]
+    spin_directions = np.random.default_rng(0).normal(size=(2, 3))
+
+    energy = Energy(spinham=spinham)
+    supercell_energy = Energy(
+        spinham=SupercellView(spinham=spinham, supercell=supercell)
+    )
+
+    assert np.allclose(
+        supercell_energy.E_0(np.tile(spin_directions, (n_cells, 1)), h=h),
+        n_cells * energy.E_0(spin_directions, h=h),
+    )
+    assert np.allclose(
+        supercell_energy.gradient(np.tile(spin_directions, (n_cells, 1)), h=h),
+        np.tile(energy.gradient(spin_directions, h=h), (n_cells, 1)),
+    )
+
+
+def test_field_sweep_with_one_energy():
+    spinham = _get_spinham()
+    energy = Energy(spinham=spinham)
+
+    for h_z in [0.5, 1, 5]:
+        h = [0, 0, h_z]
+        spinham_with_field = _get_spinham()
+        spinham_with_field.add_magnetic_field(h=h)
+
+        spin_directions = energy.optimize(
+            initial_guess=[[0.3, 0.2, 1], [0.1, -0.4, 0.8]], quiet=True, h=h
+        )
+        reference = Energy(spinham=spinham_with_field)
+
+        assert np.allclose(
+            energy.E_0(spin_directions, h=h), reference.E_0(spin_directions)
+        )
+        assert np.allclose(reference.torque(spin_directions), 0, atol=1e-4)
+
+
+def test_lswt_with_field():
+    spinham = _get_spinham()
+    h = [0, 0, -3]
+    spin_directions = [[0, 0, 1], [0, 0, 1]]
+
+    spinham_with_field = _get_spinham()
+    spinham_with_field.add_magnetic_field(h=h)
+
+    lswt = LSWT(spinham=spinham, spin_directions=spin_directions, h=h)
+    reference = LSWT(spinham=spinham_with_field, spin_directions=spin_directions)
+
+    assert np.allclose(lswt.E_2, reference.E_2)
+    for k in [[0, 0, 0], [0.1, 0.2, 0.3], [0.5, 0.5, 0]]:
+        assert np.allclose(
+            lswt.omega(k, relative=True), reference.omega(k, relative=True)
+        )
+
+
+def test_field_without_g_factors():
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(names=["A1"], positions=[[0, 0, 0]], spins=[1]),
+        convention=Convention(multiple_counting=True, spin_normalized=False, c21=1),
+    )
+    spinham.add_21(alpha=0, parameter=np.eye(3))
+
+    energy = Energy(spinham=spinham)
+
+    assert np.allclose(energy.E_0([[0, 0, 1]]), 1)
+
+    with pytest.raises(ValueError):
+        energy.E_0([[0, 0, 1]], h=[0, 0, 1])
+
+    with pytest.raises(ValueError):
+        LSWT(spinham=spinham, spin_directions=[[0, 0, 1]], h=[0, 0, 1])
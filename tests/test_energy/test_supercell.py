@@ -0,0 +1,200 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+
+from magnopy import (
+    Convention,
+    Energy,
+    SpinHamiltonian,
+    SupercellView,
+    examples,
+    make_supercell,
+)
+
+
+def _get_spinham(spins=(0.5, 2, 1), spin_normalized=True):
+    rng = np.random.default_rng(42)
+
+    convention = Convention(
+        multiple_counting=False,
+        spin_normalized=spin_normalized,
+        c1=1,
+        c21=1,
+        c22=1,
+        c31=1,
+        c32=1,
+        c33=1,
+        c41=1,
+        c421=1,
+        c422=1,
+        c43=1,
+        c44=1,
+    )
+
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(
+            names=["A1", "A2", "A3"],
+            positions=[[0, 0, 0], [0.5, 0.5, 0.5], [0.5, 0, 0]],
+            spins=list(spins),
+            g_factors=[2, 2, 2],
+        ),
+        convention=convention,
+    )
+
+    for alpha in [0, 1]:
+        spinham.add_1(alpha=alpha, parameter=rng.normal(size=3))
+        spinham.add_21(alpha=alpha, parameter=rng.normal(size=(3, 3)))
+        spinham.add_31(alpha=alpha, parameter=rng.normal(size=(3, 3, 3)))
+        spinham.add_41(alpha=alpha, parameter=rng.normal(size=(3, 3, 3, 3)))
+
+    for alpha, beta, nu in [
+        (0, 1, (0, 0, 0)),
+        (0, 0, (1, 0, 0)),
+        (1, 0, (0, 2, -1)),
+        (1, 1, (1, 1, 0)),
+    ]:
+        spinham.add_22(alpha, beta, nu, parameter=rng.normal(size=(3, 3)))
+        spinham.add_32(alpha, beta, nu, parameter=rng.normal(size=(3, 3, 3)))
+        spinham.add_421(alpha, beta, nu, parameter=rng.normal(size=(3, 3, 3, 3)))
+        spinham.add_422(alpha, beta, nu, parameter=rng.normal(size=(3, 3, 3, 3)))
+
+    spinham.add_33(0, 1, 1, (0, 0, 0), (1, 0, 0), parameter=rng.normal(size=(3, 3, 3)))
+    spinham.add_43(
+        1, 0, 1, (0, 1, 0), (0, 0, 1), parameter=rng.normal(size=(3, 3, 3, 3))
+    )
+    spinham.add_44(
+        0,
+        1,
+        0,
+        1,
+        (0, 0, 0),
+        (1, 0, 0),
+        (1, 1, 0),
+        parameter=rng.normal(size=(3, 3, 3, 3)),
+    )
+
+    return spinham
+
+
+def test_supercell_view_atoms():
+    spinham = _get_spinham()
+
+    supercell_spinham = SupercellView(spinham=spinham, supercell=(2, 3, 1))
+    reference = make_supercell(spinham=spinham, supercell=(2, 3, 1))
+
+    assert supercell_spinham.M == reference.M
+    assert np.allclose(supercell_spinham.cell, reference.cell)
+    assert supercell_spinham.magnetic_atoms == reference.magnetic_atoms
+
+
+@pytest.mark.parametrize("supercell", [(1, 1, 1), (2, 1, 1), (2, 3, 1), (3, 2, 2)])
+def test_supercell_energy_uniform(supercell):
+    spinham = _get_spinham()
+    n_cells = supercell[0] * supercell[1] * supercell[2]
+
+    spin_directions = np.random.default_rng(0).normal(size=(spinham.M, 3))
+    energy = Energy(spinham=spinham)
+
+    supercell_energy = Energy(
+        spinham=SupercellView(spinham=spinham, supercell=supercell)
+    )
+
+    assert supercell_energy.M == n_cells * spinham.M
+    assert np.allclose(
+        supercell_energy.E_0(np.tile(spin_directions, (n_cells, 1))),
+        n_cells * energy.E_0(spin_directions),
+    )
+    assert np.allclose(
+        supercell_energy.gradient(np.tile(spin_directions, (n_cells, 1))),
+        np.tile(energy.gradient(spin_directions), (n_cells, 1)),
+    )
+
+
+@pytest.mark.parametrize("supercell", [(2, 1, 1), (2, 3, 1), (3, 2, 2)])
+@pytest.mark.parametrize(
+    "spins, spin_normalized", [((1, 1, 1), True), ((0.5, 2, 1), False)]
+)
+def test_supercell_energy_two_sites(supercell, spins, spin_normalized):
+    # All terms are compared. The combination of unequal spins and spin-normalized
+    # parameters is left out on purpose: in that case the double of a (3, 2) or
+    # (4, 2, 1) parameter carries the ratio of two spins, thus make_supercell, which
+    # may store the other primary version of it, describes a different Hamiltonian.
+    spinham = _get_spinham(spins=spins, spin_normalized=spin_normalized)
+
+    supercell_spinham = SupercellView(spinham=spinham, supercell=supercell)
+    spin_directions = np.random.default_rng(0).normal(size=(supercell_spinham.M, 3))
+
+    energy = Energy(spinham=supercell_spinham)
+    reference = Energy(spinham=make_supercell(spinham=spinham, supercell=supercell))
+
+    assert np.allclose(energy.E_0(spin_directions), reference.E_0(spin_directions))
+    assert np.allclose(
+        energy.gradient(spin_directions), reference.gradient(spin_directions)
+    )
+
+
+@pytest.mark.parametrize("supercell", [(1, 1, 1), (2, 1, 1), (2, 3, 1), (3, 2, 2)])
+def test_supercell_energy_dipole_dipole_ewald(supercell):
+    spinham = _get_spinham(spin_normalized=False)
+    spinham.add_dipole_dipole_ewald()
+
+    supercell_spinham = SupercellView(spinham=spinham, supercell=supercell)
+    spin_directions = np.random.default_rng(1).normal(size=(supercell_spinham.M, 3))
+
+    energy = Energy(spinham=supercell_spinham)
+    reference = Energy(spinham=make_supercell(spinham=spinham, supercell=supercell))
+
+    # Dense matrix of lattice sums is never built for the supercell
+    assert energy.J_dd is None
+
+    # Lattice sums converge up to the tolerance of the Ewald summation
+    assert np.allclose(
+        energy.E_0(spin_directions), reference.E_0(spin_directions), atol=1e-5
+    )
+    assert np.allclose(
+        energy.gradient(spin_directions), reference.gradient(spin_directions), atol=1e-5
+    )
+
+
+@pytest.mark.parametrize("supercell", [(2, 1, 1), (1, 2, 3)])
+def test_supercell_energy_vector_parameters(supercell):
+    # Some of the on-site parameters are stored as (3,) vectors
+    spinham = examples.full_ham()
+
+    supercell_spinham = SupercellView(spinham=spinham, supercell=supercell)
+    spin_directions = np.random.default_rng(2).normal(size=(supercell_spinham.M, 3))
+
+    energy = Energy(spinham=supercell_spinham)
+    reference = Energy(spinham=make_supercell(spinham=spinham, supercell=supercell))
+
+    assert np.allclose(energy.E_0(spin_directions), reference.E_0(spin_directions))
+    assert np.allclose(
+        energy.gradient(spin_directions), reference.gradient(spin_directions)
+    )
+
+
+def test_supercell_view_wrong_supercell():
+    with pytest.raises(ValueError):
+        SupercellView(spinham=_get_spinham(), supercell=(0, 1, 1))
@@ -0,0 +1,91 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+
+from magnopy.examples import random_ham
+
+ALL_TERMS = ["1", "21", "22", "31", "32", "33", "41", "421", "422", "43", "44"]
+
+
+@pytest.mark.parametrize(
+    "n_sublattices, n_shells, n_cells",
+    [(1, 0, 1), (1, 1, 7), (3, 1, 7), (5, 2, 19), (2, 3, 27)],
+)
+def test_random_ham_number_of_bonds(n_sublattices, n_shells, n_cells):
+    spinham = random_ham(n_sublattices=n_sublattices, n_shells=n_shells, seed=0)
+
+    M = n_sublattices
+    assert len(spinham._22) == M * (M - 1) // 2 + M**2 * (n_cells - 1) // 2
+    assert len(spinham._21) == M
+
+
+def test_random_ham_same_seed():
+    spinham1 = random_ham(n_sublattices=4, terms=ALL_TERMS, seed=1)
+    spinham2 = random_ham(n_sublattices=4, terms=ALL_TERMS, seed=1)
+    spinham3 = random_ham(n_sublattices=4, terms=ALL_TERMS, seed=2)
+
+    assert spinham1.fingerprint() == spinham2.fingerprint()
+    assert spinham1.fingerprint() != spinham3.fingerprint()
+
+
+@pytest.mark.parametrize("n_sublattices, n_shells", [(2, 1), (3, 1), (2, 2)])
+def test_random_ham_same_as_added_one_by_one(n_sublattices, n_shells):
+    spinham = random_ham(
+        n_sublattices=n_sublattices, n_shells=n_shells, terms=ALL_TERMS, seed=3
+    )
+
+    # Parameters are added through the public interface, which finds the primary
+    # versions of the bonds and sorts them
+    reference = spinham.get_empty()
+    for term in ALL_TERMS:
+        assert len(getattr(spinham, f"_{term}")) > 0
+        for parameter in getattr(spinham, f"_{term}"):
+            getattr(reference, f"add_{term}")(*parameter)
+
+    for term in ALL_TERMS:
+        keys = [entry[:-1] for entry in getattr(spinham, f"_{term}")]
+        reference_keys = [entry[:-1] for entry in getattr(reference, f"_{term}")]
+        assert keys == reference_keys
+
+    assert spinham.fingerprint() == reference.fingerprint()
+
+
+def test_random_ham_ferromagnet():
+    spinham = random_ham(n_sublattices=3, anisotropy=0, dmi=0, seed=0)
+
+    for _, parameter in spinham.p21:
+        assert np.allclose(parameter, 0)
+
+    for _, _, _, parameter in spinham.p22:
+        assert np.allclose(parameter, parameter[0, 0] * np.eye(3))
+        assert -1.5 <= parameter[0, 0] <= -0.5
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(n_sublattices=0), dict(n_shells=-1), dict(terms=["22", "23"])],
+)
+def test_random_ham_errors(kwargs):
+    with pytest.raises(ValueError):
+        random_ham(**kwargs)
@@ -0,0 +1,143 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+
+from magnopy import LSWT, BandInterpolator, Convention, KGrid, SpinHamiltonian
+from magnopy.examples import cubic_ferro_nn, random_ham
+
+
+def _random_lswt(M=6):
+    spinham = random_ham(n_sublattices=M, n_shells=2, seed=3)
+    return LSWT(spinham=spinham, spin_directions=[[0, 0, 1] for _ in range(M)])
+
+
+def _crossing_lswt():
+    # Two decoupled sublattices with the chains along different directions, their
+    # magnon bands cross
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(
+            names=["A", "B"],
+            positions=[[0, 0, 0], [0.5, 0.5, 0.5]],
+            spins=[1, 1],
+            g_factors=[2, 2],
+        ),
+        convention=Convention(
+            spin_normalized=False, multiple_counting=True, c21=1, c22=1
+        ),
+    )
+    spinham.add_22(alpha=0, beta=0, nu=(1, 0, 0), parameter=-np.eye(3))
+    spinham.add_22(alpha=1, beta=1, nu=(0, 1, 0), parameter=-2 * np.eye(3))
+    spinham.add_21(alpha=1, parameter=np.diag([0, 0, -0.5]))
+
+    return LSWT(spinham=spinham, spin_directions=[[0, 0, 1], [0, 0, 1]])
+
+
+@pytest.mark.parametrize("n_bands", [1, 2, 6])
+def test_exact_at_grid_points(n_bands):
+    lswt = _random_lswt()
+    kgrid = KGrid(cell=lswt.cell, mesh=(3, 3, 2), shift=(0, 0.5, 0))
+    interpolator = BandInterpolator(
+        lswt=lswt, kgrid=kgrid, n_bands=n_bands, number_processors=1
+    )
+
+    errors = interpolator.estimate_error(kpoints=kgrid.points())
+
+    assert errors.shape == (kgrid.N, n_bands)
+    assert np.allclose(errors, 0, atol=1e-8)
+
+
+def test_all_bands_exact():
+    lswt = _random_lswt()
+    kgrid = KGrid(cell=lswt.cell, mesh=(2, 2, 2))
+    interpolator = BandInterpolator(lswt=lswt, kgrid=kgrid, number_processors=1)
+
+    errors = interpolator.estimate_error(n_samples=20, seed=0)
+
+    assert np.allclose(errors, 0, atol=1e-8)
+
+
+def test_upper_bound():
+    lswt = _random_lswt()
+    kgrid = KGrid(cell=lswt.cell, mesh=(4, 4, 4))
+    interpolator = BandInterpolator(
+        lswt=lswt, kgrid=kgrid, n_bands=2, number_processors=1
+    )
+
+    kpoints = np.random.default_rng(1).random((30, 3))
+    omegas = interpolator.omega(kpoints=kpoints, relative=True)
+    errors = interpolator.estimate_error(kpoints=kpoints, relative=True)
+
+    assert np.all(np.diff(omegas, axis=1) >= 0)
+    assert np.all(errors > -1e-8)
+
+    # Increasing the grid only improves the interpolation
+    interpolator = BandInterpolator(
+        lswt=lswt, kgrid=KGrid(cell=lswt.cell, mesh=(6, 6, 6)), n_bands=2
+    )
+    assert np.all(interpolator.estimate_error(kpoints=kpoints, relative=True) > -1e-8)
+
+
+def test_crossing_bands():
+    lswt = _crossing_lswt()
+    kgrid = KGrid(cell=lswt.cell, mesh=(3, 3, 3), shift=0.5)
+    interpolator = BandInterpolator(lswt=lswt, kgrid=kgrid, number_processors=1)
+
+    # Along the line, where the bands cross
+    kpoints = np.linspace([0.05, 0.15, 0.1], [0.5, 0.15, 0.1], 21)
+
+    assert np.allclose(
+        interpolator.estimate_error(kpoints=kpoints, relative=True), 0, atol=1e-8
+    )
+
+
+def test_relative_and_absolute():
+    spinham = cubic_ferro_nn(a=2)
+    lswt = LSWT(spinham=spinham, spin_directions=[[0, 0, 1]], h=[0, 0, 1])
+    kgrid = KGrid(cell=spinham.cell, mesh=(4, 4, 4))
+    interpolator = BandInterpolator(lswt=lswt, kgrid=kgrid, number_processors=1)
+
+    kpoints = np.random.default_rng(2).random((10, 3))
+
+    assert np.allclose(
+        interpolator.omega(kpoints=kpoints, relative=True),
+        interpolator.omega(kpoints=kpoints @ kgrid.rcell, relative=False),
+    )
+    assert np.allclose(
+        interpolator.omega(kpoints=kpoints, relative=True)[:, 0],
+        [lswt.omega(k=k, relative=True)[0].real for k in kpoints],
+    )
+
+
+@pytest.mark.parametrize("n_bands", [0, 7])
+def test_wrong_n_bands(n_bands):
+    lswt = _random_lswt()
+
+    with pytest.raises(ValueError):
+        BandInterpolator(
+            lswt=lswt,
+            kgrid=KGrid(cell=lswt.cell, mesh=(2, 2, 2)),
+            n_bands=n_bands,
+            number_processors=1,
+        )
@@ -0,0 +1,194 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+
+from magnopy import Convention, Energy, SpinHamiltonian
+from magnopy.io import load_spinham, save_spinham
+
+TERMS = ["1", "21", "22", "31", "32", "33", "41", "421", "422", "43", "44"]
+
+
+def _get_spinham():
+    rng = np.random.default_rng(0)
+
+    convention = Convention(
+        multiple_counting=True,
+        spin_normalized=False,
+        c1=1,
+        c21=1,
+        c22=-0.5,
+        c31=1,
+        c32=1,
+        c33=1,
+        c41=1,
+        c421=1,
+        c422=1,
+        c43=1,
+        c44=1,
+        name="test",
+    )
+    spinham = SpinHamiltonian(
+        cell=[[3, 0, 0], [0, 4, 0], [1, 0, 5]],
+        atoms=dict(
+            names=["Fe1", "Fe2", "O"],
+            positions=np.array([[0, 0, 0], [0.5, 0.5, 0.5], [0.25, 0, 0]]),
+            spins=[2.5, 1.5, 0],
+            g_factors=[2, 2.1, 2],
+        ),
+        convention=convention,
+    )
+
+    spinham.add_1(alpha=0, parameter=rng.normal(size=3))
+    spinham.add_21(alpha=1, parameter=rng.normal(size=(3, 3)))
+    spinham.add_22(alpha=0, beta=1, nu=(0, 0, 0), parameter=rng.normal(size=(3, 3)))
+    spinham.add_22(alpha=0, beta=0, nu=(1, 0, 0), parameter=rng.normal(size=(3, 3)))
+    spinham.add_22(alpha=1, beta=0, nu=(0, -1, 2), parameter=rng.normal(size=(3, 3)))
+    spinham.add_31(alpha=0, parameter=rng.normal(size=(3, 3, 3)))
+    spinham.add_32(alpha=0, beta=1, nu=(1, 0, 0), parameter=rng.normal(size=(3, 3, 3)))
+    spinham.add_33(
+        alpha=0,
+        beta=1,
+        gamma=0,
+        nu=(0, 1, 0),
+        _lambda=(0, 0, 1),
+        parameter=rng.normal(size=(3, 3, 3)),
+    )
+    spinham.add_41(alpha=1, parameter=rng.normal(size=(3, 3, 3, 3)))
+    spinham.add_421(
+        alpha=0, beta=1, nu=(0, 0, 1), parameter=rng.normal(size=(3, 3, 3, 3))
+    )
+    spinham.add_422(
+        alpha=1, beta=1, nu=(1, 1, 0), parameter=rng.normal(size=(3, 3, 3, 3))
+    )
+    spinham.add_43(
+        alpha=0,
+        beta=1,
+        gamma=1,
+        nu=(0, 0, 0),
+        _lambda=(1, 0, 0),
+        parameter=rng.normal(size=(3, 3, 3, 3)),
+    )
+    spinham.add_44(
+        alpha=0,
+        beta=1,
+        gamma=0,
+        epsilon=1,
+        nu=(0, 0, 0),
+        _lambda=(1, 0, 0),
+        rho=(1, 0, 0),
+        parameter=rng.normal(size=(3, 3, 3, 3)),
+    )
+    spinham.add_dipole_dipole_ewald(tolerance=1e-6)
+
+    return spinham
+
+
+def _assert_same(spinham, reference):
+    assert np.allclose(spinham.cell, reference.cell)
+    assert spinham.convention == reference.convention
+    assert spinham.convention.name == reference.convention.name
+    assert spinham.atoms.names == reference.atoms.names
+    assert np.allclose(spinham.atoms.positions, reference.atoms.positions)
+    assert np.allclose(spinham.atoms.spins, reference.atoms.spins)
+    assert np.allclose(spinham.atoms.g_factors, reference.atoms.g_factors)
+    assert spinham.M == reference.M
+    assert spinham.dipole_dipole_ewald == reference.dipole_dipole_ewald
+
+    for term in TERMS:
+        parameters = getattr(spinham, f"_{term}")
+        reference_parameters = getattr(reference, f"_{term}")
+
+        assert len(parameters) == len(reference_parameters)
+        for parameter, reference_parameter in zip(parameters, reference_parameters):
+            assert parameter[:-1] == reference_parameter[:-1]
+            assert np.array_equal(parameter[-1], reference_parameter[-1])
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trip(tmp_path, mmap):
+    spinham = _get_spinham()
+    filename = str(tmp_path / "spinham.npz")
+
+    save_spinham(spinham, filename)
+    loaded = load_spinham(filename, mmap=mmap)
+
+    _assert_same(loaded, spinham)
+
+    spin_directions = np.random.default_rng(1).normal(size=(2, 3))
+    assert np.allclose(
+        Energy(loaded).E_0(spin_directions), Energy(spinham).E_0(spin_directions)
+    )
+
+
+def test_round_trip_empty(tmp_path):
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(names=["Cr"], positions=[[0, 0, 0]], spins=[1], g_factors=[2]),
+        convention=Convention(),
+    )
+    filename = str(tmp_path / "spinham.npz")
+
+    save_spinham(spinham, filename)
+
+    _assert_same(load_spinham(filename), spinham)
+
+
+def test_mapped_parameters_are_not_modified(tmp_path):
+    spinham = _get_spinham()
+    filename = str(tmp_path / "spinham.npz")
+    save_spinham(spinham, filename)
+
+    loaded = load_spinham(filename, mmap=True)
+
+    doubled = 2 * loaded
+    loaded.convention = loaded.convention.get_modified(multiple_counting=False)
+    loaded.add_22(alpha=0, beta=1, nu=(0, 0, 0), parameter=np.eye(3), replace=True)
+
+    _assert_same(load_spinham(filename, mmap=True), spinham)
+    assert np.allclose(doubled._22[0][-1], 2 * spinham._22[0][-1])
+
+
+def test_mapped_parameters_are_views_of_file(tmp_path):
+    spinham = _get_spinham()
+    filename = str(tmp_path / "spinham.npz")
+    save_spinham(spinham, filename)
+
+    parameter = load_spinham(filename, mmap=True)._22[0][-1]
+    assert not parameter.flags["WRITEABLE"]
+    assert not parameter.flags["OWNDATA"]
+
+    base = parameter
+    while not isinstance(base, np.memmap) and base.base is not None:
+        base = base.base
+    assert isinstance(base, np.memmap)
+
+    assert load_spinham(filename, mmap=False)._22[0][-1].flags["WRITEABLE"]
+
+
+def test_wrong_file(tmp_path):
+    filename = str(tmp_path / "other.npz")
+    np.savez(filename, cell=np.eye(3))
+
+    with pytest.raises(ValueError):
+        load_spinham(filename)
@@ -0,0 +1,131 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+
+from magnopy import Convention, SpinHamiltonian
+from magnopy.io import load_grogu
+
+MINOR_SEP = "-" * 80
+MAJOR_SEP = "=" * 80
+
+CELL = np.array([[3.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.5, 0.0, 5.0]])
+NAMES = ["Cr1", "Cr2"]
+POSITIONS = np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.25]])
+SPINS = [1.5, 2.0]
+
+
+def _matrix_lines(matrix):
+    return [f"  {row[0]:12.6f} {row[1]:12.6f} {row[2]:12.6f}" for row in matrix]
+
+
+def _write_grogu(filename, anisotropies, bonds):
+    lines = [
+        MAJOR_SEP,
+        "GROGU output",
+        MAJOR_SEP,
+        "Cell (Ang)",
+        *_matrix_lines(CELL),
+        MAJOR_SEP,
+        "Magnetic sites",
+        f"Number of sites: {len(NAMES)}",
+        "Name     x (Ang)     y (Ang)     z (Ang)     s",
+    ]
+    for name, position, spin in zip(NAMES, POSITIONS @ CELL, SPINS):
+        lines.append(
+            f"{name:<6} {position[0]:10.6f} {position[1]:10.6f} {position[2]:10.6f}"
+            f" {spin:8.4f}"
+        )
+
+    lines.extend([MAJOR_SEP, "Intra-atomic anisotropy tensor (meV)"])
+    for name, matrix in zip(NAMES, anisotropies):
+        lines.extend([MINOR_SEP, name, "Matrix", *_matrix_lines(matrix)])
+
+    lines.extend(
+        [
+            MAJOR_SEP,
+            "Exchange tensor (meV)",
+            f"Number of pairs: {len(bonds)}",
+            MINOR_SEP,
+            "Name1 Name2 i j k d (Ang)",
+        ]
+    )
+    for alpha, beta, nu, matrix in bonds:
+        distance = np.linalg.norm(
+            (POSITIONS[beta] - POSITIONS[alpha] + np.array(nu)) @ CELL
+        )
+        lines.extend(
+            [
+                MINOR_SEP,
+                f"{NAMES[alpha]} {NAMES[beta]} {nu[0]} {nu[1]} {nu[2]} {distance:.4f}",
+                "Matrix",
+                *_matrix_lines(matrix),
+            ]
+        )
+    lines.append(MINOR_SEP)
+
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+@pytest.mark.parametrize("n_bonds", [0, 1, 50])
+def test_load_grogu(tmp_path, n_bonds):
+    rng = np.random.default_rng(1)
+
+    anisotropies = rng.normal(size=(2, 3, 3)).round(6)
+    bonds = []
+    for _ in range(n_bonds):
+        alpha, beta = rng.integers(0, 2, size=2).tolist()
+        nu = tuple(rng.integers(-2, 3, size=3).tolist())
+        if alpha != beta or nu != (0, 0, 0):
+            bonds.append((alpha, beta, nu, rng.normal(size=(3, 3)).round(6)))
+
+    filename = tmp_path / "grogu.txt"
+    _write_grogu(filename, anisotropies, bonds)
+
+    spinham = load_grogu(filename)
+
+    reference = SpinHamiltonian(
+        cell=CELL,
+        atoms=dict(names=NAMES, positions=POSITIONS, spins=SPINS, g_factors=[2, 2]),
+        convention=Convention.get_predefined("grogu"),
+    )
+    for alpha, matrix in enumerate(anisotropies):
+        reference.add_21(alpha=alpha, parameter=matrix)
+    for alpha, beta, nu, matrix in bonds:
+        reference.add_22(alpha=alpha, beta=beta, nu=nu, parameter=matrix, replace=True)
+
+    assert np.allclose(spinham.cell, CELL)
+    assert np.allclose(spinham.atoms.positions, POSITIONS)
+    assert np.allclose(spinham.atoms.spins, SPINS)
+    assert spinham.M == reference.M
+
+    assert len(spinham._21) == len(reference._21)
+    for (a1, p1), (a2, p2) in zip(spinham._21, reference._21):
+        assert a1 == a2
+        assert np.allclose(p1, p2)
+
+    assert len(spinham._22) == len(reference._22)
+    for (a1, b1, nu1, p1), (a2, b2, nu2, p2) in zip(spinham._22, reference._22):
+        assert (a1, b1, nu1) == (a2, b2, nu2)
+        assert np.allclose(p1, p2)
@@ -0,0 +1,155 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+
+from magnopy import Convention, SpinHamiltonian
+from magnopy._parameters._p22 import from_dmi, from_iso
+from magnopy.io import load_tb2j
+
+MINOR_SEP = "-" * 88
+MAJOR_SEP = "=" * 90
+
+CELL = np.array([[3.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.5, 0.0, 5.0]])
+NAMES = ["Fe1", "Fe2", "O1"]
+POSITIONS = np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.25], [0.25, 0.0, 0.5]])
+MAGMOMS = np.array([[0.0, 0.0, 3.0], [0.0, 0.0, -2.0], [0.0, 0.0, 0.0]])
+
+
+def _write_tb2j(filename, bonds):
+    lines = [
+        MAJOR_SEP,
+        "TB2J version: 0.0.0",
+        MAJOR_SEP,
+        "Cell (Angstrom):",
+        *[f"  {a[0]:10.6f} {a[1]:10.6f} {a[2]:10.6f}" for a in CELL],
+        "",
+        MAJOR_SEP,
+        "Atoms:",
+        "(Note: charge and magmoms only count the wannier functions.)",
+        "  Atom_number     x     y     z     w_charge     M(x)     M(y)     M(z)",
+    ]
+    for name, position, magmom in zip(NAMES, POSITIONS @ CELL, MAGMOMS):
+        lines.append(
+            f"  {name:<6} {position[0]:10.6f} {position[1]:10.6f} {position[2]:10.6f}"
+            f"   1.0000 {magmom[0]:8.4f} {magmom[1]:8.4f} {magmom[2]:8.4f}"
+        )
+    lines.extend(["Total  0.0  0.0  0.0  1.0  0.0  0.0  1.0", "", MAJOR_SEP])
+    lines.extend(
+        [
+            "Exchange:",
+            "    i      j          R        J_iso(meV)          vector          distance(A)",
+        ]
+    )
+
+    for alpha, beta, nu, iso, dmi, aniso in bonds:
+        vector = (POSITIONS[beta] - POSITIONS[alpha] + np.array(nu)) @ CELL
+        lines.extend(
+            [
+                MINOR_SEP,
+                f"   {NAMES[alpha]}   {NAMES[beta]}   ({nu[0]:3d}, {nu[1]:3d}, {nu[2]:3d}) "
+                f"({vector[0]:8.3f}, {vector[1]:8.3f}, {vector[2]:8.3f}) "
+                f"{np.linalg.norm(vector):8.3f}",
+            ]
+        )
+        if iso is not None:
+            lines.append(f"J_iso: {iso:10.4f}")
+        if dmi is not None:
+            lines.append(f"[Testing!] DMI: ({dmi[0]:.4f} {dmi[1]:.4f} {dmi[2]:.4f})")
+        if aniso is not None:
+            lines.append("[Testing!]J_ani:")
+            lines.extend([f"[{a[0]:10.4f} {a[1]:10.4f} {a[2]:10.4f}]" for a in aniso])
+        lines.append("")
+
+    with open(filename, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _get_bonds(n_bonds, seed=0):
+    rng = np.random.default_rng(seed)
+
+    bonds = []
+    for _ in range(n_bonds):
+        alpha, beta = rng.integers(0, 2, size=2).tolist()
+        nu = tuple(rng.integers(-2, 3, size=3).tolist())
+        if alpha == beta and nu == (0, 0, 0):
+            continue
+
+        iso = round(float(rng.normal()), 4)
+        dmi = rng.normal(size=3).round(4) if rng.random() < 0.7 else None
+        aniso = rng.normal(size=(3, 3)).round(4) if rng.random() < 0.5 else None
+        bonds.append((alpha, beta, nu, iso, dmi, aniso))
+
+    return bonds
+
+
+@pytest.mark.parametrize("n_bonds", [0, 1, 30, 200])
+def test_load_tb2j(tmp_path, n_bonds):
+    bonds = _get_bonds(n_bonds=n_bonds)
+    filename = tmp_path / "exchange.out"
+    _write_tb2j(filename, bonds)
+
+    spinham = load_tb2j(filename, quiet=False)
+
+    reference = SpinHamiltonian(
+        cell=CELL,
+        atoms=dict(
+            names=NAMES,
+            positions=POSITIONS,
+            g_factors=[2.0, 2.0, 2.0],
+            spins=[0, 0, 0],
+        ),
+        convention=Convention.get_predefined(name="tb2j"),
+    )
+    for alpha, beta, nu, iso, dmi, aniso in bonds:
+        parameter = from_iso(iso=iso)
+        if dmi is not None:
+            parameter = parameter + from_dmi(dmi=dmi)
+        if aniso is not None:
+            parameter = parameter + aniso
+        reference.add_22(
+            alpha=alpha, beta=beta, nu=nu, parameter=parameter, replace=True
+        )
+
+    assert np.allclose(spinham.cell, CELL, atol=1e-6)
+    assert np.allclose(spinham.atoms.positions, POSITIONS, atol=1e-6)
+    assert np.allclose(spinham.atoms.spins, [1.5, 1.0, 0.0])
+    assert spinham.M == reference.M
+
+    assert len(spinham._22) == len(reference._22)
+    for (a1, b1, nu1, p1), (a2, b2, nu2, p2) in zip(spinham._22, reference._22):
+        assert (a1, b1, nu1) == (a2, b2, nu2)
+        assert np.allclose(p1, p2)
+
+
+def test_load_tb2j_spin_values(tmp_path):
+    bonds = [(0, 1, (0, 0, 0), 1.0, None, None)]
+    filename = tmp_path / "exchange.out"
+    _write_tb2j(filename, bonds)
+
+    spinham = load_tb2j(filename, spin_values=[2, 0.5])
+
+    assert np.allclose(spinham.magnetic_atoms.spins, [2, 0.5])
+
+    with pytest.raises(ValueError):
+        load_tb2j(filename, spin_values=[2, 0.5, 1])
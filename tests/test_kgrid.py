@@ -0,0 +1,148 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+
+from magnopy import LSWT, Convention, KGrid, SpinHamiltonian
+from magnopy.examples import cubic_ferro_nn, random_ham
+
+
+def _bcc_antiferro():
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(
+            names=["Fe1", "Fe2"],
+            positions=[[0, 0, 0], [0.5, 0.5, 0.5]],
+            spins=[1, 1],
+            g_factors=[2, 2],
+        ),
+        convention=Convention(
+            spin_normalized=False, multiple_counting=True, c21=1, c22=1
+        ),
+    )
+    # Eight nearest neighbors
+    for nu in np.ndindex(2, 2, 2):
+        nu = tuple(-int(i) for i in nu)
+        spinham.add_22(alpha=0, beta=1, nu=nu, parameter=np.eye(3))
+    spinham.add_21(alpha=0, parameter=np.diag([0, 0, -0.1]))
+    spinham.add_21(alpha=1, parameter=np.diag([0, 0, -0.1]))
+
+    return spinham, [[0, 0, 1], [0, 0, -1]]
+
+
+@pytest.mark.parametrize("mesh", [(1, 1, 1), (4, 4, 4), (3, 5, 2)])
+@pytest.mark.parametrize("shift", [0, 0.5, (0, 0.5, 0)])
+def test_full_grid(mesh, shift):
+    kgrid = KGrid(cell=np.eye(3), mesh=mesh, shift=shift)
+
+    points = kgrid.points(relative=True)
+
+    assert kgrid.N == len(points) == np.prod(mesh)
+    assert len(np.unique(points, axis=0)) == kgrid.N
+    assert np.allclose((points * mesh - kgrid.shift) % 1, 0)
+    assert np.allclose(kgrid.points(), points @ kgrid.rcell)
+
+    # No symmetry - no reduction
+    assert np.allclose(kgrid.irreducible_points(relative=True), points)
+    assert np.allclose(kgrid.weights, 1 / kgrid.N)
+    assert np.all(kgrid.mapping == np.arange(kgrid.N))
+
+
+def test_time_reversal_and_inversion_same_reduction():
+    kgrid_inversion = KGrid(
+        cell=np.eye(3), mesh=(6, 6, 6), rotations=[np.eye(3), -np.eye(3)]
+    )
+    kgrid_time_reversal = KGrid(
+        cell=np.eye(3),
+        mesh=(6, 6, 6),
+        rotations=[np.eye(3), np.eye(3)],
+        time_reversals=[False, True],
+    )
+
+    assert np.all(kgrid_inversion.mapping == kgrid_time_reversal.mapping)
+    assert np.allclose(kgrid_inversion.weights, kgrid_time_reversal.weights)
+    # 8 time-reversal invariant points and the pairs of other ones
+    assert len(kgrid_inversion.weights) == 8 + (216 - 8) // 2
+
+
+def test_operation_incompatible_with_grid_is_ignored():
+    # Rotation by 90 degrees around z mixes b_1 and b_2
+    rotation = [[0, -1, 0], [1, 0, 0], [0, 0, 1]]
+
+    kgrid = KGrid(cell=np.eye(3), mesh=(4, 4, 1), rotations=[np.eye(3), rotation])
+    assert len(kgrid.weights) < kgrid.N
+
+    kgrid = KGrid(cell=np.eye(3), mesh=(4, 2, 1), rotations=[np.eye(3), rotation])
+    assert len(kgrid.weights) == kgrid.N
+
+
+@pytest.mark.parametrize(
+    "spinham, spin_directions",
+    [
+        (cubic_ferro_nn(), [[0, 0, 1]]),
+        (cubic_ferro_nn(), [[1, 1, 1]]),
+        _bcc_antiferro(),
+    ],
+)
+@pytest.mark.parametrize("mesh, shift", [((6, 6, 6), 0), ((4, 4, 2), 0.5)])
+def test_reduction_keeps_omegas(spinham, spin_directions, mesh, shift):
+    kgrid = KGrid.from_spinham(
+        spinham=spinham, mesh=mesh, spin_directions=spin_directions, shift=shift
+    )
+
+    assert len(kgrid.weights) < kgrid.N
+    assert np.isclose(np.sum(kgrid.weights), 1)
+    assert np.allclose(kgrid.weights * kgrid.N, np.bincount(kgrid.mapping))
+
+    lswt = LSWT(spinham=spinham, spin_directions=spin_directions)
+
+    omegas = np.array([lswt.omega(k=k) for k in kgrid.points()]).real
+    irreducible = np.array([lswt.omega(k=k) for k in kgrid.irreducible_points()]).real
+
+    # Colpa fails at the Goldstone modes
+    finite = np.all(np.isfinite(omegas), axis=1)
+    assert np.allclose(kgrid.expand(irreducible)[finite], omegas[finite])
+
+
+def test_no_symmetry():
+    spinham = random_ham(n_sublattices=3, seed=0)
+    spin_directions = np.random.default_rng(0).normal(size=(3, 3))
+
+    kgrid = KGrid.from_spinham(
+        spinham=spinham, mesh=(3, 3, 3), spin_directions=spin_directions
+    )
+
+    assert len(kgrid.weights) == kgrid.N
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(mesh=(0, 1, 1)),
+        dict(mesh=(1, 1)),
+        dict(mesh=(1, 1, 1), rotations=[np.eye(3)], time_reversals=[False, True]),
+    ],
+)
+def test_errors(kwargs):
+    with pytest.raises(ValueError):
+        KGrid(cell=np.eye(3), **kwargs)
@@ -0,0 +1,166 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+import wulfric
+
+from magnopy import LSWT, Convention, SpinHamiltonian, refine_kpath
+from magnopy._kpath import _flag_curvature, _flag_mode_order
+from magnopy.examples import cubic_ferro_nn
+
+
+def _crossing_bands():
+    # Two decoupled sublattices with the chains along different directions, their
+    # magnon bands cross along the path
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(
+            names=["A", "B"],
+            positions=[[0, 0, 0], [0.5, 0.5, 0.5]],
+            spins=[1, 1],
+            g_factors=[2, 2],
+        ),
+        convention=Convention(
+            spin_normalized=False, multiple_counting=True, c21=1, c22=1
+        ),
+    )
+    spinham.add_22(alpha=0, beta=0, nu=(1, 0, 0), parameter=-np.eye(3))
+    spinham.add_22(alpha=1, beta=1, nu=(0, 1, 0), parameter=-2 * np.eye(3))
+    spinham.add_21(alpha=1, parameter=np.diag([0, 0, -0.5]))
+
+    return spinham, [[0, 0, 1], [0, 0, 1]]
+
+
+def _get_kp(spinham):
+    return wulfric.Kpoints.from_crystal(
+        cell=spinham.cell, atoms=spinham.atoms, convention="HPKOT"
+    )
+
+
+@pytest.mark.parametrize("model", ["cubic", "crossing"])
+def test_refine_kpath(model):
+    if model == "cubic":
+        spinham, spin_directions = cubic_ferro_nn(), [[0, 0, 1]]
+    else:
+        spinham, spin_directions = _crossing_bands()
+
+    lswt = LSWT(spinham=spinham, spin_directions=spin_directions)
+    kp = _get_kp(spinham)
+
+    tolerance = 1e-3
+    kpoints, flat_points, omegas, deltas, G = refine_kpath(
+        lswt=lswt, kp=kp, tolerance=tolerance, number_processors=1
+    )
+
+    N, M = len(kpoints), lswt.M
+    assert flat_points.shape == (N,)
+    assert omegas.shape == (N, M)
+    assert deltas.shape == (N,)
+    assert G.shape == (N, M, 2 * M)
+
+    # Path is traversed in order and ends at the last tick
+    assert np.all(np.diff(flat_points) >= -1e-12)
+    assert np.isclose(flat_points[0], kp.ticks()[0])
+    assert np.isclose(flat_points[-1], kp.ticks()[-1])
+    for tick in kp.ticks():
+        assert np.any(np.isclose(flat_points, tick))
+
+    # Same results as the direct diagonalization
+    for i in range(0, N, max(1, N // 20)):
+        o, d, g = lswt.diagonalize(k=kpoints[i], relative=False)
+        assert np.allclose(omegas[i], o, equal_nan=True)
+        assert np.isclose(deltas[i], d, equal_nan=True)
+
+    # Sparser than the uniform path of comparable accuracy
+    assert N < len(kp.points())
+
+    # Linear interpolation between the neighbors is close to the exact energies
+    scale = tolerance * (np.nanmax(omegas.real) - np.nanmin(omegas.real))
+    for i in range(N - 1):
+        if flat_points[i + 1] - flat_points[i] < 1e-8:
+            continue
+        if np.isnan(omegas[i : i + 2]).any():
+            continue
+        middle = np.array(
+            lswt.omega(k=(kpoints[i] + kpoints[i + 1]) / 2, relative=False)
+        ).real
+        linear = (omegas[i].real + omegas[i + 1].real) / 2
+        assert np.allclose(middle, linear, atol=10 * scale)
+
+
+def test_refine_kpath_no_refinement():
+    spinham = cubic_ferro_nn()
+    lswt = LSWT(spinham=spinham, spin_directions=[[0, 0, 1]])
+    kp = _get_kp(spinham)
+
+    kpoints, flat_points, _, _, _ = refine_kpath(
+        lswt=lswt, kp=kp, n_initial=3, max_depth=0, number_processors=1
+    )
+
+    n_segments = sum(len(subpath) - 1 for subpath in kp.path)
+    assert len(kpoints) == n_segments * 5
+
+
+@pytest.mark.parametrize("n_initial, max_depth", [(-1, 6), (8, -1)])
+def test_refine_kpath_wrong_arguments(n_initial, max_depth):
+    spinham = cubic_ferro_nn()
+    lswt = LSWT(spinham=spinham, spin_directions=[[0, 0, 1]])
+
+    with pytest.raises(ValueError):
+        refine_kpath(
+            lswt=lswt,
+            kp=_get_kp(spinham),
+            n_initial=n_initial,
+            max_depth=max_depth,
+            number_processors=1,
+        )
+
+
+def test_flag_curvature():
+    t = np.linspace(0, 1, 7)
+
+    flags = _flag_curvature(t=t, omegas=(2 * t + 1)[:, np.newaxis], scale=1e-6)
+    assert not np.any(flags)
+
+    omegas = (2 * t + 1)[:, np.newaxis]
+    omegas[1] += 1
+    flags = _flag_curvature(t=t, omegas=omegas, scale=1e-6)
+    assert np.all(flags == [True, True, True, False, False, False])
+
+
+def test_flag_mode_order():
+    omegas = np.array([[1.0, 2.0], [1.0, 2.0], [1.0, 2.0]])
+    G = np.zeros((3, 2, 4), dtype=complex)
+    G[:, 0, 0] = 1
+    G[:, 1, 1] = 1
+
+    # Same modes at each point
+    assert not np.any(_flag_mode_order(omegas=omegas, G=G, scale=1e-3))
+
+    # Modes change their order over the second interval
+    G[2] = G[2, ::-1]
+    assert np.all(_flag_mode_order(omegas=omegas, G=G, scale=1e-3) == [False, True])
+
+    # Degenerate modes are ignored
+    omegas[:] = 1.0
+    assert not np.any(_flag_mode_order(omegas=omegas, G=G, scale=1e-3))
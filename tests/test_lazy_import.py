@@ -0,0 +1,89 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_modules(code):
+    code = f"import sys\n{code}\nprint(' '.join(sorted(sys.modules)))"
+    return subprocess.check_output([sys.executable, "-c", code], text=True).split()
+
+
+def test_import_magnopy_is_light():
+    modules = _loaded_modules("import magnopy")
+
+    assert "magnopy._lswt" in modules
+    for name in [
+        "magnopy.io",
+        "magnopy.scenarios",
+        "magnopy.examples",
+        "magnopy.experimental",
+        "magnopy.thermodynamics",
+        "magnopy._plotly_engine",
+        "matplotlib",
+        "plotly",
+        "scipy",
+    ]:
+        assert name not in modules
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["io", "scenarios", "examples", "experimental", "thermodynamics", "PlotlyEngine"],
+)
+def test_lazy_attributes(name):
+    import magnopy
+
+    assert name in dir(magnopy)
+    assert getattr(magnopy, name) is getattr(magnopy, name)
+
+
+def test_unknown_attribute():
+    import magnopy
+
+    with pytest.raises(AttributeError):
+        magnopy.does_not_exist
+
+
+def test_star_import():
+    import magnopy
+
+    namespace = {}
+    exec("from magnopy import *", namespace)
+    namespace.pop("__builtins__")
+
+    assert set(namespace) == set(magnopy.__all__)
+    assert set(magnopy.__all__) <= set(dir(magnopy))
+    for name in [
+        "io",
+        "scenarios",
+        "examples",
+        "experimental",
+        "thermodynamics",
+        "PlotlyEngine",
+        "SpinHamiltonian",
+        "LSWT",
+    ]:
+        assert namespace[name] is getattr(magnopy, name)
@@ -26,7 +26,7 @@ from hypothesis import given
 from hypothesis import strategies as st
 from hypothesis.extra.numpy import arrays as harrays
 
-from magnopy import span_local_rf
+from magnopy import span_local_rf, span_local_rfs
 
 
 def test_span_local_rf_along_z():
@@ -71,3 +71,37 @@ def test_span_local_rf(direction_vector):
         )
 
         assert np.allclose([x_a @ y_a, x_a @ z_a, y_a @ z_a], np.zeros(3))
+
+
+@given(
+    harrays(
+        np.float64,
+        st.tuples(st.integers(min_value=1, max_value=10), st.just(3)),
+        elements=st.floats(min_value=-1e8, max_value=1e8, allow_subnormal=False),
+    ),
+    st.booleans(),
+)
+def test_span_local_rfs(direction_vectors, hybridize):
+    # Special cases
+    direction_vectors[::3] = [0, 0, 1]
+    direction_vectors[1::4] = [0, 0, -2]
+
+    if np.any(np.all(np.isclose(direction_vectors, 0), axis=1)):
+        with pytest.raises(ValueError):
+            span_local_rfs(direction_vectors, hybridize=hybridize)
+
+    else:
+        expected = np.array(
+            [
+                span_local_rf(direction_vector, hybridize=hybridize)
+                for direction_vector in direction_vectors
+            ]
+        )
+
+        results = span_local_rfs(direction_vectors, hybridize=hybridize)
+
+        assert len(results) == expected.shape[1]
+        for i, result in enumerate(results):
+            assert result.dtype == expected[:, i].dtype
+            # Identical, not only close
+            assert np.array_equal(result, expected[:, i])
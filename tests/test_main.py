@@ -0,0 +1,47 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(*arguments):
+    return subprocess.run(
+        [sys.executable, "-m", "magnopy", *arguments], capture_output=True, text=True
+    )
+
+
+@pytest.mark.parametrize("arguments", [["--version"], ["logo"], ["warranty"], []])
+def test_magnopy_command(arguments):
+    assert _run(*arguments).returncode == 0
+
+
+def test_magnopy_unknown_command():
+    result = _run("logo", "foo")
+
+    assert result.returncode == 2
+    assert "invalid choice: 'foo'" in result.stderr
+    assert "Traceback" not in result.stderr
+    # Nothing is done if one of the commands is wrong
+    assert result.stdout == ""
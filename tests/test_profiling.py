@@ -0,0 +1,119 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import json
+import os
+import pstats
+
+import numpy as np
+import pytest
+
+from magnopy.examples import cubic_ferro_nn
+from magnopy.profiling import Profiler
+from magnopy.scenarios import optimize_sd
+
+
+def test_stages():
+    profiler = Profiler()
+
+    with profiler.stage("First"):
+        np.linalg.eigh(np.eye(50))
+
+    profiler.start("Second")
+    # Starting new stage stops the current one
+    profiler.start("Third")
+    profiler.stop()
+    # Nothing to stop
+    profiler.stop()
+
+    assert [stage["name"] for stage in profiler.stages] == ["First", "Second", "Third"]
+    for stage in profiler.stages:
+        assert stage["wall_time"] >= 0
+        assert stage["cpu_time"] >= 0
+        assert stage["peak_traced"] is None
+
+    summary = profiler.summary().split("\n")
+    assert len(summary) == 5
+    assert summary[-1].startswith("Total")
+
+
+def test_stage_with_exception():
+    profiler = Profiler()
+
+    with pytest.raises(RuntimeError):
+        with profiler.stage("Failed"):
+            raise RuntimeError
+
+    assert [stage["name"] for stage in profiler.stages] == ["Failed"]
+
+
+def test_trace_memory():
+    profiler = Profiler(trace_memory=True)
+
+    with profiler.stage("Allocation"):
+        array = np.ones(10**6)
+    del array
+
+    assert profiler.stages[0]["peak_traced"] >= 8 * 10**6
+
+
+def test_save(tmp_path):
+    profiler = Profiler(use_cprofile=True)
+
+    with profiler.stage("Ground state"):
+        sum(range(1000))
+    with profiler.stage("K-points, k-path"):
+        sum(range(1000))
+
+    filenames = profiler.save(str(tmp_path))
+
+    assert [os.path.basename(filename) for filename in filenames] == [
+        "TIMINGS.json",
+        "PROFILE-GROUND-STATE.prof",
+        "PROFILE-K-POINTS-K-PATH.prof",
+    ]
+
+    with open(filenames[0]) as f:
+        timings = json.load(f)
+    assert timings["stages"] == json.loads(json.dumps(profiler.stages))
+
+    assert pstats.Stats(filenames[1]).total_calls > 0
+
+
+def test_optimize_sd_with_profiler(tmp_path):
+    profiler = Profiler()
+    with profiler.stage("Loading of the spin Hamiltonian"):
+        spinham = cubic_ferro_nn(S=1.5)
+
+    optimize_sd(
+        spinham=spinham, output_folder=str(tmp_path), no_html=True, profiler=profiler
+    )
+
+    with open(tmp_path / "TIMINGS.json") as f:
+        timings = json.load(f)
+
+    assert [stage["name"] for stage in timings["stages"]] == [
+        "Loading of the spin Hamiltonian",
+        "Initial guess",
+        "Optimization",
+        "Output of spin directions",
+    ]
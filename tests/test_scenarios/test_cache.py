@@ -0,0 +1,137 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import os
+
+import numpy as np
+import pytest
+
+from magnopy.examples import cubic_ferro_nn
+from magnopy.scenarios import solve_lswt
+from magnopy.scenarios._cache import _get_cache_key, _load_from_cache, _save_to_cache
+
+
+def test_cache_key():
+    key = _get_cache_key("lswt", "abc", [[0, 0, 1]], None, np.zeros((2, 3)))
+
+    assert key == _get_cache_key("lswt", "abc", [[0, 0, 1.0]], None, [[0, 0, 0]] * 2)
+    assert key != _get_cache_key(
+        "lswt", "abc", [[0, 0, 1]], [0, 0, 0], np.zeros((2, 3))
+    )
+    assert key != _get_cache_key("lswt", "abd", [[0, 0, 1]], None, np.zeros((2, 3)))
+    assert key != _get_cache_key("lswt", "abc", [[0, 0, 1]], None, np.zeros((3, 2)))
+
+
+def test_cache_eviction(tmp_path):
+    cache_dir = str(tmp_path)
+    array = np.zeros(1000)
+    keys = [_get_cache_key(str(i)) for i in range(5)]
+
+    # Files of the user are not entries of the cache
+    for name in ["LSWT.npz", "spinham.npz", "notes.txt"]:
+        with open(os.path.join(cache_dir, name), "wb") as f:
+            f.write(b"0" * 100000)
+
+    _save_to_cache(cache_dir=cache_dir, key=keys[0], max_size=2**30, data=array)
+    max_size = 4 * os.path.getsize(os.path.join(cache_dir, f"{keys[0]}.npz"))
+
+    for i in range(4):
+        _save_to_cache(cache_dir=cache_dir, key=keys[i], max_size=max_size, data=array)
+        # Make sure that modification times are different
+        os.utime(os.path.join(cache_dir, f"{keys[i]}.npz"), (i, i))
+
+    assert all(
+        os.path.isfile(os.path.join(cache_dir, f"{key}.npz")) for key in keys[:4]
+    )
+
+    # Entry 0 becomes the most recently used one
+    assert _load_from_cache(cache_dir=cache_dir, key=keys[0]) is not None
+
+    _save_to_cache(cache_dir=cache_dir, key=keys[4], max_size=max_size, data=array)
+
+    assert sorted(os.listdir(cache_dir)) == sorted(
+        [f"{keys[i]}.npz" for i in [0, 2, 3, 4]]
+        + ["LSWT.npz", "spinham.npz", "notes.txt"]
+    )
+    assert _load_from_cache(cache_dir=cache_dir, key=keys[1]) is None
+
+
+def test_cache_failed_write(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path)
+
+    def savez(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(np, "savez", savez)
+
+    with pytest.raises(OSError):
+        _save_to_cache(
+            cache_dir=cache_dir,
+            key=_get_cache_key("entry"),
+            max_size=2**30,
+            data=np.zeros(10),
+        )
+
+    # Temporary file is removed
+    assert os.listdir(cache_dir) == []
+
+
+def test_solve_lswt_with_cache(tmp_path, capsys):
+    spinham = cubic_ferro_nn(S=1.5)
+    cache_dir = str(tmp_path / "cache")
+    kwargs = dict(
+        spinham=spinham,
+        magnetic_field=[0, 0, 1],
+        no_html=True,
+        number_processors=1,
+        cache_dir=cache_dir,
+    )
+
+    solve_lswt(output_folder=str(tmp_path / "first"), **kwargs)
+    first = capsys.readouterr().out
+
+    assert "start to optimize" in first
+    assert "loaded from cache" not in first
+    assert len(os.listdir(cache_dir)) == 2
+
+    solve_lswt(output_folder=str(tmp_path / "second"), **kwargs)
+    second = capsys.readouterr().out
+
+    assert "start to optimize" not in second
+    assert "optimized ones are loaded from cache" in second
+    assert "calculations over k-points are loaded from cache" in second
+
+    for filename, skiprows in [
+        ("SPIN_VECTORS.txt", 0),
+        ("OMEGAS.txt", 1),
+        ("DELTAS.txt", 1),
+    ]:
+        assert np.allclose(
+            np.loadtxt(tmp_path / "first" / filename, skiprows=skiprows),
+            np.loadtxt(tmp_path / "second" / filename, skiprows=skiprows),
+        )
+
+    # Different field, nothing is reused
+    solve_lswt(
+        output_folder=str(tmp_path / "third"), **{**kwargs, "magnetic_field": [0, 0, 2]}
+    )
+    assert "loaded from cache" not in capsys.readouterr().out
@@ -0,0 +1,87 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import os
+
+import numpy as np
+import pytest
+
+from magnopy import LSWT, Convention, Energy, SpinHamiltonian
+from magnopy.scenarios import field_sweep
+
+
+def _get_spinham():
+    convention = Convention(
+        multiple_counting=True, spin_normalized=False, c1=1, c21=1, c22=1
+    )
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(names=["Fe"], positions=[[0, 0, 0]], spins=[1.5], g_factors=[2]),
+        convention=convention,
+    )
+
+    spinham.add_21(alpha=0, parameter=np.diag([0, 0, -0.1]))
+    for nu in [(1, 0, 0), (0, 1, 0), (0, 0, 1)]:
+        spinham.add_22(alpha=0, beta=0, nu=nu, parameter=-np.eye(3))
+
+    return spinham
+
+
+@pytest.mark.parametrize("number_processors", [1, 2])
+def test_field_sweep(tmp_path, number_processors):
+    spinham = _get_spinham()
+    fields = [[0, 0, -h_z] for h_z in [0, 1, 2, 4]]
+    kpoints = [[0, 0, 0], [0.1, 0.2, 0], [0.5, 0.5, 0.5]]
+
+    field_sweep(
+        spinham=spinham,
+        fields=fields,
+        kpoints=kpoints,
+        relative=True,
+        initial_guess=[[0.1, 0, 1]],
+        output_folder=tmp_path,
+        number_processors=number_processors,
+    )
+
+    # Hamiltonian is not modified
+    assert len(spinham.p1) == 0
+
+    data = np.load(os.path.join(tmp_path, "FIELD-SWEEP.npz"))
+
+    assert data["omegas"].shape == (4, 3, 1)
+    assert np.allclose(data["fields"], fields)
+    assert np.allclose(data["kpoints_relative"], kpoints)
+
+    energy = Energy(spinham=spinham)
+    for i, h in enumerate(fields):
+        sd = data["spin_directions"][i]
+
+        assert np.allclose(energy.torque(sd, h=h), 0, atol=1e-4)
+        assert np.allclose(data["E_0"][i], energy.E_0(sd, h=h))
+
+        lswt = LSWT(spinham=spinham, spin_directions=sd, h=h)
+        for j, k in enumerate(kpoints):
+            assert np.allclose(data["omegas"][i, j], lswt.omega(k, relative=True))
+
+    # Gap at Gamma point changes linearly with the field
+    gaps = data["omegas"][:, 0, 0]
+    assert np.allclose(np.diff(gaps) / np.diff([0, 1, 2, 4]), gaps[1] - gaps[0])
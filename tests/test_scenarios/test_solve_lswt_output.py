@@ -0,0 +1,149 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from magnopy import LSWT
+from magnopy.examples import cubic_ferro_nn
+from magnopy.scenarios import solve_lswt
+
+
+def test_solve_lswt_npz(tmp_path):
+    spinham = cubic_ferro_nn(S=1.5)
+    kwargs = dict(
+        spinham=spinham,
+        spin_directions=[[0, 0, 1]],
+        magnetic_field=[0, 0, 1],
+        no_html=True,
+        number_processors=1,
+    )
+
+    solve_lswt(output_folder=str(tmp_path / "txt"), **kwargs)
+    solve_lswt(output_folder=str(tmp_path / "npz"), output_format="npz", **kwargs)
+
+    for filename in ["K-POINTS.txt", "OMEGAS.txt", "DELTAS.txt"]:
+        assert os.path.isfile(tmp_path / "txt" / filename)
+        assert not os.path.isfile(tmp_path / "npz" / filename)
+
+    with np.load(tmp_path / "npz" / "LSWT.npz") as data:
+        k_points = np.loadtxt(tmp_path / "txt" / "K-POINTS.txt", skiprows=1)
+        assert np.allclose(data["kpoints"], k_points[:, :3])
+        assert np.allclose(data["kpoints_relative"], k_points[:, 3:6])
+        assert np.allclose(data["flat_indices"], k_points[:, 6])
+        assert np.allclose(
+            data["omegas"].real,
+            np.loadtxt(tmp_path / "txt" / "OMEGAS.txt", skiprows=1).reshape(-1, 1),
+        )
+        assert np.allclose(
+            data["deltas"].real, np.loadtxt(tmp_path / "txt" / "DELTAS.txt", skiprows=1)
+        )
+
+        lswt = LSWT(spinham=spinham, spin_directions=[[0, 0, 1]], h=[0, 0, 1])
+        assert data["G"].shape == (len(data["kpoints"]), 1, 2)
+        for i in [0, len(data["kpoints"]) // 2, -1]:
+            omegas, delta, G = lswt.diagonalize(data["kpoints"][i], relative=False)
+            assert np.allclose(data["omegas"][i], omegas)
+            assert np.allclose(data["G"][i], G)
+
+
+def test_solve_lswt_wrong_output_format(tmp_path):
+    with pytest.raises(ValueError):
+        solve_lswt(
+            spinham=cubic_ferro_nn(),
+            output_folder=str(tmp_path),
+            output_format="hdf5",
+        )
+
+
+def test_solve_lswt_no_plots(tmp_path, capsys, monkeypatch):
+    import magnopy.scenarios._solve_lswt as module
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Plot is produced")
+
+    monkeypatch.setattr(module, "plot_k_resolved", fail)
+
+    solve_lswt(
+        spinham=cubic_ferro_nn(S=1.5),
+        spin_directions=[[0, 0, 1]],
+        output_folder=str(tmp_path),
+        number_processors=1,
+        no_plots=True,
+    )
+    output = capsys.readouterr().out
+
+    assert not [
+        name for name in os.listdir(tmp_path) if name.endswith((".png", ".html"))
+    ]
+    assert os.path.isfile(tmp_path / "OMEGAS.txt")
+
+    assert " Timings " in output
+
+    with open(tmp_path / "TIMINGS.json") as f:
+        timings = json.load(f)
+
+    assert [stage["name"] for stage in timings["stages"]] == [
+        "Ground state",
+        "K-points and k-path",
+        "Preparation of LSWT",
+        "Calculations over k-points",
+        "Output of k-resolved data",
+    ]
+    for stage in timings["stages"]:
+        assert stage["name"] in output
+        assert stage["wall_time"] >= 0
+
+
+def test_solve_lswt_explicit_kpoints(tmp_path):
+    solve_lswt(
+        spinham=cubic_ferro_nn(S=1.5),
+        spin_directions=[[0, 0, 1]],
+        kpoints=[[0, 0, 0], [0.25, 0, 0], [0.5, 0, 0]],
+        relative=True,
+        output_folder=str(tmp_path),
+        number_processors=1,
+        no_html=True,
+    )
+
+    assert np.loadtxt(tmp_path / "OMEGAS.txt", skiprows=1).shape == (3,)
+
+
+def test_solve_lswt_adaptive(tmp_path):
+    solve_lswt(
+        spinham=cubic_ferro_nn(S=1.5),
+        spin_directions=[[0, 0, 1]],
+        magnetic_field=[0, 0, 1],
+        output_folder=str(tmp_path),
+        number_processors=1,
+        no_html=True,
+        adaptive_tolerance=1e-2,
+    )
+
+    k_points = np.loadtxt(tmp_path / "K-POINTS.txt", skiprows=1)
+    omegas = np.loadtxt(tmp_path / "OMEGAS.txt", skiprows=1)
+    assert len(k_points) == len(omegas)
+    assert np.all(np.diff(k_points[:, 6]) >= -1e-8)
+    assert np.allclose(k_points[:, :3], k_points[:, 3:6] @ np.eye(3) * 2 * np.pi)
@@ -26,7 +26,9 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 from wulfric.cell import sc_get_example_cell
 
-from magnopy import Convention, SpinHamiltonian
+from magnopy import LSWT, Convention, Energy, SpinHamiltonian
+from magnopy._spinham import _ewald
+from magnopy._spinham._ewald import _Ewald_dipole_dipole
 
 LATTICE_VARIATIONS = [
     "cub",
@@ -134,3 +136,257 @@ def test_E_cut(lattice_variation, E_cut):
     spinham.add_dipole_dipole(
         E_cut=E_cut, alphas=[i for i in range(len(spinham.atoms.names))]
     )
+
+
+@pytest.mark.parametrize("lattice_variation", ["cub", "hex", "mclc1"])
+@pytest.mark.parametrize("multiple_counting", [True, False])
+def test_parameters(lattice_variation, multiple_counting):
+    MU_0_MU_B = 1.256637061 * 9.2740100657**2 * 6.241509074 / 1000
+    R_cut = 5
+
+    cell = sc_get_example_cell(lattice_variation=lattice_variation)
+    atoms = dict(
+        names=["Cr1", "Cr2", "Cr3"],
+        spins=[3 / 2, 3 / 2, 1],
+        positions=[[0, 0, 0], [0.5, 0.5, 0.5], [0.1, 0.7, 0.3]],
+        g_factors=[2, 2.1, 1.9],
+    )
+    convention = Convention(
+        multiple_counting=multiple_counting, spin_normalized=False, c22=1
+    )
+
+    spinham = SpinHamiltonian(cell=cell, atoms=atoms, convention=convention)
+
+    spinham.add_dipole_dipole(R_cut=R_cut, alphas=[0, 1, 2])
+
+    n_pairs = 0
+    for alpha in range(3):
+        for beta in range(3):
+            for nu in np.ndindex(21, 21, 21):
+                nu = tuple(int(i) - 10 for i in nu)
+                vector = (
+                    np.array(nu)
+                    + np.array(atoms["positions"][beta])
+                    - np.array(atoms["positions"][alpha])
+                ) @ cell
+                distance = np.linalg.norm(vector)
+                if 0 < distance <= R_cut:
+                    n_pairs += 1
+
+    parameters = list(spinham.p22)
+
+    if multiple_counting:
+        assert len(parameters) == n_pairs
+    else:
+        assert 2 * len(parameters) == n_pairs
+
+    for alpha, beta, nu, parameter in parameters:
+        vector = (
+            np.array(nu)
+            + np.array(atoms["positions"][beta])
+            - np.array(atoms["positions"][alpha])
+        ) @ cell
+        distance = np.linalg.norm(vector)
+
+        reference = (
+            MU_0_MU_B
+            / 4
+            / np.pi
+            * atoms["g_factors"][alpha]
+            * atoms["g_factors"][beta]
+            / distance**3
+            * (np.eye(3) - 3 * np.outer(vector, vector) / distance**2)
+        )
+        if multiple_counting:
+            reference = reference / 2
+
+        assert distance <= R_cut
+        assert np.allclose(parameter, reference)
+
+
+def _get_ewald_spinham():
+    cell = np.array([[3.1, 0, 0], [0.5, 2.9, 0], [0.2, 0.3, 4.0]])
+    atoms = dict(
+        names=["Cr1", "Cr2"],
+        spins=[3 / 2, 5 / 2],
+        positions=[[0, 0, 0], [0.3, 0.6, 0.45]],
+        g_factors=[2, 2.1],
+    )
+    convention = Convention(multiple_counting=True, spin_normalized=False, c22=-1)
+
+    spinham = SpinHamiltonian(cell=cell, atoms=atoms, convention=convention)
+
+    spinham.add_22(alpha=0, beta=1, nu=(0, 0, 0), parameter=np.eye(3))
+    for alpha in [0, 1]:
+        for nu in [(1, 0, 0), (0, 1, 0), (0, 0, 1)]:
+            spinham.add_22(alpha=alpha, beta=alpha, nu=nu, parameter=np.eye(3))
+
+    return spinham
+
+
+def test_counts_after_dipole_dipole():
+    spinham = SpinHamiltonian(
+        cell=np.eye(3) * 3,
+        atoms=dict(
+            names=["Cr1", "Cr2", "Cr3"],
+            positions=[[0, 0, 0], [0.5, 0.5, 0.5], [0.5, 0, 0]],
+            spins=[1, 1, 1],
+            g_factors=[2, 2, 2],
+        ),
+        convention=Convention(multiple_counting=True, spin_normalized=False, c22=1),
+    )
+    spinham.add_22(alpha=0, beta=1, nu=(0, 0, 0), parameter=np.eye(3))
+    assert spinham.map_to_all == [0, 1]
+
+    # Some bonds exist already, third atom becomes magnetic
+    spinham.add_dipole_dipole(R_cut=4, alphas=[0, 1, 2])
+    assert spinham._atom_counts is not None
+    assert spinham.map_to_all == [0, 1, 2]
+
+    # Incrementally updated internals agree with the ones computed from scratch
+    counts = spinham._atom_counts.copy()
+    spinham._reset_internals()
+    assert spinham.map_to_all == [0, 1, 2]
+    assert (spinham._atom_counts == counts).all()
+
+
+def test_ewald_raises():
+    spinham = _get_ewald_spinham()
+
+    with pytest.raises(ValueError):
+        spinham.add_dipole_dipole_ewald(tolerance=0)
+
+    with pytest.raises(ValueError):
+        spinham.add_dipole_dipole_ewald(tolerance=1)
+
+
+@pytest.mark.parametrize("k", [(0, 0, 0), (0.1, 0.2, -0.3), (0.5, 0, 0), (1e-3, 0, 0)])
+def test_ewald_does_not_depend_on_eta(k):
+    cell = np.array([[3.1, 0, 0], [0.5, 2.9, 0], [0.2, 0.3, 4.0]])
+    positions = [[0, 0, 0], [0.3, 0.6, 0.45]]
+    g_factors = [2, 2.1]
+
+    ewald = _Ewald_dipole_dipole(
+        cell=cell, positions=positions, g_factors=g_factors, tolerance=1e-10
+    )
+    other_ewald = _Ewald_dipole_dipole(
+        cell=cell,
+        positions=positions,
+        g_factors=g_factors,
+        tolerance=1e-10,
+        eta=0.6 * ewald.eta,
+    )
+
+    assert np.allclose(ewald(k, relative=True), other_ewald(k, relative=True))
+    assert np.allclose(
+        ewald(k, relative=True),
+        np.conjugate(ewald(k, relative=True).transpose(1, 0, 3, 2)),
+    )
+
+
+def test_ewald_without_g_factors():
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(names=["Cr"], spins=[1], positions=[[0, 0, 0]]),
+        convention=Convention(multiple_counting=True, spin_normalized=False, c21=1),
+    )
+    spinham.add_21(alpha=0, parameter=np.eye(3))
+    spinham.add_dipole_dipole_ewald()
+
+    with pytest.raises(ValueError):
+        Energy(spinham=spinham)
+
+    with pytest.raises(ValueError):
+        LSWT(spinham=spinham, spin_directions=[[0, 0, 1]])
+
+
+def test_ewald_in_chunks(monkeypatch):
+    rng = np.random.default_rng(3)
+    kwargs = dict(
+        cell=[[3.1, 0, 0], [0.5, 2.9, 0], [0.2, 0.3, 4.0]],
+        positions=rng.random(size=(5, 3)),
+        g_factors=rng.random(size=5) + 1.5,
+        tolerance=1e-8,
+    )
+
+    ewald = _Ewald_dipole_dipole(**kwargs)
+    assert ewald.real_space is not None
+
+    # One first atom per chunk and nothing is kept between the calls
+    monkeypatch.setattr(_ewald, "_CHUNK_SIZE", 1)
+    monkeypatch.setattr(_ewald, "_CACHE_SIZE", 0)
+    chunked_ewald = _Ewald_dipole_dipole(**kwargs)
+    assert chunked_ewald.chunk == 1
+    assert chunked_ewald.real_space is None
+
+    for k in [[0, 0, 0], [0.1, -0.2, 0.3], [0.5, 0.5, 0]]:
+        assert np.allclose(
+            ewald(k, relative=True), chunked_ewald(k, relative=True), atol=1e-12
+        )
+
+
+def test_ewald_cubic_lattice():
+    # Sum over the spheres vanishes for the cubic lattice
+    ewald = _Ewald_dipole_dipole(
+        cell=np.eye(3), positions=[[0, 0, 0]], g_factors=[2], tolerance=1e-10
+    )
+
+    assert np.allclose(ewald([0, 0, 0]), 0)
+
+
+def test_ewald_against_real_space():
+    spinham = _get_ewald_spinham()
+    spinham_real_space = spinham.copy()
+
+    spinham.add_dipole_dipole_ewald(tolerance=1e-10)
+    spinham_real_space.add_dipole_dipole(R_cut=30)
+
+    spin_directions = np.random.default_rng(0).normal(size=(2, 3))
+
+    energy = Energy(spinham=spinham)
+    energy_real_space = Energy(spinham=spinham_real_space)
+
+    assert np.allclose(
+        energy.E_0(spin_directions), energy_real_space.E_0(spin_directions), rtol=1e-4
+    )
+    assert np.allclose(
+        energy.gradient(spin_directions),
+        energy_real_space.gradient(spin_directions),
+        atol=1e-3,
+    )
+
+    spin_directions = [[0, 0, 1], [0, 0, 1]]
+    lswt = LSWT(spinham=spinham, spin_directions=spin_directions)
+    lswt_real_space = LSWT(spinham=spinham_real_space, spin_directions=spin_directions)
+
+    for k in [[0.1, 0.2, 0.3], [0.5, 0, 0], [0, 0.25, 0.1]]:
+        assert np.allclose(
+            lswt.omega(k, relative=True),
+            lswt_real_space.omega(k, relative=True),
+            rtol=1e-4,
+        )
+
+
+def test_ewald_arithmetic():
+    spinham = _get_ewald_spinham()
+    spinham.add_dipole_dipole_ewald(tolerance=1e-6)
+
+    spin_directions = np.random.default_rng(0).normal(size=(2, 3))
+
+    energy = Energy(spinham=spinham).E_0(spin_directions)
+
+    assert np.allclose(Energy(spinham=2 * spinham).E_0(spin_directions), 2 * energy)
+    assert np.allclose(
+        Energy(spinham=spinham + spinham).E_0(spin_directions), 2 * energy
+    )
+    assert np.allclose(
+        Energy(spinham=spinham.view(spinham.convention.get_modified(c22=1))).E_0(
+            spin_directions
+        ),
+        energy,
+    )
+
+    spinham.remove_dipole_dipole_ewald()
+
+    assert spinham.dipole_dipole_ewald is None
+    assert not np.allclose(Energy(spinham=spinham).E_0(spin_directions), energy)
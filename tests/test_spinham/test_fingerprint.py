@@ -0,0 +1,133 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+
+from magnopy import Convention, SpinHamiltonian
+from magnopy.io import load_spinham, save_spinham
+
+
+def _get_spinham(reverse=False):
+    convention = Convention(
+        multiple_counting=True, spin_normalized=False, c1=1, c21=1, c22=1
+    )
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(
+            names=["Fe1", "Fe2"],
+            positions=[[0, 0, 0], [0.5, 0.5, 0.5]],
+            spins=[2.5, 1.5],
+            g_factors=[2, 2],
+        ),
+        convention=convention,
+    )
+
+    bonds = [
+        (0, 1, (0, 0, 0), np.eye(3)),
+        (0, 0, (1, 0, 0), 2 * np.eye(3)),
+        (1, 1, (0, 1, 0), -np.eye(3)),
+    ]
+    if reverse:
+        bonds = bonds[::-1]
+
+    for alpha, beta, nu, parameter in bonds:
+        spinham.add_22(alpha=alpha, beta=beta, nu=nu, parameter=parameter)
+    spinham.add_21(alpha=0, parameter=np.diag([0, 0, -0.1]))
+
+    return spinham
+
+
+def test_fingerprint_is_stable():
+    spinham = _get_spinham()
+    fingerprint = spinham.fingerprint()
+
+    assert len(fingerprint) == 64
+    assert spinham.fingerprint() == fingerprint
+    assert _get_spinham(reverse=True).fingerprint() == fingerprint
+    assert spinham.copy().fingerprint() == fingerprint
+
+    # Double of the bond is the same bond
+    other = _get_spinham()
+    other.add_22(alpha=1, beta=0, nu=(0, 0, 0), parameter=np.eye(3), replace=True)
+    assert other.fingerprint() == fingerprint
+
+
+def test_fingerprint_of_modified_copy():
+    spinham = _get_spinham()
+    fingerprint = spinham.fingerprint()
+
+    copied = spinham.copy()
+    assert copied._fingerprint is None
+
+    # Parameter is modified in place, no method of the Hamiltonian is called
+    copied._22[0][-1][0, 0] = 42
+    assert copied.fingerprint() != fingerprint
+    assert spinham.fingerprint() == fingerprint
+
+    copied = spinham.copy()
+    copied.add_21(alpha=1, parameter=np.eye(3))
+    assert copied.fingerprint() != fingerprint
+
+
+def test_fingerprint_of_loaded(tmp_path):
+    spinham = _get_spinham()
+    spinham.add_dipole_dipole_ewald()
+
+    filename = str(tmp_path / "spinham.npz")
+    save_spinham(spinham, filename)
+
+    assert load_spinham(filename).fingerprint() == spinham.fingerprint()
+
+
+def test_fingerprint_changes_on_modification():
+    spinham = _get_spinham()
+    fingerprints = {spinham.fingerprint()}
+
+    def check():
+        fingerprint = spinham.fingerprint()
+        assert fingerprint not in fingerprints
+        fingerprints.add(fingerprint)
+
+    spinham.add_22(
+        alpha=0, beta=1, nu=(0, 0, 0), parameter=np.eye(3) * 1.001, replace=True
+    )
+    check()
+
+    spinham.remove_22(alpha=1, beta=1, nu=(0, 1, 0))
+    check()
+
+    spinham.add_magnetic_field(h=[0, 0, 1])
+    check()
+
+    fingerprint = spinham.fingerprint()
+    spinham.add_dipole_dipole_ewald()
+    check()
+
+    # Same content as before
+    spinham.remove_dipole_dipole_ewald()
+    assert spinham.fingerprint() == fingerprint
+
+    spinham.convention = spinham.convention.get_modified(c22=-1)
+    check()
+
+    check_view = spinham.view(spinham.convention.get_modified(multiple_counting=False))
+    assert check_view.fingerprint() not in fingerprints
@@ -507,3 +507,60 @@ def test_make_supercell(parameter1, i, j, k):
     new_spinham = make_supercell(spinham=spinham, supercell=(i, j, k))
 
     assert len(new_spinham.p44) == i * j * k * len(spinham.p44)
+
+
+@pytest.mark.parametrize(
+    "alpha, beta, gamma, epsilon, nu, _lambda, rho",
+    [
+        (0, 1, 2, 3, (0, 0, 0), (0, 0, 0), (0, 0, 0)),
+        (3, 2, 1, 0, (0, 0, 0), (0, 0, 0), (0, 0, 0)),
+        (2, 0, 3, 1, (1, 0, 0), (0, -1, 0), (0, 0, 1)),
+        (1, 1, 0, 1, (1, 0, 0), (0, 1, 0), (1, 1, -1)),
+    ],
+)
+def test_p44_describes_same_term(alpha, beta, gamma, epsilon, nu, _lambda, rho):
+    rng = np.random.default_rng(0)
+
+    atoms = dict(
+        names=["Cr1", "Cr2", "Cr3", "Cr4"],
+        spins=[1, 1, 1, 1],
+        positions=[[0, 0, 0], [0.2, 0.2, 0.2], [0.5, 0.5, 0.5], [0.75, 0.75, 0.75]],
+        g_factors=[2, 2, 2, 2],
+    )
+    spinham = SpinHamiltonian(cell=np.eye(3), atoms=atoms, convention=CONVENTION)
+
+    # Random spin vector for every atom in the range of unit cells
+    spins = rng.normal(size=(4, 7, 7, 7, 3))
+
+    def value(a, b, c, d, n, la, r, parameter, origin=(0, 0, 0)):
+        return np.einsum(
+            "ijuv,i,j,u,v",
+            parameter,
+            *[
+                spins[(atom, *np.add(origin, cell))]
+                for atom, cell in zip((a, b, c, d), ((0, 0, 0), n, la, r))
+            ],
+        )
+
+    parameter = rng.normal(size=(3, 3, 3, 3))
+    spinham.add_44(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter=parameter)
+
+    reference = value(alpha, beta, gamma, epsilon, nu, _lambda, rho, parameter)
+
+    # Every version of the term is placed so, that it acts on the same atoms
+    for a, b, c, d, n, la, r, p in spinham.p44:
+        for origin in [(0, 0, 0), nu, _lambda, rho]:
+            sites = {
+                (atom, tuple(np.add(origin, cell)))
+                for atom, cell in zip((a, b, c, d), ((0, 0, 0), n, la, r))
+            }
+            if sites == {
+                (atom, tuple(cell))
+                for atom, cell in zip(
+                    (alpha, beta, gamma, epsilon), ((0, 0, 0), nu, _lambda, rho)
+                )
+            }:
+                assert np.isclose(value(a, b, c, d, n, la, r, p, origin), reference)
+                break
+        else:
+            assert False
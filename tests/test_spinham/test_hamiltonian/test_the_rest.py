@@ -21,6 +21,7 @@
 
 
 import numpy as np
+import pytest
 from hypothesis import strategies as st
 from hypothesis.extra.numpy import arrays as harrays
 
@@ -73,6 +74,46 @@ def test_multiple_counting():
     assert len(spinham.p21) == 1
 
 
+def test_multiple_counting_cache():
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms={"names": ["Cr1", "Cr2"], "spins": [1, 2]},
+        convention=Convention(multiple_counting=True),
+    )
+
+    spinham.add_22(0, 1, (1, 0, 0), np.arange(9).reshape((3, 3)))
+    spinham.add_32(0, 1, (1, 0, 0), np.ones((3, 3, 3)))
+
+    params = list(spinham.p22)
+    assert params[1][:3] == [1, 0, (-1, 0, 0)]
+    assert (params[1][3] == np.arange(9).reshape((3, 3)).T).all()
+    assert params[1][3].flags["C_CONTIGUOUS"]
+
+    # Doubles are synthesized only once
+    assert list(spinham.p22)[1][3] is params[1][3]
+
+    # Entries are copies and parameters are read-only, the cache can not be spoiled
+    params[1][2] = (5, 5, 5)
+    assert list(spinham.p22)[1][2] == (-1, 0, 0)
+    with pytest.raises(ValueError):
+        params[1][3][0, 0] = 42
+    assert list(spinham.p22)[1][3][0, 0] == 0
+
+    # Primary parameters stay writable
+    assert spinham._22[0][3].flags["WRITEABLE"]
+
+    # And re-synthesized after the modification
+    spinham.add_22(0, 1, (1, 0, 0), np.eye(3), replace=True)
+    assert (list(spinham.p22)[1][3] == np.eye(3)).all()
+
+    # Doubles of (three spins & two sites) depend on spins
+    assert np.allclose(list(spinham.p32)[1][3], 0.5)
+    # Direct change of the atoms is not tracked, internals have to be reset
+    spinham.atoms.spins[1] = 4
+    spinham._reset_internals()
+    assert np.allclose(list(spinham.p32)[1][3], 0.25)
+
+
 def test_magnetic_atoms():
     spinham = SpinHamiltonian(
         cell=np.eye(3),
@@ -104,6 +145,44 @@ def test_magnetic_atoms():
     assert spinham.magnetic_atoms.names[1] == "Cr2"
 
 
+def test_magnetic_atoms_after_removal():
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms={"names": ["Cr1", "Cr2", "Cr3"]},
+        convention=Convention(multiple_counting=True),
+    )
+
+    spinham.add_21(0, np.eye(3))
+    spinham.add_22(0, 2, (0, 0, 0), np.eye(3))
+    spinham.add_22(2, 0, (1, 0, 0), np.eye(3))
+    assert spinham.map_to_all == [0, 2]
+    assert spinham.map_to_magnetic == [0, None, 1]
+
+    spinham.add_22(0, 2, (0, 0, 0), 2 * np.eye(3), replace=True)
+    assert spinham.map_to_all == [0, 2]
+
+    spinham.add_1(1, [0, 0, 1])
+    assert spinham.map_to_all == [0, 1, 2]
+    assert spinham.magnetic_atoms.names == ["Cr1", "Cr2", "Cr3"]
+
+    spinham.remove_22(2, 0, (0, 0, 0))
+    assert spinham.map_to_all == [0, 1, 2]
+
+    spinham.remove_22(2, 0, (1, 0, 0))
+    assert spinham.map_to_all == [0, 1]
+    assert spinham.map_to_magnetic == [0, 1, None]
+
+    spinham.remove_21(0)
+    assert spinham.M == 1
+    assert spinham.magnetic_atoms.names == ["Cr2"]
+
+    # Incrementally updated internals agree with the ones computed from scratch
+    counts = spinham._atom_counts.copy()
+    spinham._reset_internals()
+    assert spinham.map_to_all == [1]
+    assert (spinham._atom_counts == counts).all()
+
+
 def test_convention_manipulation():
     atoms = dict(names=["Cr"], postions=[[0, 0, 0]], spins=[3 / 2])
 
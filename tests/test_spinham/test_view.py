@@ -0,0 +1,183 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import numpy as np
+
+from magnopy import Convention, Energy, LSWT, SpinHamiltonian
+
+
+def _get_spinham():
+    convention = Convention(spin_normalized=True, multiple_counting=False, c21=1, c22=1)
+
+    spinham = SpinHamiltonian(
+        cell=np.eye(3),
+        atoms=dict(
+            names=["Fe1", "Fe2"],
+            spins=[5 / 2, 3 / 2],
+            positions=[[0, 0, 0], [0.5, 0.5, 0.5]],
+            g_factors=[2, 2],
+        ),
+        convention=convention,
+    )
+
+    spinham.add_21(alpha=0, parameter=np.diag([0.0, 0.0, -0.1]))
+    spinham.add_22(alpha=0, beta=0, nu=(1, 0, 0), parameter=np.eye(3))
+    spinham.add_22(alpha=0, beta=1, nu=(0, 0, 0), parameter=2 * np.eye(3))
+
+    return spinham
+
+
+def test_view_same_convention():
+    spinham = _get_spinham()
+
+    assert spinham.view(convention=spinham.convention) is spinham
+
+
+def test_view_does_not_mutate():
+    spinham = _get_spinham()
+    original_convention = spinham.convention
+    original_p22 = [
+        (alpha, beta, nu, np.array(parameter))
+        for alpha, beta, nu, parameter in spinham.p22
+    ]
+
+    new_convention = Convention.get_predefined(name="Vampire")
+    view = spinham.view(convention=new_convention)
+
+    assert spinham.convention == original_convention
+    assert view.convention == new_convention
+
+    for (alpha, beta, nu, parameter), (o_alpha, o_beta, o_nu, o_parameter) in zip(
+        spinham.p22, original_p22
+    ):
+        assert (alpha, beta, nu) == (o_alpha, o_beta, o_nu)
+        assert np.allclose(parameter, o_parameter)
+
+
+def test_view_matches_convention_change():
+    spinham = _get_spinham()
+
+    new_convention = spinham.convention.get_modified(
+        spin_normalized=False, multiple_counting=True, c22=-0.5
+    )
+    view = spinham.view(convention=new_convention)
+
+    reference = spinham.copy()
+    reference.convention = new_convention
+
+    assert len(view.p22) == len(reference.p22)
+    for (alpha, beta, nu, parameter), (r_alpha, r_beta, r_nu, r_parameter) in zip(
+        view.p22, reference.p22
+    ):
+        assert (alpha, beta, nu) == (r_alpha, r_beta, r_nu)
+        assert np.allclose(parameter, r_parameter)
+
+    for (alpha, parameter), (r_alpha, r_parameter) in zip(view.p21, reference.p21):
+        assert alpha == r_alpha
+        assert np.allclose(parameter, r_parameter)
+
+
+def test_view_is_cached_and_invalidated():
+    spinham = _get_spinham()
+    new_convention = Convention.get_predefined(name="Vampire")
+
+    view = spinham.view(convention=new_convention)
+    assert spinham.view(convention=new_convention) is view
+
+    spinham.add_22(alpha=1, beta=1, nu=(1, 0, 0), parameter=np.eye(3))
+
+    new_view = spinham.view(convention=new_convention)
+    assert new_view is not view
+    assert len(new_view.p22) == len(view.p22) + 2
+
+
+def test_copy_starts_with_empty_caches():
+    spinham = _get_spinham()
+    spinham.convention = spinham.convention.get_modified(multiple_counting=True)
+
+    view = spinham.view(convention=Convention.get_predefined(name="Vampire"))
+    list(spinham.p22)
+    assert spinham._views and spinham._expanded
+
+    copied = spinham.copy()
+    assert copied._views == {} and copied._expanded == {}
+
+    # Caches of the original are intact
+    assert spinham.view(convention=Convention.get_predefined(name="Vampire")) is view
+
+    # Copy rebuilds the same content on demand
+    assert len(copied.p22) == len(spinham.p22)
+    for entry, copied_entry in zip(spinham.p22, copied.p22):
+        assert entry[:-1] == copied_entry[:-1]
+        assert np.allclose(entry[-1], copied_entry[-1])
+
+
+def test_energy_and_lswt_keep_convention():
+    spinham = _get_spinham()
+    original_convention = spinham.convention
+
+    energy = Energy(spinham=spinham)
+    energy.E_0(spin_directions=[[0, 0, 1], [0, 0, 1]])
+    assert spinham.convention == original_convention
+
+    LSWT(spinham=spinham, spin_directions=[[0, 0, 1], [0, 0, 1]])
+    assert spinham.convention == original_convention
+
+
+def test_views_from_several_threads():
+    n_threads = 8
+    new_convention = Convention.get_predefined(name="Vampire")
+    reference = LSWT(spinham=_get_spinham(), spin_directions=[[0, 0, 1], [0, 0, 1]])
+
+    for _ in range(20):
+        spinham = _get_spinham()
+        barrier = Barrier(n_threads)
+
+        def build(i):
+            barrier.wait()
+            if i % 3 == 0:
+                return spinham.view(convention=new_convention)
+            if i % 3 == 1:
+                return Energy(spinham=spinham)
+            return LSWT(spinham=spinham, spin_directions=[[0, 0, 1], [0, 0, 1]])
+
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            results = list(executor.map(build, range(n_threads)))
+
+        views = [result for result in results if isinstance(result, SpinHamiltonian)]
+        assert all(view is views[0] for view in views)
+        assert views[0].M == 2
+        assert views[0].map_to_magnetic == [0, 1]
+
+        for result in results:
+            if isinstance(result, LSWT):
+                assert result.M == 2
+                assert np.allclose(result.A1, reference.A1)
+                assert set(result.A2) == set(reference.A2)
+                for nu in reference.A2:
+                    assert np.allclose(result.A2[nu], reference.A2[nu])
+                    assert np.allclose(result.B2[nu], reference.B2[nu])
+
+        assert spinham.convention == _get_spinham().convention
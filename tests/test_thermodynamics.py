@@ -0,0 +1,187 @@
+# ================================== LICENSE ===================================
+# Magnopy - Python package for magnons.
+# Copyright (C) 2023-2025 Magnopy Team
+#
+# e-mail: anry@uv.es, web: magnopy.org
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+
+
+import numpy as np
+import pytest
+
+from magnopy import LSWT, KGrid
+from magnopy._constants._internal_units import K_BOLTZMANN
+from magnopy.examples import cubic_ferro_nn
+from magnopy.thermodynamics import magnon_dos, thermodynamics
+
+SPIN_DIRECTIONS = [[0, 0, 1]]
+
+
+@pytest.fixture(scope="module")
+def lswt():
+    return LSWT(spinham=cubic_ferro_nn(), spin_directions=SPIN_DIRECTIONS)
+
+
+@pytest.fixture(scope="module")
+def kgrid():
+    return KGrid.from_spinham(
+        spinham=cubic_ferro_nn(), mesh=(8, 8, 8), spin_directions=SPIN_DIRECTIONS
+    )
+
+
+@pytest.mark.parametrize("method", ["gaussian", "tetrahedron", "Tetrahedron"])
+def test_dos_moments(lswt, kgrid, method):
+    energies = np.linspace(-2, 15, 341)
+
+    dos = magnon_dos(
+        lswt=lswt,
+        kgrid=kgrid,
+        energies=energies,
+        method=method,
+        chunk_size=13,
+        number_processors=1,
+    )
+
+    assert np.all(dos >= 0)
+    # One mode, mean energy of the cubic ferromagnet is 6 |J| S^2
+    assert np.isclose(np.trapezoid(dos, energies), 1, atol=1e-3)
+    assert np.isclose(np.trapezoid(dos * energies, energies), 3, atol=1e-2)
+
+
+def test_dos_symmetry_reduction(lswt, kgrid):
+    energies = np.linspace(-2, 15, 171)
+    full = KGrid(cell=kgrid.cell, mesh=kgrid.mesh)
+
+    for method in ["gaussian", "tetrahedron"]:
+        assert np.allclose(
+            magnon_dos(lswt, kgrid, energies, method=method, number_processors=1),
+            magnon_dos(lswt, full, energies, method=method, number_processors=1),
+        )
+
+
+def test_dos_gaussian_is_histogram(lswt, kgrid):
+    energies = np.linspace(0, 12, 49)
+
+    dos = magnon_dos(
+        lswt=lswt, kgrid=kgrid, energies=energies, sigma=1e-3, number_processors=1
+    )
+
+    omegas = np.array([lswt.omega(k=k).real for k in kgrid.points()])
+    step = energies[1] - energies[0]
+    histogram, _ = np.histogram(
+        omegas, bins=np.append(energies - step / 2, energies[-1] + step / 2)
+    )
+
+    assert np.allclose(dos * step, histogram / kgrid.N)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 50, 1000])
+def test_thermodynamics(lswt, kgrid, chunk_size):
+    temperatures = np.array([0, 1, 10, 50, 100])
+
+    results = thermodynamics(
+        lswt=lswt,
+        kgrid=kgrid,
+        temperatures=temperatures,
+        chunk_size=chunk_size,
+        number_processors=1,
+    )
+
+    # Direct sums over the full grid
+    omegas = np.array([lswt.omega(k=k).real for k in kgrid.points()]).flatten()
+    omegas = omegas[omegas >= 1e-6]
+    kT = K_BOLTZMANN * temperatures[1:]
+    n = 1 / np.expm1(omegas[:, np.newaxis] / kT)
+
+    assert np.allclose(results["temperatures"], temperatures)
+    for key in ["magnon_number", "internal_energy", "specific_heat", "entropy"]:
+        assert results[key][0] == 0
+    assert np.allclose(results["magnon_number"][1:], np.sum(n, axis=0) / kgrid.N)
+    assert np.allclose(
+        results["internal_energy"][1:],
+        np.sum(omegas[:, np.newaxis] * n, axis=0) / kgrid.N,
+    )
+    assert np.allclose(
+        results["free_energy"][1:],
+        kT * np.sum(np.log1p(-np.exp(-omegas[:, np.newaxis] / kT)), axis=0) / kgrid.N,
+    )
+    # Ferromagnet has no zero-point fluctuations
+    assert np.isclose(results["quantum_correction"], lswt.E_2)
+
+
+def test_thermodynamic_derivatives(lswt, kgrid):
+    T = 40
+    dT = 1e-3
+
+    results = thermodynamics(
+        lswt=lswt, kgrid=kgrid, temperatures=[T - dT, T, T + dT], number_processors=1
+    )
+
+    U = results["internal_energy"]
+    F = results["free_energy"]
+
+    assert np.isclose(results["specific_heat"][1], (U[2] - U[0]) / (2 * dT))
+    assert np.isclose(results["entropy"][1], -(F[2] - F[0]) / (2 * dT))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(energies=[0, 1, 3]),
+        dict(energies=[3, 2, 1]),
+        dict(energies=[0, 1, 2], method="histogram"),
+        dict(energies=[0, 1, 2], chunk_size=0),
+    ],
+)
+def test_dos_errors(lswt, kgrid, kwargs):
+    with pytest.raises(ValueError):
+        magnon_dos(lswt=lswt, kgrid=kgrid, number_processors=1, **kwargs)
+
+
+def test_thermodynamics_errors(lswt, kgrid):
+    with pytest.raises(ValueError):
+        thermodynamics(lswt=lswt, kgrid=kgrid, temperatures=[-1], number_processors=1)
+
+
+def test_thermodynamics_parallel(lswt, kgrid, monkeypatch):
+    from magnopy import thermodynamics as module
+
+    pools = []
+    pool_class = module.Pool
+
+    def counting_pool(*args, **kwargs):
+        pools.append(pool_class(*args, **kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(module, "Pool", counting_pool)
+
+    temperatures = [1, 10, 100]
+    serial = thermodynamics(
+        lswt=lswt, kgrid=kgrid, temperatures=temperatures, number_processors=1
+    )
+    parallel = thermodynamics(
+        lswt=lswt,
+        kgrid=kgrid,
+        temperatures=temperatures,
+        chunk_size=7,
+        number_processors=2,
+    )
+
+    # Workers are started once for the whole grid
+    assert len(pools) == 1
+    for key in serial:
+        assert np.allclose(serial[key], parallel[key])